@@ -0,0 +1,18 @@
+"""geography index on incident centroids for bounded clustering lookups"""
+
+from alembic import op
+
+revision = "20261017_01"
+down_revision = "20260901_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IncidentService._find_matching_incident filters with ST_DWithin(geography(centroid), ...),
+    # which can only use an index built on the same expression.
+    op.execute("CREATE INDEX ix_incidents_centroid_geography ON incidents USING gist (geography(centroid))")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_incidents_centroid_geography")
@@ -0,0 +1,16 @@
+"""index incidents.updated_at for incremental active-incident refreshes"""
+
+from alembic import op
+
+revision = "20261017_02"
+down_revision = "20261017_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_incidents_updated_at", "incidents", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_incidents_updated_at", table_name="incidents")
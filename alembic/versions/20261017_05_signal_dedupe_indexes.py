@@ -0,0 +1,34 @@
+"""unique source key and url index on signals for set-based dedupe"""
+
+from alembic import op
+
+revision = "20261017_05"
+down_revision = "20261017_04"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Concurrent ingests could previously insert the same item twice; keep the earliest
+    # copy so the unique index can be built. Links to removed copies cascade away.
+    op.execute(
+        """
+        DELETE FROM signals AS later
+        USING signals AS earlier
+        WHERE later.source_type = earlier.source_type
+          AND later.source_id = earlier.source_id
+          AND (later.created_at, later.id) > (earlier.created_at, earlier.id)
+        """
+    )
+    op.create_index(
+        "uq_signals_source_type_source_id",
+        "signals",
+        ["source_type", "source_id"],
+        unique=True,
+    )
+    op.create_index("ix_signals_url", "signals", ["url"], postgresql_using="hash")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_signals_url", table_name="signals")
+    op.drop_index("uq_signals_source_type_source_id", table_name="signals")
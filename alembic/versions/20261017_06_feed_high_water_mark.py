@@ -0,0 +1,17 @@
+"""newest entry key per feed so polls can stop at already-ingested entries"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_06"
+down_revision = "20261017_05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("feed_state", sa.Column("high_water_mark", sa.String(length=1000), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("feed_state", "high_water_mark")
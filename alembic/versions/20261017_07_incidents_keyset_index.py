@@ -0,0 +1,16 @@
+"""composite (last_seen, id) index for keyset pagination of incidents"""
+
+from alembic import op
+
+revision = "20261017_07"
+down_revision = "20261017_06"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_incidents_last_seen_id", "incidents", ["last_seen", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_incidents_last_seen_id", table_name="incidents")
@@ -0,0 +1,16 @@
+"""index incident_signals.signal_id for per-signal membership lookups"""
+
+from alembic import op
+
+revision = "20261017_08"
+down_revision = "20261017_07"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_incident_signals_signal_id", "incident_signals", ["signal_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_incident_signals_signal_id", table_name="incident_signals")
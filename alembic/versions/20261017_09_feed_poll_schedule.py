@@ -0,0 +1,27 @@
+"""per-feed adaptive polling state"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_09"
+down_revision = "20261017_08"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("feed_state", sa.Column("next_poll_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("feed_state", sa.Column("poll_interval_seconds", sa.Float(), nullable=True))
+    op.add_column("feed_state", sa.Column("avg_new_items", sa.Float(), nullable=False, server_default="0"))
+    op.add_column("feed_state", sa.Column("error_streak", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("feed_state", sa.Column("burst_until", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_feed_state_next_poll_at", "feed_state", ["next_poll_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_feed_state_next_poll_at", table_name="feed_state")
+    op.drop_column("feed_state", "burst_until")
+    op.drop_column("feed_state", "error_streak")
+    op.drop_column("feed_state", "avg_new_items")
+    op.drop_column("feed_state", "poll_interval_seconds")
+    op.drop_column("feed_state", "next_poll_at")
@@ -0,0 +1,46 @@
+"""running signal count, coordinate sums and extent on incidents, backfilled from signals"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_10"
+down_revision = "20261017_09"
+branch_labels = None
+depends_on = None
+
+BACKFILL = """
+UPDATE incidents AS i
+SET signal_count = s.signal_count,
+    latitude_sum = s.latitude_sum,
+    longitude_sum = s.longitude_sum,
+    min_latitude = s.min_latitude,
+    min_longitude = s.min_longitude,
+    max_latitude = s.max_latitude,
+    max_longitude = s.max_longitude,
+    centroid = ST_SetSRID(ST_MakePoint(s.longitude_sum / s.signal_count, s.latitude_sum / s.signal_count), 4326)
+FROM (
+    SELECT l.incident_id, count(*) AS signal_count,
+           sum(g.latitude) AS latitude_sum, sum(g.longitude) AS longitude_sum,
+           min(g.latitude) AS min_latitude, min(g.longitude) AS min_longitude,
+           max(g.latitude) AS max_latitude, max(g.longitude) AS max_longitude
+    FROM incident_signals AS l JOIN signals AS g ON g.id = l.signal_id
+    GROUP BY l.incident_id
+) AS s
+WHERE i.id = s.incident_id
+"""
+
+
+def upgrade() -> None:
+    op.add_column("incidents", sa.Column("signal_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("incidents", sa.Column("latitude_sum", sa.Float(), nullable=False, server_default="0"))
+    op.add_column("incidents", sa.Column("longitude_sum", sa.Float(), nullable=False, server_default="0"))
+    op.add_column("incidents", sa.Column("min_latitude", sa.Float(), nullable=True))
+    op.add_column("incidents", sa.Column("min_longitude", sa.Float(), nullable=True))
+    op.add_column("incidents", sa.Column("max_latitude", sa.Float(), nullable=True))
+    op.add_column("incidents", sa.Column("max_longitude", sa.Float(), nullable=True))
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    for column in ("max_longitude", "max_latitude", "min_longitude", "min_latitude", "longitude_sum", "latitude_sum", "signal_count"):
+        op.drop_column("incidents", column)
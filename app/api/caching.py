@@ -0,0 +1,65 @@
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.core.cache import etag_matches
+from app.services.response_cache import AsyncResponseCache, CachedResponse, ResponseCache
+
+
+def cached_response(
+    request: Request,
+    cache: ResponseCache | None,
+    key: str,
+    build: Callable[[], tuple[bytes, dict[str, str]]],
+    media_type: str = "application/json",
+    refine: Callable[[bytes], bytes] | None = None,
+    etag_key: str | None = None,
+) -> Response:
+    version = cache.data_version() if cache is not None else None
+    if version is None:
+        body, headers = build()
+        return Response(_refined(body, refine), media_type=media_type, headers=headers)
+
+    # The ETag is derived from the data version and the exact request alone, so a matching
+    # poll is answered before any cache or database read. ``key`` may be a normalized key
+    # shared by several requests; ``refine`` narrows its cached body to this request.
+    etag = cache.etag(version, etag_key or key)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = cache.get(version, key)
+    if cached is None:
+        body, headers = build()
+        cached = CachedResponse(body=body, etag=etag, headers=headers)
+        cache.set(version, key, cached)
+    return Response(_refined(cached.body, refine), media_type=media_type, headers={**cached.headers, "ETag": etag})
+
+
+async def cached_response_async(
+    request: Request,
+    cache: AsyncResponseCache | None,
+    key: str,
+    build: Callable[[], Awaitable[tuple[bytes, dict[str, str]]]],
+    media_type: str = "application/json",
+    refine: Callable[[bytes], bytes] | None = None,
+    etag_key: str | None = None,
+) -> Response:
+    version = await cache.data_version() if cache is not None else None
+    if version is None:
+        body, headers = await build()
+        return Response(_refined(body, refine), media_type=media_type, headers=headers)
+
+    etag = cache.etag(version, etag_key or key)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = await cache.get(version, key)
+    if cached is None:
+        body, headers = await build()
+        cached = CachedResponse(body=body, etag=etag, headers=headers)
+        await cache.set(version, key, cached)
+    return Response(_refined(cached.body, refine), media_type=media_type, headers={**cached.headers, "ETag": etag})
+
+
+def _refined(body: bytes, refine: Callable[[bytes], bytes] | None) -> bytes:
+    return body if refine is None else refine(body)
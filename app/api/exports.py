@@ -0,0 +1,104 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.api.pagination import parse_bbox
+from app.db.session import SessionLocal
+from app.repositories.exports import ExportRepository
+from app.services.exports import EXPORT_MEDIA_TYPES, accepts_gzip, encode_rows, gzip_chunks
+
+router = APIRouter(prefix="/export")
+INCIDENT_FIELDS = (
+    "id",
+    "first_seen",
+    "last_seen",
+    "confidence_score",
+    "score_breakdown",
+    "latitude",
+    "longitude",
+    "signal_count",
+    "min_latitude",
+    "min_longitude",
+    "max_latitude",
+    "max_longitude",
+)
+SIGNAL_FIELDS = (
+    "id",
+    "source_type",
+    "source_id",
+    "title",
+    "url",
+    "observed_at",
+    "latitude",
+    "longitude",
+    "extracted_location_text",
+    "incident_ids",
+)
+FORMAT_PATTERN = "^(" + "|".join(EXPORT_MEDIA_TYPES) + ")$"
+
+
+def _export(
+    request: Request,
+    name: str,
+    fmt: str,
+    fields: tuple[str, ...],
+    rows: Callable[[ExportRepository], Iterator],
+) -> StreamingResponse:
+    # The session is opened inside the generator so it lives exactly as long as the
+    # stream, independent of when request-scoped dependencies are torn down.
+    def body() -> Iterator[bytes]:
+        with SessionLocal() as db:
+            yield from encode_rows((row._mapping for row in rows(ExportRepository(db))), fields, fmt)
+
+    headers = {"Content-Disposition": f'attachment; filename="{name}.{fmt}"'}
+    chunks = body()
+    if accepts_gzip(request.headers.get("accept-encoding")):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(chunks, media_type=EXPORT_MEDIA_TYPES[fmt], headers=headers)
+
+
+def _bbox(bbox: str | None) -> tuple[float, float, float, float] | None:
+    try:
+        return parse_bbox(bbox) if bbox else None
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+@router.get("/incidents")
+def export_incidents(
+    request: Request,
+    since: datetime | None = Query(default=None, description="last_seen lower bound (inclusive)"),
+    until: datetime | None = Query(default=None, description="last_seen upper bound (exclusive)"),
+    bbox: str | None = Query(default=None, description="minLon,minLat,maxLon,maxLat"),
+    format: str = Query(default="ndjson", pattern=FORMAT_PATTERN),
+) -> StreamingResponse:
+    parsed_bbox = _bbox(bbox)
+    return _export(
+        request,
+        "incidents",
+        format,
+        INCIDENT_FIELDS,
+        lambda repo: repo.incident_rows(since=since, until=until, bbox=parsed_bbox),
+    )
+
+
+@router.get("/signals")
+def export_signals(
+    request: Request,
+    since: datetime | None = Query(default=None, description="observed_at lower bound (inclusive)"),
+    until: datetime | None = Query(default=None, description="observed_at upper bound (exclusive)"),
+    bbox: str | None = Query(default=None, description="minLon,minLat,maxLon,maxLat"),
+    format: str = Query(default="ndjson", pattern=FORMAT_PATTERN),
+) -> StreamingResponse:
+    parsed_bbox = _bbox(bbox)
+    return _export(
+        request,
+        "signals",
+        format,
+        SIGNAL_FIELDS,
+        lambda repo: repo.signal_rows(since=since, until=until, bbox=parsed_bbox),
+    )
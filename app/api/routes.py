@@ -1,15 +1,25 @@
-from datetime import datetime
+import json
+from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from geoalchemy2.shape import to_shape
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.repositories.incidents import IncidentRepository
+from app.api.caching import cached_response_async
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, parse_bbox
+from app.core.cache import cache_key, normalize_bbox, normalize_confidence, normalize_since
+from app.core.metrics import render_metrics
+from app.db.session import get_async_db, get_db
+from app.repositories.incidents import AsyncIncidentRepository, IncidentRepository
 from app.schemas.incidents import FeedbackIn, FeedbackOut, IncidentDetail, IncidentSummary, SignalOut
+from app.services.response_cache import AsyncResponseCache, get_async_response_cache
 
 router = APIRouter()
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 2000
+INCIDENT_SUMMARIES = TypeAdapter(list[IncidentSummary])
 
 
 @router.get("/health")
@@ -17,61 +27,110 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    payload, content_type = render_metrics()
+    return Response(payload, media_type=content_type)
+
+
 @router.get("/incidents", response_model=list[IncidentSummary])
-def list_incidents(
+async def list_incidents(
+    request: Request,
     since: datetime | None = Query(default=None),
     min_confidence: float = Query(default=0.0, ge=0.0, le=100.0),
     bbox: str | None = Query(default=None, description="minLon,minLat,maxLon,maxLat"),
-    db: Session = Depends(get_db),
-) -> list[IncidentSummary]:
-    repo = IncidentRepository(db)
-    incidents = repo.list_incidents(since=since, min_confidence=min_confidence)
-    parsed_bbox = tuple(map(float, bbox.split(","))) if bbox else None
-    incidents = repo.bbox_filter(incidents, parsed_bbox if parsed_bbox and len(parsed_bbox) == 4 else None)
-
-    return [
-        IncidentSummary(
-            id=incident.id,
-            first_seen=incident.first_seen,
-            last_seen=incident.last_seen,
-            confidence_score=incident.confidence_score,
-            score_breakdown=incident.score_breakdown,
-            latitude=to_shape(incident.centroid).y,
-            longitude=to_shape(incident.centroid).x,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description=f"Value of the {NEXT_CURSOR_HEADER} response header"),
+    cache: AsyncResponseCache | None = Depends(get_async_response_cache),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    try:
+        exact_bbox = parse_bbox(bbox) if bbox else None
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    # The query and cache key use widened filters so nearby requests share one entry; the
+    # page is narrowed back to the exact filters before it is sent.
+    exact = {"since": since, "min_confidence": min_confidence, "bbox": exact_bbox, "limit": limit, "cursor": cursor}
+    wide = {
+        **exact,
+        "since": normalize_since(since) if since else None,
+        "min_confidence": normalize_confidence(min_confidence),
+        "bbox": normalize_bbox(exact_bbox) if exact_bbox else None,
+    }
+
+    async def build() -> tuple[bytes, dict[str, str]]:
+        # One extra row tells whether another page exists without a COUNT query.
+        incidents = await AsyncIncidentRepository(db).list_incidents(
+            since=wide["since"],
+            min_confidence=wide["min_confidence"],
+            bbox=wide["bbox"],
+            limit=limit + 1,
+            after=after,
         )
-        for incident in incidents
+        headers = {}
+        if len(incidents) > limit:
+            incidents = incidents[:limit]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(incidents[-1].last_seen, incidents[-1].id)
+        summaries = [IncidentSummary(**incident._mapping) for incident in incidents]
+        return INCIDENT_SUMMARIES.dump_json(summaries), headers
+
+    def refine(body: bytes) -> bytes:
+        return narrow_incidents(body, since, min_confidence, exact_bbox)
+
+    return await cached_response_async(
+        request,
+        cache,
+        cache_key("incidents", wide),
+        build,
+        refine=refine if wide != exact else None,
+        etag_key=cache_key("incidents", exact),
+    )
+
+
+# Drops rows a widened query returned outside the client's own filters. A narrowed page
+# can hold fewer than ``limit`` rows; X-Next-Cursor still says where the next one starts.
+def narrow_incidents(
+    body: bytes,
+    since: datetime | None,
+    min_confidence: float,
+    bbox: tuple[float, float, float, float] | None,
+) -> bytes:
+    rows = json.loads(body)
+    kept = [
+        row
+        for row in rows
+        if row["confidence_score"] >= min_confidence
+        and (since is None or datetime.fromisoformat(row["last_seen"]) >= since)
+        and (bbox is None or (bbox[0] <= row["longitude"] <= bbox[2] and bbox[1] <= row["latitude"] <= bbox[3]))
     ]
+    if len(kept) == len(rows):
+        return body
+    return json.dumps(kept, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 @router.get("/incidents/{incident_id}", response_model=IncidentDetail)
-def get_incident(incident_id: UUID, db: Session = Depends(get_db)) -> IncidentDetail:
-    repo = IncidentRepository(db)
-    incident = repo.get_incident(incident_id)
-    if not incident:
-        raise HTTPException(status_code=404, detail="Incident not found")
+async def get_incident(
+    incident_id: UUID,
+    request: Request,
+    cache: AsyncResponseCache | None = Depends(get_async_response_cache),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    async def build() -> tuple[bytes, dict[str, str]]:
+        repo = AsyncIncidentRepository(db)
+        incident = await repo.get_incident_summary(incident_id)
+        if not incident:
+            raise HTTPException(status_code=404, detail="Incident not found")
+        detail = IncidentDetail(
+            **incident._mapping,
+            signals=[SignalOut(**signal._mapping) for signal in await repo.list_signal_rows(incident_id)],
+        )
+        return detail.model_dump_json().encode("utf-8"), {}
 
-    centroid = to_shape(incident.centroid)
-    return IncidentDetail(
-        id=incident.id,
-        first_seen=incident.first_seen,
-        last_seen=incident.last_seen,
-        confidence_score=incident.confidence_score,
-        score_breakdown=incident.score_breakdown,
-        latitude=centroid.y,
-        longitude=centroid.x,
-        signals=[
-            SignalOut(
-                id=link.signal.id,
-                source_type=link.signal.source_type,
-                title=link.signal.title,
-                url=link.signal.url,
-                observed_at=link.signal.observed_at,
-                latitude=link.signal.latitude,
-                longitude=link.signal.longitude,
-            )
-            for link in incident.signal_links
-        ],
-    )
+    return await cached_response_async(request, cache, cache_key("incident", {"id": incident_id}), build)
 
 
 @router.post("/feedback", response_model=FeedbackOut)
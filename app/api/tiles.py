@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.caching import cached_response_async
+from app.core.cache import cache_key
+from app.db.session import get_async_db
+from app.repositories.tiles import AsyncTileRepository, tile_in_range
+from app.services.response_cache import AsyncResponseCache, get_async_response_cache
+
+router = APIRouter(prefix="/tiles")
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+@router.get("/{z}/{x}/{y}.mvt", response_class=Response)
+async def get_tile(
+    z: int,
+    x: int,
+    y: int,
+    request: Request,
+    min_confidence: float = Query(default=0.0, ge=0.0, le=100.0),
+    cache: AsyncResponseCache | None = Depends(get_async_response_cache),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    if not tile_in_range(z, x, y):
+        raise HTTPException(status_code=404, detail="Tile out of range")
+
+    async def build() -> tuple[bytes, dict[str, str]]:
+        return await AsyncTileRepository(db).tile(z, x, y, min_confidence), {}
+
+    key = cache_key("tile", {"z": z, "x": x, "y": y, "min_confidence": min_confidence})
+    return await cached_response_async(request, cache, key, build, media_type=MVT_MEDIA_TYPE)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from datetime import datetime, timezone
+from typing import Any
+
+BBOX_DECIMALS = 3
+SINCE_BUCKET_SECONDS = 60
+CONFIDENCE_DECIMALS = 1
+
+
+# Size- and age-bounded mapping; the least recently used entry is evicted first.
+class LRUCache:
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (self.clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Cache-friendly query parameters: nearby requests collapse onto one key. Normalization
+# only ever widens a filter (bbox snapped outward, since floored, min_confidence floored),
+# so the cached body for a key is a superset of every request mapped onto it; callers
+# narrow it back to the exact request before responding.
+def normalize_bbox(bbox: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    scale = 10**BBOX_DECIMALS
+    min_lon, min_lat, max_lon, max_lat = bbox
+    return (
+        math.floor(min_lon * scale) / scale,
+        math.floor(min_lat * scale) / scale,
+        math.ceil(max_lon * scale) / scale,
+        math.ceil(max_lat * scale) / scale,
+    )
+
+
+def normalize_since(since: datetime) -> datetime:
+    aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+    epoch = int(aware.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % SINCE_BUCKET_SECONDS, tz=timezone.utc)
+
+
+def normalize_confidence(min_confidence: float) -> float:
+    scale = 10**CONFIDENCE_DECIMALS
+    return math.floor(min_confidence * scale) / scale
+
+
+def cache_key(namespace: str, params: Mapping[str, Any]) -> str:
+    parts = [namespace]
+    for name in sorted(params):
+        value = params[name]
+        if value is None:
+            continue
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, tuple):
+            value = ",".join(str(part) for part in value)
+        parts.append(f"{name}={value}")
+    return "&".join(parts)
+
+
+def etag_for(version: int, key: str) -> str:
+    digest = hashlib.sha1(f"{version}:{key}".encode("utf-8"), usedforsecurity=False).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
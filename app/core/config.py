@@ -14,13 +14,51 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="postgresql+psycopg://postgres:postgres@db:5432/waterbreak"
     )
+    async_db_pool_size: int = 20
+    async_db_max_overflow: int = 10
     redis_url: str = "redis://redis:6379/0"
+    metrics_worker_port: int = 9101
+    profiling_enabled: bool = False
+    profiling_dir: str = "/tmp/wbw-profiles"
+    slow_query_threshold_ms: float = 0.0
+    slow_query_explain: bool = False
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 300
+    response_cache_local_entries: int = 256
+    response_cache_max_entry_bytes: int = 2_000_000
+    response_cache_socket_timeout_seconds: float = 0.25
 
     toronto_boundary_name: str = "toronto"
+    boundary_cache_ttl_seconds: int = 300
+    boundary_cache_max_vertices: int = 200_000
     clustering_distance_meters: float = 300.0
     clustering_time_window_hours: int = 2
+    clustering_cell_locks_enabled: bool = True
+    clustering_cell_lock_max_keys: int = 128
+    active_incident_cache_enabled: bool = True
+    active_incident_horizon_hours: int = 4
+    active_incident_refresh_seconds: int = 30
+    active_incident_refresh_overlap_seconds: int = 120
+    incident_extent_repair_seconds: int = 86400
 
     rss_urls: str = ""
+    rss_fetch_concurrency: int = 8
+    rss_fetch_per_host_limit: int = 2
+    rss_fetch_backoff_seconds: float = 1.0
+    rss_ingest_fan_out: bool = True
+    rss_fetch_rate_limit: str = ""
+    rss_fetch_per_host_per_minute: int = 30
+    rss_fetch_soft_time_limit_seconds: int = 60
+    rss_ingest_soft_time_limit_seconds: int = 300
+    rss_scheduler_tick_seconds: int = 30
+    rss_poll_min_seconds: int = 60
+    rss_poll_max_seconds: int = 3600
+    rss_poll_initial_seconds: int = 300
+    rss_poll_error_max_seconds: int = 21600
+    rss_poll_burst_seconds: int = 60
+    rss_poll_burst_duration_seconds: int = 1800
+    rss_poll_burst_min_confidence: float = 70.0
+    rss_parser_engine: str = Field(default="feedparser", pattern="^(feedparser|stream)$")
     reddit_subreddits: str = ""
 
 
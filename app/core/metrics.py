@@ -0,0 +1,87 @@
+import os
+import time
+from collections.abc import Callable
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy.pool import Pool
+
+# With PROMETHEUS_MULTIPROC_DIR set (Celery prefork children, multi-worker uvicorn) every
+# process writes its samples to files in that directory and exposition aggregates them.
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SLOW_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+INGEST_STAGE_SECONDS = Histogram(
+    "wbw_ingest_stage_seconds",
+    "Time spent in each RSS ingest stage",
+    ["stage"],
+    buckets=SLOW_BUCKETS,
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "wbw_http_request_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"],
+    buckets=FAST_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "wbw_http_requests_in_flight",
+    "API requests currently being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "wbw_db_pool_checkout_seconds",
+    "Time waiting to check a connection out of the SQLAlchemy pool",
+    ["engine"],
+    buckets=FAST_BUCKETS,
+)
+CELERY_TASK_SECONDS = Histogram(
+    "wbw_celery_task_seconds",
+    "Celery task run time",
+    ["task", "state"],
+    buckets=SLOW_BUCKETS,
+)
+
+
+def stage_timer(stage: str):
+    return INGEST_STAGE_SECONDS.labels(stage).time()
+
+
+def metrics_registry() -> CollectorRegistry:
+    if not MULTIPROC_DIR:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> tuple[bytes, str]:
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
+
+
+# SQLAlchemy has no "checkout started" event, so the wait is timed around the pool's
+# internal _do_get, which covers both queueing for a free slot and opening a connection.
+def timed_pool_class(base: type[Pool], engine_name: str) -> type[Pool]:
+    observe: Callable[[float], None] = DB_POOL_CHECKOUT_SECONDS.labels(engine_name).observe
+
+    class TimedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                observe(time.perf_counter() - start)
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
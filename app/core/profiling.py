@@ -0,0 +1,145 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+PROFILE_HEADER = "x-profile"
+PROFILE_REPORT_HEADER = "X-Profile-Report"
+PROFILE_SKIPPED_HEADER = "X-Profile-Skipped"
+REPORT_LINES = 40
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+# Python allows one active profiler per process (3.12 raises ValueError on a second
+# enable()), so profiles never overlap.
+_PROFILER_LOCK = threading.Lock()
+
+
+def profile_path(directory: str, name: str) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    return Path(directory) / f"{name.replace('.', '_')}-{stamp}-{os.getpid()}"
+
+
+# Writes <base>.pstats (for pstats/snakeviz) and <base>.txt (top functions by cumulative
+# time) when the block exits. Suffixes are appended to the full name, never substituted.
+# Yields False, and runs the block unprofiled, while another profile is active.
+@contextmanager
+def profile_to_file(base: Path) -> Iterator[bool]:
+    if not _PROFILER_LOCK.acquire(blocking=False):
+        yield False
+        return
+    try:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as exc:
+            logger.warning("Profiling skipped, another profiler is active: %s", exc)
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            profiler.disable()
+            base.parent.mkdir(parents=True, exist_ok=True)
+            stats_path = base.parent / f"{base.name}.pstats"
+            profiler.dump_stats(stats_path)
+            summary = io.StringIO()
+            pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(REPORT_LINES)
+            (base.parent / f"{base.name}.txt").write_text(summary.getvalue())
+            logger.info("Wrote profile %s", stats_path)
+    finally:
+        _PROFILER_LOCK.release()
+
+
+# Profiles a request when it carries "X-Profile: 1" or "?profile=1". Only mounted when
+# PROFILING_ENABLED is set, so normal deployments pay nothing. cProfile follows the event
+# loop thread, so async routes are covered and other requests interleaved on the loop add
+# to the same report. Only one profile runs at a time: a flagged request arriving while
+# another is profiled is served unprofiled and answered with X-Profile-Skipped.
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, directory: str) -> None:
+        self.app = app
+        self.directory = directory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _profile_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        base = profile_path(self.directory, "request" + scope["path"].replace("/", "_"))
+        profiled = False
+
+        async def send_with_report(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                if profiled:
+                    header = (PROFILE_REPORT_HEADER.lower().encode(), base.name.encode())
+                else:
+                    header = (PROFILE_SKIPPED_HEADER.lower().encode(), b"another profile is running")
+                message = {**message, "headers": [*message.get("headers", []), header]}
+            await send(message)
+
+        with profile_to_file(base) as profiled:
+            await self.app(scope, receive, send_with_report)
+
+
+def _profile_requested(scope: Scope) -> bool:
+    for key, value in scope.get("headers", []):
+        if key == PROFILE_HEADER.encode() and value in (b"1", b"true"):
+            return True
+    query = scope.get("query_string", b"").decode("latin-1")
+    return any(part in ("profile=1", "profile=true") for part in query.split("&"))
+
+
+# Logs statements slower than the threshold with their parameters and, optionally, the
+# EXPLAIN plan. The plan is taken on a separate cursor inside a savepoint so a failing
+# EXPLAIN can never abort the caller's transaction. Nothing is registered unless enabled.
+def install_slow_query_logging(engine: Engine, threshold_ms: float, explain: bool = False) -> None:
+    threshold_s = threshold_ms / 1000.0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_slow(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+        if elapsed < threshold_s:
+            return
+        plan = None
+        if explain and not executemany and statement.lstrip().upper().startswith(EXPLAINABLE):
+            plan = _explain(conn, statement, parameters)
+        logger.warning(
+            "Slow query %.1f ms: %s parameters=%r%s",
+            elapsed * 1000,
+            statement,
+            parameters,
+            f"\n{plan}" if plan else "",
+        )
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    cursor = conn.connection.cursor()
+    in_savepoint = False
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        in_savepoint = True
+        cursor.execute(f"EXPLAIN {statement}", parameters)
+        plan = "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+        cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    except Exception as exc:  # noqa: BLE001 - diagnostics must never break the query path
+        if in_savepoint:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+        return f"(EXPLAIN failed: {exc})"
+    finally:
+        cursor.close()
@@ -1,14 +1,36 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import get_settings
+from app.core.metrics import timed_pool_class
+from app.core.profiling import install_slow_query_logging
 
 settings = get_settings()
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+engine = create_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    poolclass=timed_pool_class(QueuePool, "sync"),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# The API read path runs on the event loop; Celery keeps the sync engine above.
+async_engine = create_async_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    poolclass=timed_pool_class(AsyncAdaptedQueuePool, "async"),
+    pool_size=settings.async_db_pool_size,
+    max_overflow=settings.async_db_max_overflow,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.slow_query_threshold_ms > 0:
+    for traced in (engine, async_engine.sync_engine):
+        install_slow_query_logging(traced, settings.slow_query_threshold_ms, settings.slow_query_explain)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -16,3 +38,8 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,6 +1,12 @@
+import os
+import time
+
 from celery import Celery
+from celery.signals import task_postrun, task_prerun, worker_process_shutdown, worker_ready
+from prometheus_client import multiprocess, start_http_server
 
 from app.core.config import get_settings
+from app.core.metrics import CELERY_TASK_SECONDS, MULTIPROC_DIR, metrics_registry
 
 settings = get_settings()
 
@@ -10,4 +16,50 @@ celery_app = Celery(
     backend=settings.redis_url,
 )
 celery_app.conf.task_default_queue = "ingest"
+# Downloads mostly wait on the network and scale with worker concurrency; feed writes hold
+# DB connections, so they get their own queue and can run on a smaller pool.
+celery_app.conf.task_routes = {
+    "jobs.fetch_feed": {"queue": "fetch"},
+    "jobs.ingest_feed": {"queue": "ingest_db"},
+}
+celery_app.conf.beat_schedule = {
+    "dispatch-due-feeds": {
+        "task": "jobs.dispatch_due_feeds",
+        "schedule": float(settings.rss_scheduler_tick_seconds),
+        "options": {"expires": float(settings.rss_scheduler_tick_seconds)},
+    },
+}
+if settings.incident_extent_repair_seconds:
+    celery_app.conf.beat_schedule["repair-incident-extents"] = {
+        "task": "jobs.repair_incident_extents",
+        "schedule": float(settings.incident_extent_repair_seconds),
+    }
 celery_app.autodiscover_tasks(["app.jobs"])
+
+_task_started_at: dict[str, float] = {}
+
+
+@task_prerun.connect
+def _record_task_start(task_id: str, **kwargs) -> None:
+    _task_started_at[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _record_task_duration(task_id: str, task, state: str | None = None, **kwargs) -> None:
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is not None:
+        CELERY_TASK_SECONDS.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started_at)
+
+
+# Tasks run in prefork children, so the main worker process serves the aggregate of the
+# multiprocess directory rather than its own (empty) registry.
+@worker_ready.connect
+def _serve_worker_metrics(**kwargs) -> None:
+    if settings.metrics_worker_port:
+        start_http_server(settings.metrics_worker_port, registry=metrics_registry())
+
+
+@worker_process_shutdown.connect
+def _mark_worker_process_dead(pid: int | None = None, **kwargs) -> None:
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid or os.getpid())
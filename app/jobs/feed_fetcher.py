@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+from urllib.parse import urlsplit
+
+import redis
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+RATE_LIMIT_PREFIX = "wbw:fetch-rate"
+
+
+class RetryableFetchError(Exception):
+    def __init__(self, cause: Exception) -> None:
+        super().__init__(str(cause))
+        self.cause = cause
+
+
+@dataclass
+class FetchResult(Generic[T]):
+    url: str
+    response: T | None = None
+    error: Exception | None = None
+    attempts: int = 0
+
+
+def feed_host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+# Fetches many URLs on a thread pool and yields each result as soon as it is ready, so
+# callers can parse and write one feed while others are still downloading. Concurrency is
+# capped globally (pool size) and per host. Retries are scheduled on a timer instead of
+# sleeping in a worker, so a backing-off feed never holds a slot other feeds could use.
+class ConcurrentFetcher(Generic[T]):
+    def __init__(
+        self,
+        fetch: Callable[[str], T],
+        *,
+        max_workers: int,
+        per_host_limit: int,
+        retry_attempts: int,
+        backoff_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.fetch = fetch
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.retry_attempts = max(1, retry_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.clock = clock
+
+    def fetch_all(self, urls: Iterable[str]) -> Iterator[FetchResult[T]]:
+        ready: deque[tuple[str, int]] = deque((url, 1) for url in urls)
+        delayed: list[tuple[float, int, str, int]] = []
+        sequence = itertools.count()
+        in_flight: dict[Future, tuple[str, int]] = {}
+        host_load: Counter[str] = Counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="feed-fetch") as pool:
+            while ready or delayed or in_flight:
+                now = self.clock()
+                while delayed and delayed[0][0] <= now:
+                    _, _, url, attempt = heapq.heappop(delayed)
+                    ready.append((url, attempt))
+
+                for _ in range(len(ready)):
+                    if len(in_flight) >= self.max_workers:
+                        break
+                    url, attempt = ready.popleft()
+                    host = feed_host(url)
+                    if host_load[host] >= self.per_host_limit:
+                        ready.append((url, attempt))
+                        continue
+                    host_load[host] += 1
+                    in_flight[pool.submit(self.fetch, url)] = (url, attempt)
+
+                if not in_flight:
+                    if delayed:
+                        time.sleep(max(0.0, delayed[0][0] - self.clock()))
+                    continue
+
+                timeout = max(0.0, delayed[0][0] - self.clock()) if delayed else None
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, attempt = in_flight.pop(future)
+                    host_load[feed_host(url)] -= 1
+                    try:
+                        response = future.result()
+                    except RetryableFetchError as exc:
+                        if attempt < self.retry_attempts:
+                            due = self.clock() + self.backoff_seconds * 2 ** (attempt - 1)
+                            heapq.heappush(delayed, (due, next(sequence), url, attempt + 1))
+                            continue
+                        yield FetchResult(url=url, error=exc.cause, attempts=attempt)
+                    except Exception as exc:  # noqa: BLE001 - reported per feed to the caller
+                        yield FetchResult(url=url, error=exc, attempts=attempt)
+                    else:
+                        yield FetchResult(url=url, response=response, attempts=attempt)
+
+
+# Per-host fetch budget shared by every fetch worker: a fixed one-minute window counted
+# in Redis. acquire() returns 0 when the fetch may go ahead, otherwise the seconds until
+# the next window. Redis errors fail open, since skipping a poll is worse than a burst.
+class HostRateLimiter:
+    def __init__(self, client: redis.Redis, *, per_minute: int, clock: Callable[[], float] = time.time) -> None:
+        self.client = client
+        self.per_minute = per_minute
+        self.clock = clock
+
+    def acquire(self, host: str) -> float:
+        if self.per_minute <= 0:
+            return 0.0
+        now = self.clock()
+        window = int(now // 60)
+        key = f"{RATE_LIMIT_PREFIX}:{host}:{window}"
+        try:
+            count = self.client.incr(key)
+            if count == 1:
+                self.client.expire(key, 120)
+        except redis.RedisError as exc:
+            logger.warning("Fetch rate limiter unavailable: %s", exc)
+            return 0.0
+        return 0.0 if count <= self.per_minute else (window + 1) * 60 - now
@@ -1,21 +1,18 @@
+import io
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from hashlib import sha256
+from typing import BinaryIO
 from urllib.request import urlopen
 import xml.etree.ElementTree as ET
 
+from app.services.keywords import KEYWORD_REGISTRY
+
 LOCATION_PATTERN = re.compile(r"\b([A-Z][\w'\-.]+(?:\s+[A-Z][\w'\-.]+)*)\s*&\s*([A-Z][\w'\-.]+(?:\s+[A-Z][\w'\-.]+)*)")
-KEYWORDS = (
-    "watermain",
-    "water main",
-    "break",
-    "burst",
-    "leak",
-    "flood",
-    "road closure",
-)
+KEYWORDS = KEYWORD_REGISTRY.tiers["feed"]
 
 
 @dataclass
@@ -48,6 +45,21 @@ def entry_datetime(entry: FeedEntry, fallback: datetime) -> datetime:
     return fallback
 
 
+def entry_timestamp(entry) -> datetime | None:
+    for raw_value in (getattr(entry, "published", None), getattr(entry, "updated", None)):
+        if not raw_value:
+            continue
+        try:
+            parsed = parsedate_to_datetime(raw_value)
+        except (TypeError, ValueError):
+            try:
+                parsed = datetime.fromisoformat(raw_value)
+            except ValueError:
+                continue
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return None
+
+
 def extract_location_text(text: str) -> str | None:
     match = LOCATION_PATTERN.search(text)
     if match:
@@ -56,8 +68,7 @@ def extract_location_text(text: str) -> str | None:
 
 
 def keyword_hits(text: str) -> list[str]:
-    lowered = text.lower()
-    return [keyword for keyword in KEYWORDS if keyword in lowered]
+    return KEYWORD_REGISTRY.hits(text)["feed"]
 
 
 def build_source_id(entry: FeedEntry, link: str) -> str:
@@ -67,6 +78,19 @@ def build_source_id(entry: FeedEntry, link: str) -> str:
     return sha256(link.encode("utf-8")).hexdigest()
 
 
+def conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def content_hash(body: bytes) -> str:
+    return sha256(body).hexdigest()
+
+
 def is_duplicate(*, url_match: bool, source_match: bool) -> bool:
     return url_match or source_match
 
@@ -78,6 +102,37 @@ def _read_feed_source(feed_source: str) -> str:
         return response.read().decode("utf-8", errors="replace")
 
 
+ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+ATOM_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+
+
+def _rss_entry(item: ET.Element) -> FeedEntry:
+    return FeedEntry(
+        title=(item.findtext("title") or "").strip(),
+        summary=(item.findtext("description") or "").strip(),
+        link=(item.findtext("link") or "").strip(),
+        guid=(item.findtext("guid") or "").strip() or None,
+        published=(item.findtext("pubDate") or "").strip() or None,
+    )
+
+
+def _atom_entry(item: ET.Element) -> FeedEntry:
+    ns = ATOM_NS
+    link_el = item.find("atom:link", ns)
+    return FeedEntry(
+        title=(item.findtext("atom:title", default="", namespaces=ns) or "").strip(),
+        summary=(item.findtext("atom:summary", default="", namespaces=ns) or "").strip(),
+        link=(link_el.attrib.get("href") if link_el is not None else "") or "",
+        id=(item.findtext("atom:id", default="", namespaces=ns) or "").strip() or None,
+        published=(item.findtext("atom:published", default="", namespaces=ns) or "").strip() or None,
+        updated=(item.findtext("atom:updated", default="", namespaces=ns) or "").strip() or None,
+    )
+
+
+def entry_key(entry) -> str:
+    return getattr(entry, "id", None) or getattr(entry, "guid", None) or getattr(entry, "link", "") or ""
+
+
 def parse_feed(feed_source: str) -> ParsedFeed:
     try:
         xml_text = _read_feed_source(feed_source)
@@ -87,29 +142,50 @@ def parse_feed(feed_source: str) -> ParsedFeed:
 
     entries: list[FeedEntry] = []
     if root.tag.lower().endswith("rss"):
-        for item in root.findall("./channel/item"):
-            entries.append(
-                FeedEntry(
-                    title=(item.findtext("title") or "").strip(),
-                    summary=(item.findtext("description") or "").strip(),
-                    link=(item.findtext("link") or "").strip(),
-                    guid=(item.findtext("guid") or "").strip() or None,
-                    published=(item.findtext("pubDate") or "").strip() or None,
-                )
-            )
+        entries = [_rss_entry(item) for item in root.findall("./channel/item")]
     elif root.tag.lower().endswith("feed"):
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        for item in root.findall("atom:entry", ns):
-            link_el = item.find("atom:link", ns)
-            entries.append(
-                FeedEntry(
-                    title=(item.findtext("atom:title", default="", namespaces=ns) or "").strip(),
-                    summary=(item.findtext("atom:summary", default="", namespaces=ns) or "").strip(),
-                    link=(link_el.attrib.get("href") if link_el is not None else "") or "",
-                    id=(item.findtext("atom:id", default="", namespaces=ns) or "").strip() or None,
-                    published=(item.findtext("atom:published", default="", namespaces=ns) or "").strip() or None,
-                    updated=(item.findtext("atom:updated", default="", namespaces=ns) or "").strip() or None,
-                )
-            )
+        entries = [_atom_entry(item) for item in root.findall("atom:entry", ATOM_NS)]
 
     return ParsedFeed(entries=entries)
+
+
+def iter_feed_entries(source: bytes | BinaryIO) -> Iterator[FeedEntry]:
+    # Incremental RSS/Atom parser: entries are yielded as soon as their closing tag is
+    # read and then detached from the tree, so memory stays bounded by one entry. A
+    # consumer that stops iterating leaves the rest of the document unread.
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    open_elements: list[ET.Element] = []
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            continue
+        open_elements.pop()
+        if element.tag == "item":
+            entry = _rss_entry(element)
+        elif element.tag == ATOM_ENTRY_TAG:
+            entry = _atom_entry(element)
+        else:
+            continue
+
+        element.clear()
+        if open_elements:
+            open_elements[-1].remove(element)
+        yield entry
+
+
+# Yields entries until the newest one recorded on the previous poll (``stop_at``). Stopping
+# there only skips nothing new when the feed lists newest first, so it happens only after
+# at least one dated entry and with every date so far, the marker's included, descending.
+# Oldest-first, undated or shuffled feeds are read in full and the signal dedupe drops
+# what was already stored.
+def entries_since(entries: Iterable, stop_at: str | None) -> Iterator:
+    previous: datetime | None = None
+    descending = True
+    for entry in entries:
+        published = entry_timestamp(entry)
+        if published is None or (previous is not None and published > previous):
+            descending = False
+        if stop_at is not None and descending and previous is not None and entry_key(entry) == stop_at:
+            return
+        previous = published
+        yield entry
@@ -1,61 +1,125 @@
 import logging
-import time
-from datetime import datetime, timezone
+import xml.etree.ElementTree as ET
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from hashlib import sha256
 from types import SimpleNamespace
 
 import feedparser
+import redis
 import requests
-from sqlalchemy import select
+from celery import chord
+from celery.exceptions import Retry, SoftTimeLimitExceeded
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import get_settings
+from app.core.metrics import stage_timer
+from app.core.profiling import profile_path, profile_to_file
 from app.db.session import SessionLocal
 from app.jobs.celery_app import celery_app
+from app.jobs.feed_fetcher import ConcurrentFetcher, HostRateLimiter, RetryableFetchError, feed_host
 from app.jobs.rss_utils import (
+    conditional_headers,
+    content_hash,
+    entries_since,
     entry_datetime,
+    entry_key,
+    entry_timestamp,
     extract_location_text,
     is_duplicate,
-    keyword_hits,
+    iter_feed_entries,
 )
-from app.models import Signal
-from app.services.incident_service import IncidentService, SignalPayload
+from app.models import FeedState, Signal
+from app.repositories.feeds import FeedStateRepository, poll_state
+from app.repositories.incidents import IncidentRepository
+from app.services.feed_schedule import PollOutcome, compute_next_poll, poll_policy
+from app.services.incident_service import UNLOCATED, IncidentService, SignalPayload, get_active_incident_set
+from app.services.keywords import KEYWORD_REGISTRY
+from app.services.response_cache import get_response_cache
+from app.services.scoring import confidence_keyword_hits
 
 logger = logging.getLogger(__name__)
 USER_AGENT = "Mozilla/5.0"
 RETRY_ATTEMPTS = 3
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+HARD_TIME_LIMIT_GRACE_SECONDS = 30
+# Celery reads rate and time limits once, when the task decorators run; functions read
+# get_settings() at call time instead.
+_task_settings = get_settings()
 
 
-def _fetch_feed(session: requests.Session, feed_url: str) -> requests.Response:
-    for attempt in range(1, RETRY_ATTEMPTS + 1):
-        try:
+def _fetch_feed(
+    session: requests.Session,
+    feed_url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> requests.Response:
+    try:
+        with stage_timer("fetch"):
             response = session.get(
                 feed_url,
                 timeout=(5, 20),
-                headers={"User-Agent": USER_AGENT},
+                headers={"User-Agent": USER_AGENT, **conditional_headers(etag, last_modified)},
             )
-        except requests.Timeout:
-            if attempt == RETRY_ATTEMPTS:
-                raise
-            time.sleep(2 ** (attempt - 1))
-            continue
-
-        if response.status_code in RETRYABLE_STATUS_CODES and attempt < RETRY_ATTEMPTS:
-            time.sleep(2 ** (attempt - 1))
-            continue
+    except requests.Timeout as exc:
+        raise RetryableFetchError(exc) from exc
 
+    try:
         response.raise_for_status()
-        return response
+    except requests.HTTPError as exc:
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise RetryableFetchError(exc) from exc
+        raise
+    return response
+
+
+def _feed_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _feed_entries(body: bytes, engine: str) -> Iterator:
+    if engine == "stream":
+        try:
+            yield from iter_feed_entries(body)
+        except ET.ParseError as exc:
+            logger.warning("Feed parse warning: %s", exc)
+        return
 
-    raise RuntimeError(f"Exhausted retries for RSS feed: {feed_url}")
+    parsed = feedparser.parse(body)
+    if parsed.bozo:
+        logger.warning("Feed parse warning: %s", parsed.bozo_exception)
+    yield from parsed.entries
 
 
-def _signal_exists(db, *, url: str, source_type: str, source_id: str) -> tuple[bool, bool]:
-    url_stmt = select(Signal.id).where(Signal.url == url)
-    source_stmt = select(Signal.id).where((Signal.source_type == source_type) & (Signal.source_id == source_id))
-    url_match = db.execute(url_stmt).scalar_one_or_none() is not None
-    source_match = db.execute(source_stmt).scalar_one_or_none() is not None
-    return url_match, source_match
+def _existing_signal_keys(
+    db,
+    *,
+    source_type: str,
+    urls: list[str],
+    source_ids: list[str],
+) -> tuple[set[str], set[str]]:
+    if not urls and not source_ids:
+        return set(), set()
+    query = select(Signal.url, Signal.source_id, Signal.source_type).where(
+        or_(
+            Signal.url.in_(urls),
+            and_(Signal.source_type == source_type, Signal.source_id.in_(source_ids)),
+        )
+    )
+    known_urls: set[str] = set()
+    known_source_ids: set[str] = set()
+    for row in db.execute(query):
+        known_urls.add(row.url)
+        if row.source_type == source_type:
+            known_source_ids.add(row.source_id)
+    return known_urls, known_source_ids
 
 
 def _extract_entry_fields(entry) -> tuple[str, str, str, str, datetime]:
@@ -63,7 +127,7 @@ def _extract_entry_fields(entry) -> tuple[str, str, str, str, datetime]:
     title = getattr(entry, "title", "") or "(untitled)"
     summary = getattr(entry, "summary", "") or getattr(entry, "description", "") or ""
     link = getattr(entry, "link", "")
-    source_id = getattr(entry, "id", None) or (sha256(link.encode("utf-8")).hexdigest() if link else "")
+    source_id = getattr(entry, "id", None) or getattr(entry, "guid", None) or (sha256(link.encode("utf-8")).hexdigest() if link else "")
     datetime_entry = SimpleNamespace(
         published=getattr(entry, "published", None),
         updated=getattr(entry, "updated", None),
@@ -72,94 +136,439 @@ def _extract_entry_fields(entry) -> tuple[str, str, str, str, datetime]:
     return title, summary, link, source_id, published_at
 
 
+INGEST_COUNTERS = ("feeds_ok", "feeds_unchanged", "feeds_failed", "items_seen", "inserted", "duplicates")
+
+
+def merge_ingest_counts(results: Iterable[dict | None]) -> dict:
+    totals: Counter[str] = Counter()
+    for result in results:
+        for key in INGEST_COUNTERS:
+            totals[key] += (result or {}).get(key, 0)
+    return {"status": "ok", **{key: totals[key] for key in INGEST_COUNTERS}}
+
+
+def _log_ingest_totals(totals: dict) -> None:
+    logger.info(
+        "RSS ingest completed: feeds_ok=%s feeds_unchanged=%s feeds_failed=%s items_seen=%s "
+        "inserted=%s duplicates=%s",
+        *(totals[key] for key in INGEST_COUNTERS),
+    )
+
+
 @celery_app.task(name="jobs.ingest_rss")
-def ingest_rss() -> dict:
+def ingest_rss(profile: bool = False, fan_out: bool | None = None) -> dict:
+    # By default each feed runs as its own fetch_feed -> ingest_feed chain and a chord
+    # callback aggregates the counters. fan_out=False runs every feed in this process.
+    # profile=True always runs in process and dumps a cProfile report to PROFILING_DIR;
+    # downloads run on the fetcher's threads and appear only as waits in the profile.
     settings = get_settings()
-    rss_urls = [url.strip() for url in settings.rss_urls.split(",") if url.strip()]
+    if profile:
+        with profile_to_file(profile_path(settings.profiling_dir, "ingest_rss")):
+            return _ingest_rss()
+    if not (settings.rss_ingest_fan_out if fan_out is None else fan_out):
+        return _ingest_rss()
 
-    feeds_ok = 0
-    feeds_failed = 0
-    items_seen = 0
-    inserted = 0
-    duplicates = 0
+    return _dispatch_feeds(_rss_urls(settings))
 
-    session = requests.Session()
 
+@celery_app.task(name="jobs.dispatch_due_feeds")
+def dispatch_due_feeds() -> dict:
+    # Run by beat every RSS_SCHEDULER_TICK_SECONDS; dispatches only the feeds whose
+    # adaptive next_poll_at has passed (see app.services.feed_schedule).
+    settings = get_settings()
+    now = datetime.now(timezone.utc)
     with SessionLocal() as db:
-        incident_service = IncidentService(db=db, settings=settings)
-
-        for feed_url in rss_urls:
-            try:
-                response = _fetch_feed(session, feed_url)
-            except requests.RequestException as exc:
-                logger.warning("Failed to fetch RSS feed source=%s error=%s", feed_url, exc)
-                feeds_failed += 1
-                continue
+        feed_states = FeedStateRepository(db)
+        due = feed_states.due(_rss_urls(settings), now)
+        lease_seconds = (
+            settings.rss_fetch_soft_time_limit_seconds
+            + settings.rss_ingest_soft_time_limit_seconds
+            + 2 * HARD_TIME_LIMIT_GRACE_SECONDS
+        )
+        feed_states.lease(due, now + timedelta(seconds=lease_seconds))
+        db.commit()
+    return _dispatch_feeds(due)
+
+
+def _dispatch_feeds(feed_urls: list[str]) -> dict:
+    if not feed_urls:
+        return merge_ingest_counts([])
+    result = chord([fetch_feed.s(url) | ingest_feed.s() for url in feed_urls])(aggregate_rss_ingest.s())
+    return {"status": "dispatched", "feeds": len(feed_urls), "aggregate_task_id": result.id}
+
+
+@celery_app.task(
+    bind=True,
+    name="jobs.fetch_feed",
+    rate_limit=_task_settings.rss_fetch_rate_limit or None,
+    soft_time_limit=_task_settings.rss_fetch_soft_time_limit_seconds,
+    time_limit=_task_settings.rss_fetch_soft_time_limit_seconds + HARD_TIME_LIMIT_GRACE_SECONDS,
+)
+def fetch_feed(self, feed_url: str, attempt: int = 1) -> dict:
+    # Downloads and parses one feed on the fetch queue. Only the entries past the feed's
+    # high-water mark go on to ingest_feed, never the feed body. Never raises except to
+    # retry: a failed download comes back as an error for ingest_feed to record.
+    try:
+        return _fetch_and_parse(self, feed_url, attempt)
+    except Retry:
+        raise
+    except Exception as exc:
+        logger.exception("Failed to fetch RSS feed source=%s", feed_url)
+        return {"feed_url": feed_url, "error": type(exc).__name__}
+
+
+def _fetch_and_parse(task, feed_url: str, attempt: int) -> dict:
+    settings = get_settings()
+    wait_seconds = get_host_rate_limiter().acquire(feed_host(feed_url))
+    if wait_seconds > 0:
+        raise task.retry(countdown=wait_seconds, args=(feed_url,), kwargs={"attempt": attempt}, max_retries=None)
+
+    # A short read-only session, so no connection is held while the feed downloads.
+    with SessionLocal() as db:
+        state = FeedStateRepository(db).get_many([feed_url]).get(feed_url)
+    etag, last_modified = (state.etag, state.last_modified) if state else (None, None)
+    try:
+        response = _fetch_feed(_task_feed_session(), feed_url, etag, last_modified)
+    except RetryableFetchError as exc:
+        if attempt < RETRY_ATTEMPTS:
+            raise task.retry(
+                countdown=settings.rss_fetch_backoff_seconds * 2 ** (attempt - 1),
+                args=(feed_url,),
+                kwargs={"attempt": attempt + 1},
+                max_retries=None,
+            )
+        error: Exception = exc.cause
+    except (requests.RequestException, SoftTimeLimitExceeded) as exc:
+        error = exc
+    else:
+        return _parse_feed_response(
+            settings,
+            feed_url,
+            state,
+            fetched_at=datetime.now(timezone.utc),
+            status_code=response.status_code,
+            content=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    logger.warning("Failed to fetch RSS feed source=%s error=%s: %s", feed_url, type(error).__name__, error)
+    return {"feed_url": feed_url, "error": type(error).__name__}
+
+
+@celery_app.task(
+    name="jobs.ingest_feed",
+    soft_time_limit=_task_settings.rss_ingest_soft_time_limit_seconds,
+    time_limit=_task_settings.rss_ingest_soft_time_limit_seconds + HARD_TIME_LIMIT_GRACE_SECONDS,
+)
+def ingest_feed(parsed: dict) -> dict:
+    # Writes one parsed feed on the ingest_db queue. Never raises: failures come back as
+    # counters so the chord callback still runs for the other feeds.
+    try:
+        return _ingest_parsed_feed(parsed)
+    except Exception:
+        logger.exception("Failed to ingest RSS feed source=%s", parsed.get("feed_url"))
+        return {"feeds_failed": 1}
+
+
+def _ingest_parsed_feed(parsed: dict) -> dict:
+    settings = get_settings()
+    feed_url = parsed["feed_url"]
+    with SessionLocal() as db:
+        feed_states = FeedStateRepository(db)
+        state = feed_states.get_many([feed_url]).get(feed_url)
+        if parsed.get("error"):
+            _record_poll(feed_states, feed_url, state, PollOutcome(ok=False))
+            db.commit()
+            return {"feeds_failed": 1}
+
+        incident_service = IncidentService(
+            db=db,
+            settings=settings,
+            active_incidents=get_active_incident_set() if settings.active_incident_cache_enabled else None,
+            response_cache=get_response_cache(),
+        )
+        try:
+            return _store_parsed_feed(db, settings, incident_service, feed_states, state, parsed)
+        except Exception:
+            db.rollback()
+            raise
+
+
+@celery_app.task(name="jobs.aggregate_rss_ingest")
+def aggregate_rss_ingest(results: list[dict]) -> dict:
+    totals = merge_ingest_counts(results)
+    _log_ingest_totals(totals)
+    return totals
 
-            parsed = feedparser.parse(response.content)
-            if parsed.bozo:
-                logger.warning("Feed parse warning for source=%s: %s", feed_url, parsed.bozo_exception)
-            feeds_ok += 1
-
-            for entry in parsed.entries:
-                items_seen += 1
-                title, summary, link, source_id, published_at = _extract_entry_fields(entry)
-
-                if not link:
-                    continue
-
-                source_type = "rss"
-                url_match, source_match = _signal_exists(db, url=link, source_type=source_type, source_id=source_id)
-                if is_duplicate(url_match=url_match, source_match=source_match):
-                    duplicates += 1
-                    continue
-
-                extracted_text = "\n".join((title, summary)).strip()
-                features = {
-                    "feed_url": feed_url,
-                    "source": "rss",
-                    "keyword_hits": keyword_hits(extracted_text),
-                }
-
-                payload = SignalPayload(
-                    source_type=source_type,
-                    source_id=source_id,
-                    title=title,
-                    content=summary,
-                    url=link,
-                    observed_at=published_at,
-                    latitude=0.0,
-                    longitude=0.0,
-                )
-                # RSS ingestion should not depend on geocoding. We ingest with
-                # a neutral coordinate and let downstream enrichment improve it.
-                signal = incident_service.ingest_signal(payload)
-                signal.created_at = published_at
-                signal.fetched_at = datetime.now(timezone.utc)
-                signal.extracted_text = extracted_text
-                signal.extracted_location_text = extract_location_text(extracted_text)
-                signal.features = features
+
+@lru_cache
+def _task_feed_session() -> requests.Session:
+    return _feed_session(get_settings().rss_fetch_per_host_limit)
+
+
+@lru_cache
+def get_host_rate_limiter() -> HostRateLimiter:
+    settings = get_settings()
+    client = redis.Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.response_cache_socket_timeout_seconds,
+        socket_connect_timeout=settings.response_cache_socket_timeout_seconds,
+    )
+    return HostRateLimiter(client, per_minute=settings.rss_fetch_per_host_per_minute)
+
+
+def _rss_urls(settings) -> list[str]:
+    return [url.strip() for url in settings.rss_urls.split(",") if url.strip()]
+
+
+def _ingest_rss() -> dict:
+    settings = get_settings()
+    rss_urls = _rss_urls(settings)
+    results: list[dict] = []
+
+    session = _feed_session(settings.rss_fetch_concurrency)
+
+    with SessionLocal() as db:
+        active_incidents = get_active_incident_set() if settings.active_incident_cache_enabled else None
+        incident_service = IncidentService(
+            db=db,
+            settings=settings,
+            active_incidents=active_incidents,
+            response_cache=get_response_cache(),
+        )
+        feed_states = FeedStateRepository(db)
+        known_states = feed_states.get_many(rss_urls)
+        validators = {url: (state.etag, state.last_modified) for url, state in known_states.items()}
+        fetcher = ConcurrentFetcher(
+            lambda url: _fetch_feed(session, url, *validators.get(url, (None, None))),
+            max_workers=settings.rss_fetch_concurrency,
+            per_host_limit=settings.rss_fetch_per_host_limit,
+            retry_attempts=RETRY_ATTEMPTS,
+            backoff_seconds=settings.rss_fetch_backoff_seconds,
+        )
+
+        # Feeds are parsed and written as each download completes; the rest keep
+        # downloading on the fetcher's pool in the meantime.
+        for result in fetcher.fetch_all(rss_urls):
+            if result.error is not None:
+                logger.warning("Failed to fetch RSS feed source=%s error=%s", result.url, result.error)
+                results.append({"feeds_failed": 1})
+                _record_poll(feed_states, result.url, known_states.get(result.url), PollOutcome(ok=False))
                 db.commit()
-                inserted += 1
+                continue
+            response = result.response
+            state = known_states.get(result.url)
+            parsed = _parse_feed_response(
+                settings,
+                result.url,
+                state,
+                fetched_at=datetime.now(timezone.utc),
+                status_code=response.status_code,
+                content=response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            results.append(_store_parsed_feed(db, settings, incident_service, feed_states, state, parsed))
 
     session.close()
 
-    logger.info(
-        "RSS ingest completed: feeds_ok=%s feeds_failed=%s items_seen=%s inserted=%s duplicates=%s",
-        feeds_ok,
-        feeds_failed,
-        items_seen,
-        inserted,
-        duplicates,
-    )
-    return {
-        "status": "ok",
-        "feeds_ok": feeds_ok,
-        "feeds_failed": feeds_failed,
-        "items_seen": items_seen,
-        "inserted": inserted,
-        "duplicates": duplicates,
+    if active_incidents is not None:
+        logger.info(
+            "Active incident cache: size=%s lookups=%s coverage=%.3f fallbacks=%s",
+            len(active_incidents),
+            active_incidents.stats.lookups,
+            active_incidents.stats.coverage,
+            active_incidents.stats.fallbacks,
+        )
+    totals = merge_ingest_counts(results)
+    _log_ingest_totals(totals)
+    return totals
+
+
+# Parses one downloaded feed into the entries past its high-water mark, without touching
+# the database. The result is plain JSON, small enough to pass from fetch_feed to
+# ingest_feed through the broker; the in-process run hands it straight to
+# _store_parsed_feed.
+def _parse_feed_response(
+    settings,
+    feed_url: str,
+    state: FeedState | None,
+    *,
+    fetched_at: datetime,
+    status_code: int,
+    content: bytes,
+    etag: str | None,
+    last_modified: str | None,
+) -> dict:
+    parsed = {
+        "feed_url": feed_url,
+        "fetched_at": fetched_at.isoformat(),
+        "etag": etag,
+        "last_modified": last_modified,
+        "content_hash": None if status_code == 304 else content_hash(content),
+        "changed": False,
+        "high_water_mark": None,
+        "items_seen": 0,
+        "entries": [],
     }
+    if parsed["content_hash"] is None or parsed["content_hash"] == (state.content_hash if state else None):
+        return parsed
+
+    high_water_mark = state.high_water_mark if state else None
+    newest_key = None
+    newest_at = None
+    with stage_timer("parse"):
+        for entry in entries_since(_feed_entries(content, settings.rss_parser_engine), high_water_mark):
+            # The mark is the most recently dated entry, wherever the feed lists it.
+            published = entry_timestamp(entry)
+            if newest_key is None or (published is not None and (newest_at is None or published > newest_at)):
+                newest_key, newest_at = entry_key(entry), published
+            parsed["items_seen"] += 1
+            title, summary, link, source_id, published_at = _extract_entry_fields(entry)
+            if link:
+                parsed["entries"].append([title, summary, link, source_id, published_at.isoformat()])
+    parsed.update(changed=True, high_water_mark=newest_key)
+    return parsed
+
+
+# Dedupes and ingests one parsed feed, then commits. Shared by the in-process run and the
+# per-feed ingest_feed task; returns that feed's share of the run counters.
+def _store_parsed_feed(
+    db,
+    settings,
+    incident_service: IncidentService,
+    feed_states: FeedStateRepository,
+    state: FeedState | None,
+    parsed: dict,
+) -> dict:
+    feed_url = parsed["feed_url"]
+    fetched_at = datetime.fromisoformat(parsed["fetched_at"])
+    counts = {"feeds_ok": 1, "items_seen": parsed["items_seen"], "inserted": 0, "duplicates": 0}
+
+    if not parsed["changed"]:
+        feed_states.record_fetch(
+            feed_url,
+            fetched_at=fetched_at,
+            etag=parsed["etag"] or (state.etag if state else None),
+            last_modified=parsed["last_modified"] or (state.last_modified if state else None),
+            content_hash=state.content_hash if state else None,
+            changed=False,
+        )
+        _record_poll(feed_states, feed_url, state, PollOutcome(ok=True))
+        db.commit()
+        return {**counts, "feeds_unchanged": 1}
+
+    source_type = "rss"
+    entries = [
+        (title, summary, link, source_id, datetime.fromisoformat(published_at))
+        for title, summary, link, source_id, published_at in parsed["entries"]
+    ]
+
+    # Validators are committed together with the feed's signals, so a failed
+    # ingest leaves the old hash in place and the feed is retried next run.
+    feed_states.record_fetch(
+        feed_url,
+        fetched_at=fetched_at,
+        etag=parsed["etag"],
+        last_modified=parsed["last_modified"],
+        content_hash=parsed["content_hash"],
+        changed=True,
+        high_water_mark=parsed["high_water_mark"],
+    )
+
+    with stage_timer("dedupe"):
+        known_urls, known_source_ids = _existing_signal_keys(
+            db,
+            source_type=source_type,
+            urls=[link for _, _, link, _, _ in entries],
+            source_ids=[source_id for _, _, _, source_id, _ in entries],
+        )
+
+    payloads: list[SignalPayload] = []
+    for title, summary, link, source_id, published_at in entries:
+        url_match = link in known_urls
+        source_match = source_id in known_source_ids
+        if is_duplicate(url_match=url_match, source_match=source_match):
+            counts["duplicates"] += 1
+            continue
+        known_urls.add(link)
+        known_source_ids.add(source_id)
+
+        extracted_text = "\n".join((title, summary)).strip()
+        tier_hits = KEYWORD_REGISTRY.hits(extracted_text)
+        features = {
+            "feed_url": feed_url,
+            "source": "rss",
+            "keyword_hits": tier_hits["feed"],
+            "confidence_keyword_hits": confidence_keyword_hits(extracted_text, tier_hits),
+        }
+
+        # RSS ingestion should not depend on geocoding. We ingest at UNLOCATED
+        # and let downstream enrichment improve it.
+        payloads.append(
+            SignalPayload(
+                source_type=source_type,
+                source_id=source_id,
+                title=title,
+                content=summary,
+                url=link,
+                observed_at=published_at,
+                latitude=UNLOCATED[0],
+                longitude=UNLOCATED[1],
+                extracted_text=extracted_text,
+                extracted_location_text=extract_location_text(extracted_text),
+                features=features,
+                fetched_at=datetime.now(timezone.utc),
+                created_at=published_at,
+            )
+        )
+
+    try:
+        inserted = incident_service.ingest_many(payloads)
+        counts["inserted"] = len(inserted)
+        max_confidence = IncidentRepository(db).max_confidence_for_signals(inserted)
+        outcome = PollOutcome(
+            ok=True,
+            new_items=len(inserted),
+            high_confidence=max_confidence >= settings.rss_poll_burst_min_confidence,
+        )
+        _record_poll(feed_states, feed_url, state, outcome)
+        db.commit()
+    except SQLAlchemyError as exc:
+        # The feed's schedule is left as it was (or leased by the dispatcher), so it is
+        # retried on the next tick after the lease rather than backed off.
+        db.rollback()
+        logger.warning("Failed to ingest RSS feed source=%s error=%s", feed_url, exc)
+    return counts
+
+
+def _record_poll(
+    feed_states: FeedStateRepository,
+    feed_url: str,
+    state: FeedState | None,
+    outcome: PollOutcome,
+) -> None:
+    schedule = compute_next_poll(poll_state(state), outcome, datetime.now(timezone.utc), poll_policy(get_settings()))
+    feed_states.record_poll(feed_url, schedule)
+
+
+@celery_app.task(name="jobs.rescore_incidents")
+def rescore_incidents() -> dict:
+    settings = get_settings()
+    with SessionLocal() as db:
+        rescored = IncidentService(db=db, settings=settings, response_cache=get_response_cache()).recompute_scores()
+    logger.info("Recomputed confidence scores for %s incidents", rescored)
+    return {"status": "ok", "rescored": rescored}
+
+
+@celery_app.task(name="jobs.repair_incident_extents")
+def repair_incident_extents() -> dict:
+    settings = get_settings()
+    with SessionLocal() as db:
+        repaired = IncidentService(db=db, settings=settings, response_cache=get_response_cache()).repair_extents()
+    logger.info("Recomputed signal aggregates and centroids for %s incidents", repaired)
+    return {"status": "ok", "repaired": repaired}
 
 
 @celery_app.task(name="jobs.ingest_reddit")
@@ -1,10 +1,19 @@
 from fastapi import FastAPI
 
+from app.api.exports import router as exports_router
+from app.api.middleware import MetricsMiddleware
 from app.api.routes import router
+from app.api.tiles import router as tiles_router
 from app.core.config import get_settings
 from app.core.logging import configure_logging
+from app.core.profiling import ProfilingMiddleware
 
 configure_logging()
 settings = get_settings()
 app = FastAPI(title=settings.app_name)
+app.add_middleware(MetricsMiddleware)
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware, directory=settings.profiling_dir)
 app.include_router(router)
+app.include_router(tiles_router)
+app.include_router(exports_router)
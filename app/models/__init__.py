@@ -1,3 +1,3 @@
-from app.models.entities import Boundary, Incident, IncidentFeedback, IncidentSignal, Signal
+from app.models.entities import Boundary, FeedState, Incident, IncidentFeedback, IncidentSignal, Signal
 
-__all__ = ["Boundary", "Signal", "Incident", "IncidentSignal", "IncidentFeedback"]
+__all__ = ["Boundary", "Signal", "Incident", "IncidentSignal", "IncidentFeedback", "FeedState"]
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 
 from geoalchemy2 import Geometry
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,6 +21,10 @@ class Boundary(Base):
 
 class Signal(Base):
     __tablename__ = "signals"
+    __table_args__ = (
+        Index("uq_signals_source_type_source_id", "source_type", "source_id", unique=True),
+        Index("ix_signals_url", "url", postgresql_using="hash"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     source_type: Mapped[str] = mapped_column(String(50), index=True)
@@ -43,15 +47,27 @@ class Signal(Base):
 
 class Incident(Base):
     __tablename__ = "incidents"
+    __table_args__ = (Index("ix_incidents_last_seen_id", "last_seen", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     first_seen: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
     last_seen: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
     confidence_score: Mapped[float] = mapped_column(Float, default=0.0, index=True)
     score_breakdown: Mapped[dict] = mapped_column(JSONB, default=dict)
+    score_state: Mapped[dict] = mapped_column(JSONB, default=dict)
     centroid = mapped_column(Geometry(geometry_type="POINT", srid=4326, spatial_index=True), nullable=False)
+    # Running aggregates over linked signals; centroid is (latitude_sum, longitude_sum) / signal_count.
+    signal_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    latitude_sum: Mapped[float] = mapped_column(Float, default=0.0, server_default="0")
+    longitude_sum: Mapped[float] = mapped_column(Float, default=0.0, server_default="0")
+    min_latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    min_longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    max_latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    max_longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True
+    )
 
     signal_links: Mapped[list[IncidentSignal]] = relationship(back_populates="incident", cascade="all, delete-orphan")
 
@@ -60,7 +76,9 @@ class IncidentSignal(Base):
     __tablename__ = "incident_signals"
 
     incident_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("incidents.id", ondelete="CASCADE"), primary_key=True)
-    signal_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("signals.id", ondelete="CASCADE"), primary_key=True)
+    signal_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("signals.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
     linked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     incident: Mapped[Incident] = relationship(back_populates="signal_links")
@@ -75,3 +93,21 @@ class IncidentFeedback(Base):
     status: Mapped[str] = mapped_column(String(50))
     notes: Mapped[str] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class FeedState(Base):
+    __tablename__ = "feed_state"
+
+    feed_url: Mapped[str] = mapped_column(String(1000), primary_key=True)
+    etag: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    high_water_mark: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    last_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_changed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_poll_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    poll_interval_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+    avg_new_items: Mapped[float] = mapped_column(Float, default=0.0, server_default="0")
+    error_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    burst_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
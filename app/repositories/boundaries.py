@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from geoalchemy2.elements import WKBElement
+from sqlalchemy import Float, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.models import Boundary
+
+
+class BoundaryRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def fingerprint(self, name: str) -> tuple[str, int] | None:
+        # A content hash stands in for a version column: boundaries are loaded by hand,
+        # so there is no reliable updated_at to compare.
+        row = self.db.execute(
+            select(func.md5(func.ST_AsEWKB(Boundary.geom)).label("digest"), func.ST_NPoints(Boundary.geom).label("vertices"))
+            .where(Boundary.name == name)
+        ).first()
+        return (row.digest, row.vertices) if row else None
+
+    def geometry(self, name: str) -> WKBElement | None:
+        return self.db.scalar(select(Boundary.geom).where(Boundary.name == name))
+
+    def contains_many(self, name: str, latitudes: Sequence[float], longitudes: Sequence[float]) -> list[bool]:
+        if not latitudes:
+            return []
+        points = func.unnest(
+            bindparam("lons", list(map(float, longitudes)), type_=ARRAY(Float)),
+            bindparam("lats", list(map(float, latitudes)), type_=ARRAY(Float)),
+        ).table_valued("lon", "lat", with_ordinality="ord").render_derived(name="points")
+        query = (
+            select(func.ST_Contains(Boundary.geom, func.ST_SetSRID(func.ST_MakePoint(points.c.lon, points.c.lat), 4326)))
+            .select_from(points)
+            .join(Boundary, Boundary.name == name)
+            .order_by(points.c.ord)
+        )
+        return [bool(inside) for inside in self.db.scalars(query)]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, Row, Select, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from app.models import Incident, IncidentSignal, Signal
+from app.repositories.incidents import SUMMARY_COLUMNS
+
+EXPORT_BATCH_ROWS = 1000
+
+
+# Export reads run on a server-side cursor (yield_per implies stream_results), so rows
+# arrive from the database in batches and memory stays flat however large the export is.
+class ExportRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def incident_rows(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> Iterator[Row]:
+        query = select(*SUMMARY_COLUMNS)
+        query = self._filtered(query, Incident.last_seen, Incident.centroid, since, until, bbox)
+        return self._stream(query.order_by(Incident.last_seen, Incident.id))
+
+    def signal_rows(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> Iterator[Row]:
+        # Membership is aggregated per row in SQL (served by the signal_id index) rather
+        # than loaded per signal from Python.
+        incident_ids = (
+            select(func.coalesce(func.array_agg(IncidentSignal.incident_id), literal_column("'{}'::uuid[]")))
+            .where(IncidentSignal.signal_id == Signal.id)
+            .scalar_subquery()
+            .label("incident_ids")
+        )
+        query = select(
+            Signal.id,
+            Signal.source_type,
+            Signal.source_id,
+            Signal.title,
+            Signal.url,
+            Signal.observed_at,
+            Signal.latitude,
+            Signal.longitude,
+            Signal.extracted_location_text,
+            incident_ids,
+        )
+        query = self._filtered(query, Signal.observed_at, Signal.geom, since, until, bbox)
+        return self._stream(query.order_by(Signal.observed_at, Signal.id))
+
+    def _filtered(
+        self,
+        query: Select,
+        timestamp: ColumnElement,
+        geom: ColumnElement,
+        since: datetime | None,
+        until: datetime | None,
+        bbox: tuple[float, float, float, float] | None,
+    ) -> Select:
+        if since is not None:
+            query = query.where(timestamp >= since)
+        if until is not None:
+            query = query.where(timestamp < until)
+        if bbox is not None:
+            query = query.where(func.ST_Intersects(geom, func.ST_MakeEnvelope(*bbox, 4326)))
+        return query
+
+    def _stream(self, query: Select) -> Iterator[Row]:
+        yield from self.db.execute(query.execution_options(yield_per=EXPORT_BATCH_ROWS))
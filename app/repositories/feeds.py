@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import FeedState
+from app.services.feed_schedule import PollState
+
+
+class FeedStateRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get_many(self, feed_urls: list[str]) -> dict[str, FeedState]:
+        query = select(FeedState).where(FeedState.feed_url.in_(feed_urls))
+        return {state.feed_url: state for state in self.db.scalars(query)}
+
+    def due(self, feed_urls: list[str], now: datetime) -> list[str]:
+        # Feeds never polled have no row (or no next_poll_at) and are always due.
+        query = select(FeedState.feed_url).where(FeedState.feed_url.in_(feed_urls), FeedState.next_poll_at > now)
+        scheduled = set(self.db.scalars(query))
+        return [url for url in feed_urls if url not in scheduled]
+
+    def lease(self, feed_urls: list[str], until: datetime) -> None:
+        # Pushes next_poll_at past the dispatched run so the next scheduler tick does not
+        # dispatch the same feeds again; the run's own record_poll replaces it.
+        for feed_url in feed_urls:
+            self._state(feed_url).next_poll_at = until
+
+    def record_poll(self, feed_url: str, schedule: PollState) -> FeedState:
+        state = self._state(feed_url)
+        state.poll_interval_seconds = schedule.interval_seconds
+        state.avg_new_items = schedule.avg_new_items
+        state.error_streak = schedule.error_streak
+        state.burst_until = schedule.burst_until
+        state.next_poll_at = schedule.next_poll_at
+        return state
+
+    def record_fetch(
+        self,
+        feed_url: str,
+        *,
+        fetched_at: datetime,
+        etag: str | None,
+        last_modified: str | None,
+        content_hash: str | None,
+        changed: bool,
+        high_water_mark: str | None = None,
+    ) -> FeedState:
+        state = self._state(feed_url)
+        state.etag = etag
+        state.last_modified = last_modified
+        state.content_hash = content_hash
+        state.last_fetched_at = fetched_at
+        if changed:
+            state.last_changed_at = fetched_at
+        if high_water_mark:
+            state.high_water_mark = high_water_mark
+        return state
+
+    def _state(self, feed_url: str) -> FeedState:
+        state = self.db.get(FeedState, feed_url)
+        if state is None:
+            state = FeedState(feed_url=feed_url, avg_new_items=0.0, error_streak=0)
+            self.db.add(state)
+        return state
+
+
+def poll_state(state: FeedState | None) -> PollState | None:
+    if state is None or state.poll_interval_seconds is None:
+        return None
+    return PollState(
+        interval_seconds=state.poll_interval_seconds,
+        avg_new_items=state.avg_new_items or 0.0,
+        error_streak=state.error_streak or 0,
+        burst_until=state.burst_until,
+        next_poll_at=state.next_poll_at,
+    )
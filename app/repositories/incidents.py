@@ -3,11 +3,115 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from geoalchemy2.shape import to_shape
-from sqlalchemy import and_, func, select
+from sqlalchemy import Row, Select, Update, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
-from app.models import Boundary, Incident, IncidentFeedback, IncidentSignal, Signal
+from app.models import Incident, IncidentFeedback, IncidentSignal, Signal
+from app.services.boundaries import get_boundary_cache
+
+
+# Read paths select plain columns, with the centroid split into floats by PostGIS, so
+# listing skips ORM identity-map bookkeeping and WKB decoding in Python.
+SUMMARY_COLUMNS = (
+    Incident.id,
+    Incident.first_seen,
+    Incident.last_seen,
+    Incident.confidence_score,
+    Incident.score_breakdown,
+    func.ST_Y(Incident.centroid).label("latitude"),
+    func.ST_X(Incident.centroid).label("longitude"),
+    Incident.signal_count,
+    Incident.min_latitude,
+    Incident.min_longitude,
+    Incident.max_latitude,
+    Incident.max_longitude,
+)
+
+
+# Repair path for the running aggregates: recomputes count, sums, extent and centroid from
+# the linked signals in one set-wise UPDATE, for all incidents or the given ids.
+def repair_extents_statement(incident_ids: list[UUID] | None = None) -> Update:
+    stats = (
+        select(
+            IncidentSignal.incident_id,
+            func.count().label("signal_count"),
+            func.sum(Signal.latitude).label("latitude_sum"),
+            func.sum(Signal.longitude).label("longitude_sum"),
+            func.min(Signal.latitude).label("min_latitude"),
+            func.min(Signal.longitude).label("min_longitude"),
+            func.max(Signal.latitude).label("max_latitude"),
+            func.max(Signal.longitude).label("max_longitude"),
+        )
+        .join(Signal, Signal.id == IncidentSignal.signal_id)
+        .group_by(IncidentSignal.incident_id)
+    )
+    if incident_ids is not None:
+        stats = stats.where(IncidentSignal.incident_id.in_(incident_ids))
+    stats = stats.subquery("stats")
+    return (
+        update(Incident)
+        .where(Incident.id == stats.c.incident_id)
+        .values(
+            signal_count=stats.c.signal_count,
+            latitude_sum=stats.c.latitude_sum,
+            longitude_sum=stats.c.longitude_sum,
+            min_latitude=stats.c.min_latitude,
+            min_longitude=stats.c.min_longitude,
+            max_latitude=stats.c.max_latitude,
+            max_longitude=stats.c.max_longitude,
+            centroid=func.ST_SetSRID(
+                func.ST_MakePoint(
+                    stats.c.longitude_sum / stats.c.signal_count,
+                    stats.c.latitude_sum / stats.c.signal_count,
+                ),
+                4326,
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def incident_summary_query(incident_id: UUID) -> Select:
+    return select(*SUMMARY_COLUMNS).where(Incident.id == incident_id)
+
+
+def signal_rows_query(incident_id: UUID) -> Select:
+    return (
+        select(
+            Signal.id,
+            Signal.source_type,
+            Signal.title,
+            Signal.url,
+            Signal.observed_at,
+            Signal.latitude,
+            Signal.longitude,
+        )
+        .join(IncidentSignal, IncidentSignal.signal_id == Signal.id)
+        .where(IncidentSignal.incident_id == incident_id)
+    )
+
+
+def list_incidents_query(
+    since: datetime | None,
+    min_confidence: float,
+    bbox: tuple[float, float, float, float] | None = None,
+    limit: int | None = None,
+    after: tuple[datetime, UUID] | None = None,
+) -> Select:
+    query = select(*SUMMARY_COLUMNS).where(Incident.confidence_score >= min_confidence)
+    if since:
+        query = query.where(Incident.last_seen >= since)
+    if bbox is not None:
+        # ST_Intersects carries the && operator, so the centroid GiST index prunes rows.
+        envelope = func.ST_MakeEnvelope(*bbox, 4326)
+        query = query.where(func.ST_Intersects(Incident.centroid, envelope))
+    if after is not None:
+        query = query.where(tuple_(Incident.last_seen, Incident.id) < tuple_(*after))
+    query = query.order_by(Incident.last_seen.desc(), Incident.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
 
 
 class IncidentRepository:
@@ -22,15 +126,46 @@ class IncidentRepository:
         )
         return self.db.scalar(query)
 
+    def get_incident_summary(self, incident_id: UUID) -> Row | None:
+        return self.db.execute(incident_summary_query(incident_id)).first()
+
+    def list_signal_rows(self, incident_id: UUID) -> list[Row]:
+        return list(self.db.execute(signal_rows_query(incident_id)).all())
+
     def list_incidents(
         self,
         since: datetime | None,
         min_confidence: float,
-    ) -> list[Incident]:
-        query = select(Incident).where(Incident.confidence_score >= min_confidence)
-        if since:
-            query = query.where(Incident.last_seen >= since)
-        return list(self.db.scalars(query.order_by(Incident.last_seen.desc())).all())
+        bbox: tuple[float, float, float, float] | None = None,
+        limit: int | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Row]:
+        return list(self.db.execute(list_incidents_query(since, min_confidence, bbox, limit, after)).all())
+
+    def max_confidence_for_signals(self, signal_ids: list[UUID]) -> float:
+        if not signal_ids:
+            return 0.0
+        query = (
+            select(func.max(Incident.confidence_score))
+            .join(IncidentSignal, IncidentSignal.incident_id == Incident.id)
+            .where(IncidentSignal.signal_id.in_(signal_ids))
+        )
+        return self.db.scalar(query) or 0.0
+
+    def lock_for_repair(self, incident_ids: list[UUID]) -> list[UUID]:
+        # Row locks make ingest's extent UPDATE wait for the repair instead of adding to
+        # sums the repair is about to overwrite. Rows an ingest already holds are skipped,
+        # so the repair never waits on ingest and the two cannot deadlock.
+        query = (
+            select(Incident.id)
+            .where(Incident.id.in_(incident_ids))
+            .order_by(Incident.id)
+            .with_for_update(skip_locked=True)
+        )
+        return list(self.db.scalars(query))
+
+    def repair_extents(self, incident_ids: list[UUID] | None = None) -> int:
+        return self.db.execute(repair_extents_statement(incident_ids)).rowcount
 
     def create_feedback(self, incident_id: UUID, status: str, notes: str) -> IncidentFeedback:
         feedback = IncidentFeedback(incident_id=incident_id, status=status, notes=notes)
@@ -39,26 +174,27 @@ class IncidentRepository:
         self.db.refresh(feedback)
         return feedback
 
-    def bbox_filter(self, incidents: list[Incident], bbox: tuple[float, float, float, float] | None) -> list[Incident]:
-        if bbox is None:
-            return incidents
-        min_lon, min_lat, max_lon, max_lat = bbox
-        filtered: list[Incident] = []
-        for incident in incidents:
-            point = to_shape(incident.centroid)
-            if min_lon <= point.x <= max_lon and min_lat <= point.y <= max_lat:
-                filtered.append(incident)
-        return filtered
-
     def toronto_contains_signal(self, latitude: float, longitude: float, boundary_name: str) -> bool:
-        query = select(Boundary).where(Boundary.name == boundary_name)
-        boundary = self.db.scalar(query)
-        if not boundary:
-            return False
-        point_query = select(Boundary).where(
-            and_(
-                Boundary.id == boundary.id,
-                func.ST_Contains(Boundary.geom, func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)),
-            )
-        )
-        return self.db.scalar(point_query) is not None
+        return get_boundary_cache().contains(self.db, boundary_name, latitude, longitude)
+
+
+# Async counterpart of the read methods above for the API; both build the same queries.
+class AsyncIncidentRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_incident_summary(self, incident_id: UUID) -> Row | None:
+        return (await self.db.execute(incident_summary_query(incident_id))).first()
+
+    async def list_signal_rows(self, incident_id: UUID) -> list[Row]:
+        return list((await self.db.execute(signal_rows_query(incident_id))).all())
+
+    async def list_incidents(
+        self,
+        since: datetime | None,
+        min_confidence: float,
+        bbox: tuple[float, float, float, float] | None = None,
+        limit: int | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Row]:
+        return list((await self.db.execute(list_incidents_query(since, min_confidence, bbox, limit, after))).all())
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, ColumnElement, Select, String, cast, extract, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Incident, Signal
+
+WEB_MERCATOR_WIDTH_M = 40075016.685578488
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+MAX_ZOOM = 22
+THINNING_MAX_ZOOM = 12
+THINNING_CELL_PIXELS = 16
+
+
+def tile_in_range(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2**z and 0 <= y < 2**z
+
+
+def tile_size_meters(z: int) -> float:
+    return WEB_MERCATOR_WIDTH_M / 2**z
+
+
+# At low zooms points are thinned to one per grid cell of THINNING_CELL_PIXELS (on a
+# 256 px tile); the highest-priority point in each cell is kept.
+def thinning_cell_meters(z: int) -> float | None:
+    if z > THINNING_MAX_ZOOM:
+        return None
+    return tile_size_meters(z) / 256 * THINNING_CELL_PIXELS
+
+
+def _epoch(column: ColumnElement) -> ColumnElement:
+    return cast(extract("epoch", column), BigInteger)
+
+
+# MVT layers concatenate, so both layers come back from one round trip.
+def tile_query(z: int, x: int, y: int, min_confidence: float = 0.0) -> Select:
+    incidents = _layer(
+        "incidents",
+        z,
+        x,
+        y,
+        geom=Incident.centroid,
+        attributes=[
+            cast(Incident.id, String).label("id"),
+            Incident.confidence_score.label("confidence_score"),
+            _epoch(Incident.last_seen).label("last_seen"),
+        ],
+        filters=[Incident.confidence_score >= min_confidence],
+        priority=["confidence_score", "last_seen"],
+    )
+    signals = _layer(
+        "signals",
+        z,
+        x,
+        y,
+        geom=Signal.geom,
+        attributes=[
+            cast(Signal.id, String).label("id"),
+            Signal.source_type.label("source_type"),
+            _epoch(Signal.observed_at).label("observed_at"),
+        ],
+        filters=[],
+        priority=["observed_at"],
+    )
+    return select(incidents.scalar_subquery().op("||")(signals.scalar_subquery()))
+
+
+def _layer(
+    name: str,
+    z: int,
+    x: int,
+    y: int,
+    *,
+    geom: ColumnElement,
+    attributes: list[ColumnElement],
+    filters: list[ColumnElement],
+    priority: list[str],
+) -> Select:
+    envelope = func.ST_TileEnvelope(z, x, y)
+    # The search area is transformed to 4326 once so the GiST index on the stored
+    # geometry drives the && filter.
+    search_area = func.ST_Transform(func.ST_Expand(envelope, tile_size_meters(z) * TILE_BUFFER / TILE_EXTENT), 4326)
+    geom_3857 = func.ST_Transform(geom, 3857)
+    rows = select(*attributes, geom_3857.label("geom_3857")).where(geom.op("&&")(search_area), *filters)
+
+    cell = thinning_cell_meters(z)
+    if cell is not None:
+        rows = rows.add_columns(
+            func.floor(func.ST_X(geom_3857) / cell).label("cell_x"),
+            func.floor(func.ST_Y(geom_3857) / cell).label("cell_y"),
+        )
+        cells = rows.subquery("cells")
+        rows = (
+            select(cells)
+            .distinct(cells.c.cell_x, cells.c.cell_y)
+            .order_by(cells.c.cell_x, cells.c.cell_y, *(cells.c[column].desc() for column in priority))
+        )
+
+    source = rows.subquery("source")
+    mvt = (
+        select(
+            func.ST_AsMVTGeom(source.c.geom_3857, envelope, TILE_EXTENT, TILE_BUFFER, True).label("geom"),
+            *(source.c[attribute.key] for attribute in attributes),
+        )
+        .subquery("mvt")
+    )
+    return (
+        select(func.coalesce(func.ST_AsMVT(literal_column("mvt"), name, TILE_EXTENT, "geom"), b""))
+        .select_from(mvt)
+        .where(mvt.c.geom.is_not(None))
+    )
+
+
+class AsyncTileRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def tile(self, z: int, x: int, y: int, min_confidence: float = 0.0) -> bytes:
+        body = await self.db.scalar(tile_query(z, x, y, min_confidence))
+        return bytes(body or b"")
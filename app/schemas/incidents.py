@@ -12,6 +12,11 @@ class IncidentSummary(BaseModel):
     score_breakdown: dict
     latitude: float
     longitude: float
+    signal_count: int
+    min_latitude: float | None
+    min_longitude: float | None
+    max_latitude: float | None
+    max_longitude: float | None
 
 
 class SignalOut(BaseModel):
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from math import cos, floor, pi, radians
+from uuid import UUID
+
+from app.services.clustering import EARTH_RADIUS_M, IncidentCandidate, haversine_meters, window_cutoff
+
+METERS_PER_DEGREE = pi * EARTH_RADIUS_M / 180
+MIN_COS_LATITUDE = 0.01
+
+
+@dataclass
+class CacheStats:
+    lookups: int = 0
+    covered: int = 0
+    fallbacks: int = 0
+    refreshes: int = 0
+
+    # Share of lookups the cached window could answer, whether or not an incident matched.
+    @property
+    def coverage(self) -> float:
+        return self.covered / self.lookups if self.lookups else 0.0
+
+
+# Per-process working set of incidents that can still absorb new signals. Coordinates
+# and last_seen timestamps live in parallel float arrays indexed by slot; a fixed grid
+# of cells sized to the clustering distance maps to slots so a lookup only visits the
+# cells neighbouring the signal. Each process (every Celery prefork child) holds its own
+# copy, refreshed every refresh_seconds, so on its own it can miss an incident another
+# process just created. With clustering cell locks on, ingest upserts the locked
+# neighbourhood from the database before each lookup, so matches there are current.
+class ActiveIncidentSet:
+    __slots__ = (
+        "distance_m",
+        "horizon_hours",
+        "refresh_interval",
+        "stats",
+        "horizon",
+        "watermark",
+        "refreshed_at",
+        "_ids",
+        "_lat",
+        "_lon",
+        "_last_seen",
+        "_cell_of",
+        "_slot_by_id",
+        "_cells",
+        "_free",
+        "_cell_deg",
+    )
+
+    def __init__(self, distance_m: float, horizon_hours: int, refresh_seconds: int) -> None:
+        self.distance_m = distance_m
+        self.horizon_hours = horizon_hours
+        self.refresh_interval = timedelta(seconds=refresh_seconds)
+        self.stats = CacheStats()
+        self.horizon: datetime | None = None
+        self.watermark: datetime | None = None
+        self.refreshed_at: datetime | None = None
+        self._ids: list[UUID | None] = []
+        self._lat = array("d")
+        self._lon = array("d")
+        self._last_seen = array("d")
+        self._cell_of: list[tuple[int, int] | None] = []
+        self._slot_by_id: dict[UUID, int] = {}
+        self._cells: dict[tuple[int, int], set[int]] = {}
+        self._free: list[int] = []
+        self._cell_deg = distance_m / METERS_PER_DEGREE
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def needs_refresh(self, now: datetime) -> bool:
+        return self.refreshed_at is None or now - self.refreshed_at >= self.refresh_interval
+
+    def next_horizon(self, now: datetime) -> datetime:
+        return now - timedelta(hours=self.horizon_hours)
+
+    def apply_refresh(
+        self,
+        candidates: list[IncidentCandidate],
+        refreshed_at: datetime,
+        watermark: datetime | None,
+    ) -> None:
+        for candidate in candidates:
+            self.upsert(candidate)
+        self.horizon = self.next_horizon(refreshed_at)
+        self.evict_before(self.horizon)
+        if watermark is not None and (self.watermark is None or watermark > self.watermark):
+            self.watermark = watermark
+        self.refreshed_at = refreshed_at
+        self.stats.refreshes += 1
+
+    def invalidate(self) -> None:
+        self.refreshed_at = None
+        self.horizon = None
+        self.watermark = None
+        for incident_id in list(self._slot_by_id):
+            self._remove(incident_id)
+
+    def upsert(self, candidate: IncidentCandidate) -> None:
+        cell = self._cell_key(candidate.latitude, candidate.longitude)
+        last_seen = candidate.last_seen.timestamp()
+        slot = self._slot_by_id.get(candidate.id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._ids[slot] = candidate.id
+                self._lat[slot] = candidate.latitude
+                self._lon[slot] = candidate.longitude
+                self._last_seen[slot] = last_seen
+                self._cell_of[slot] = cell
+            else:
+                slot = len(self._ids)
+                self._ids.append(candidate.id)
+                self._lat.append(candidate.latitude)
+                self._lon.append(candidate.longitude)
+                self._last_seen.append(last_seen)
+                self._cell_of.append(cell)
+            self._slot_by_id[candidate.id] = slot
+            self._cells.setdefault(cell, set()).add(slot)
+            return
+
+        previous_cell = self._cell_of[slot]
+        if previous_cell != cell:
+            self._discard_from_cell(previous_cell, slot)
+            self._cells.setdefault(cell, set()).add(slot)
+            self._cell_of[slot] = cell
+        self._lat[slot] = candidate.latitude
+        self._lon[slot] = candidate.longitude
+        self._last_seen[slot] = max(self._last_seen[slot], last_seen)
+
+    def snapshot(self) -> list[IncidentCandidate]:
+        return [self._candidate(slot) for slot in self._slot_by_id.values()]
+
+    def evict_before(self, cutoff: datetime) -> int:
+        cutoff_ts = cutoff.timestamp()
+        expired = [
+            incident_id
+            for incident_id, slot in self._slot_by_id.items()
+            if self._last_seen[slot] < cutoff_ts
+        ]
+        for incident_id in expired:
+            self._remove(incident_id)
+        return len(expired)
+
+    def covers(self, observed_at: datetime, window_hours: int) -> bool:
+        return self.horizon is not None and window_cutoff(observed_at, window_hours) >= self.horizon
+
+    def lookup(
+        self,
+        latitude: float,
+        longitude: float,
+        observed_at: datetime,
+        window_hours: int,
+    ) -> tuple[bool, IncidentCandidate | None]:
+        self.stats.lookups += 1
+        if not self.covers(observed_at, window_hours):
+            self.stats.fallbacks += 1
+            return False, None
+        self.stats.covered += 1
+        return True, self.nearest(latitude, longitude, observed_at, window_hours)
+
+    def lookup_batch(
+        self,
+        oldest_observed_at: datetime,
+        window_hours: int,
+        count: int,
+    ) -> list[IncidentCandidate] | None:
+        self.stats.lookups += count
+        if not self.covers(oldest_observed_at, window_hours):
+            self.stats.fallbacks += count
+            return None
+        self.stats.covered += count
+        return self.snapshot()
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        observed_at: datetime,
+        window_hours: int,
+    ) -> IncidentCandidate | None:
+        cutoff_ts = window_cutoff(observed_at, window_hours).timestamp()
+        row, col = self._cell_key(latitude, longitude)
+        col_span = self._column_span(latitude)
+
+        closest_slot: int | None = None
+        closest_distance = float("inf")
+        for d_row in (-1, 0, 1):
+            for d_col in range(-col_span, col_span + 1):
+                for slot in self._cells.get((row + d_row, col + d_col), ()):
+                    if self._last_seen[slot] < cutoff_ts:
+                        continue
+                    distance = haversine_meters(latitude, longitude, self._lat[slot], self._lon[slot])
+                    if distance <= self.distance_m and distance < closest_distance:
+                        closest_distance = distance
+                        closest_slot = slot
+
+        if closest_slot is None:
+            return None
+        return self._candidate(closest_slot)
+
+    def _candidate(self, slot: int) -> IncidentCandidate:
+        incident_id = self._ids[slot]
+        assert incident_id is not None
+        return IncidentCandidate(
+            id=incident_id,
+            latitude=self._lat[slot],
+            longitude=self._lon[slot],
+            last_seen=datetime.fromtimestamp(self._last_seen[slot], tz=timezone.utc),
+        )
+
+    def _cell_key(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return floor(latitude / self._cell_deg), floor(longitude / self._cell_deg)
+
+    def _column_span(self, latitude: float) -> int:
+        # Cells are square in degrees, so a degree of longitude covers fewer metres
+        # away from the equator and more columns must be scanned to cover the radius.
+        cos_lat = max(cos(radians(min(abs(latitude) + self._cell_deg, 90.0))), MIN_COS_LATITUDE)
+        return int(1 / cos_lat) + 1
+
+    def _discard_from_cell(self, cell: tuple[int, int] | None, slot: int) -> None:
+        if cell is None:
+            return
+        members = self._cells.get(cell)
+        if members is None:
+            return
+        members.discard(slot)
+        if not members:
+            del self._cells[cell]
+
+    def _remove(self, incident_id: UUID) -> None:
+        slot = self._slot_by_id.pop(incident_id)
+        self._discard_from_cell(self._cell_of[slot], slot)
+        self._ids[slot] = None
+        self._cell_of[slot] = None
+        self._free.append(slot)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import shapely
+from geoalchemy2.shape import to_shape
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.repositories.boundaries import BoundaryRepository
+
+
+@dataclass
+class CachedBoundary:
+    fingerprint: str
+    vertices: int
+    geometry: BaseGeometry | None
+    checked_at: float
+
+
+# Per-process boundary polygons as prepared Shapely geometries, so point-in-city checks
+# run in memory. After the TTL a cheap fingerprint query decides whether to reload.
+# Polygons above max_vertices are not held; checks against them go to ST_Contains.
+class BoundaryCache:
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_vertices: int,
+        repository: Callable[[Session], BoundaryRepository] = BoundaryRepository,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_vertices = max_vertices
+        self.repository = repository
+        self.clock = clock
+        self._boundaries: dict[str, CachedBoundary] = {}
+
+    def contains(self, db: Session, name: str, latitude: float, longitude: float) -> bool:
+        return bool(self.contains_many(db, name, [latitude], [longitude])[0])
+
+    def contains_many(
+        self,
+        db: Session,
+        name: str,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+    ) -> np.ndarray:
+        boundary = self._boundary(db, name)
+        if boundary is None:
+            return np.zeros(len(latitudes), dtype=bool)
+        if boundary.geometry is None:
+            return np.array(self.repository(db).contains_many(name, latitudes, longitudes), dtype=bool)
+        return shapely.contains_xy(
+            boundary.geometry,
+            np.asarray(longitudes, dtype=float),
+            np.asarray(latitudes, dtype=float),
+        )
+
+    def invalidate(self, name: str | None = None) -> None:
+        if name is None:
+            self._boundaries.clear()
+        else:
+            self._boundaries.pop(name, None)
+
+    def _boundary(self, db: Session, name: str) -> CachedBoundary | None:
+        now = self.clock()
+        cached = self._boundaries.get(name)
+        if cached is not None and now - cached.checked_at < self.ttl_seconds:
+            return cached
+
+        repo = self.repository(db)
+        fingerprint = repo.fingerprint(name)
+        if fingerprint is None:
+            self._boundaries.pop(name, None)
+            return None
+        digest, vertices = fingerprint
+        if cached is not None and cached.fingerprint == digest:
+            cached.checked_at = now
+            return cached
+
+        geometry = None
+        if vertices <= self.max_vertices:
+            stored = repo.geometry(name)
+            if stored is not None:
+                geometry = to_shape(stored)
+                shapely.prepare(geometry)
+        cached = CachedBoundary(fingerprint=digest, vertices=vertices, geometry=geometry, checked_at=now)
+        self._boundaries[name] = cached
+        return cached
+
+
+@lru_cache
+def get_boundary_cache() -> BoundaryCache:
+    settings = get_settings()
+    return BoundaryCache(
+        ttl_seconds=settings.boundary_cache_ttl_seconds,
+        max_vertices=settings.boundary_cache_max_vertices,
+    )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from math import asin, cos, degrees, floor, inf, radians, sin, sqrt
 from uuid import UUID
-from math import asin, cos, radians, sin, sqrt
+
+import numpy as np
 
 
 @dataclass
@@ -14,7 +17,62 @@ class IncidentCandidate:
     last_seen: datetime
 
 
+# Running aggregates of an incident's signal positions. The centroid is their mean and
+# the extent their bounding box, so both update in O(1) per signal instead of re-reading
+# every linked signal.
+@dataclass
+class IncidentExtent:
+    signal_count: int = 0
+    latitude_sum: float = 0.0
+    longitude_sum: float = 0.0
+    min_latitude: float = inf
+    min_longitude: float = inf
+    max_latitude: float = -inf
+    max_longitude: float = -inf
+
+    def add(self, latitude: float, longitude: float) -> None:
+        self.signal_count += 1
+        self.latitude_sum += latitude
+        self.longitude_sum += longitude
+        self.min_latitude = min(self.min_latitude, latitude)
+        self.min_longitude = min(self.min_longitude, longitude)
+        self.max_latitude = max(self.max_latitude, latitude)
+        self.max_longitude = max(self.max_longitude, longitude)
+
+    @property
+    def centroid(self) -> tuple[float, float]:
+        return self.latitude_sum / self.signal_count, self.longitude_sum / self.signal_count
+
+    def columns(self) -> dict:
+        return {
+            "signal_count": self.signal_count,
+            "latitude_sum": self.latitude_sum,
+            "longitude_sum": self.longitude_sum,
+            "min_latitude": self.min_latitude,
+            "min_longitude": self.min_longitude,
+            "max_latitude": self.max_latitude,
+            "max_longitude": self.max_longitude,
+        }
+
+
 EARTH_RADIUS_M = 6_371_000
+# Upper bound on distance-matrix cells materialised at once by the batch matcher.
+BATCH_CHUNK_ELEMENTS = 1_000_000
+BATCH_BLOCK_ROWS = 256
+# The vectorised prefilter keeps a little slack so the exact scalar recheck decides
+# every boundary case the same way pick_incident_for_signal would.
+_PREFILTER_DISTANCE_SLACK = 1e-6
+_PREFILTER_TIME_SLACK_S = 1e-3
+# pg_advisory_xact_lock keys: namespace in the top 16 bits, then 24 bits each of grid
+# row and column. Rows/columns wrap past 24 bits, which only makes far-apart cells share
+# a lock, never nearby cells miss one. Fine cells are twice the clustering distance on a
+# side; coarse cells, used for dispersed batches, are COARSE_CELL_FACTOR fine cells wide.
+CELL_LOCK_NAMESPACE = 0x5742
+COARSE_CELL_LOCK_NAMESPACE = 0x5743
+COARSE_CELL_FACTOR = 16
+_CELL_LOCK_MARGIN = 1.01
+_CELL_LOCK_BITS = 24
+_CELL_LOCK_MASK = (1 << _CELL_LOCK_BITS) - 1
 
 
 def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -28,6 +86,65 @@ def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> floa
     return EARTH_RADIUS_M * c
 
 
+def window_cutoff(observed_at: datetime, window_hours: int) -> datetime:
+    return observed_at - timedelta(hours=window_hours)
+
+
+@dataclass
+class CellLocks:
+    shared: list[int]
+    exclusive: list[int]
+
+
+def cell_lock_keys(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    distance_threshold_m: float,
+    coarse: bool = False,
+) -> list[int]:
+    # Each point locks every cell its clustering radius reaches (at most 2x2 fine cells at
+    # mid latitudes). A point within the radius of another therefore lies in a cell both
+    # lock, so concurrent workers serialise only on nearby signals. Keys are sorted so
+    # every worker locks in the same order.
+    radius_deg = degrees(distance_threshold_m / EARTH_RADIUS_M) * _CELL_LOCK_MARGIN
+    cell_deg = 2 * radius_deg * (COARSE_CELL_FACTOR if coarse else 1)
+    namespace = COARSE_CELL_LOCK_NAMESPACE if coarse else CELL_LOCK_NAMESPACE
+    keys: set[int] = set()
+    for latitude, longitude in zip(latitudes, longitudes):
+        lon_radius_deg = radius_deg / max(cos(radians(min(abs(latitude) + radius_deg, 90.0))), 0.01)
+        for row in range(floor((latitude - radius_deg) / cell_deg), floor((latitude + radius_deg) / cell_deg) + 1):
+            for col in range(
+                floor((longitude - lon_radius_deg) / cell_deg),
+                floor((longitude + lon_radius_deg) / cell_deg) + 1,
+            ):
+                keys.add(_cell_lock_key(namespace, row, col))
+    return sorted(keys)
+
+
+def cell_locks(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    distance_threshold_m: float,
+    max_keys: int,
+) -> CellLocks:
+    # Two-level locking bounds the advisory locks one transaction holds. Normally a batch
+    # takes exclusive fine locks under shared locks on the coarse cells around them; a
+    # batch needing more than max_keys fine locks takes exclusive coarse locks instead.
+    # Nearby signals still always conflict: fine vs fine on a fine key, and a coarse batch
+    # vs anything on a coarse key. Callers lock coarse keys before fine ones, each in key
+    # order, so the two levels cannot deadlock.
+    coarse = cell_lock_keys(latitudes, longitudes, distance_threshold_m, coarse=True)
+    fine = cell_lock_keys(latitudes, longitudes, distance_threshold_m)
+    if len(fine) > max_keys:
+        return CellLocks(shared=[], exclusive=coarse)
+    return CellLocks(shared=coarse, exclusive=fine)
+
+
+def _cell_lock_key(namespace: int, row: int, col: int) -> int:
+    # The namespace keeps the top bit clear, so keys are always valid positive bigints.
+    return (namespace << 2 * _CELL_LOCK_BITS) | ((row & _CELL_LOCK_MASK) << _CELL_LOCK_BITS) | (col & _CELL_LOCK_MASK)
+
+
 def pick_incident_for_signal(
     incidents: list[IncidentCandidate],
     signal_latitude: float,
@@ -36,7 +153,7 @@ def pick_incident_for_signal(
     distance_threshold_m: float,
     window_hours: int,
 ) -> IncidentCandidate | None:
-    time_cutoff = observed_at - timedelta(hours=window_hours)
+    time_cutoff = window_cutoff(observed_at, window_hours)
     eligible = [i for i in incidents if i.last_seen >= time_cutoff]
     closest: IncidentCandidate | None = None
     closest_distance = float("inf")
@@ -48,3 +165,134 @@ def pick_incident_for_signal(
             closest = incident
 
     return closest
+
+
+def pick_incidents_for_signals(
+    incidents: Sequence[IncidentCandidate],
+    signal_latitudes: Sequence[float],
+    signal_longitudes: Sequence[float],
+    observed_ats: Sequence[datetime],
+    distance_threshold_m: float,
+    window_hours: int,
+    chunk_elements: int = BATCH_CHUNK_ELEMENTS,
+) -> list[int]:
+    # Batch equivalent of calling pick_incident_for_signal for each signal in order, where a
+    # signal that matches nothing seeds a new incident at its own location, and a matched
+    # incident's last_seen moves forward to the signal's observed_at. Result values index
+    # into ``incidents`` followed by the seeded incidents in creation order.
+    # Unlike ingesting the same signals one at a time, centroids do not move within the
+    # batch: every signal is matched against the candidate and seed locations as they were
+    # at the start (candidates carry no signal counts to re-average with, and the distance
+    # prefilter below is computed once). Near the threshold a batch can therefore seed an
+    # incident where sequential ingest would have attached to a drifted centroid.
+    signal_count = len(signal_latitudes)
+    incident_count = len(incidents)
+    if signal_count == 0:
+        return []
+
+    sig_lat = np.radians(np.asarray(signal_latitudes, dtype=np.float64))
+    sig_lon = np.radians(np.asarray(signal_longitudes, dtype=np.float64))
+    sig_ts = np.fromiter((ts.timestamp() for ts in observed_ats), dtype=np.float64, count=signal_count)
+    cutoff_ts = sig_ts - window_hours * 3600.0 - _PREFILTER_TIME_SLACK_S
+    max_central_angle = distance_threshold_m / EARTH_RADIUS_M + _PREFILTER_DISTANCE_SLACK
+
+    existing_pairs: list[list[int]] = [[] for _ in range(signal_count)]
+    if incident_count:
+        inc_lat = np.radians(np.fromiter((i.latitude for i in incidents), dtype=np.float64, count=incident_count))
+        inc_lon = np.radians(np.fromiter((i.longitude for i in incidents), dtype=np.float64, count=incident_count))
+        inc_ts = np.fromiter((i.last_seen.timestamp() for i in incidents), dtype=np.float64, count=incident_count)
+        sig_idx, inc_idx = _pairs_within(sig_lat, sig_lon, inc_lat, inc_lon, max_central_angle, chunk_elements)
+
+        # An incident can only become eligible later in the batch if a nearby signal
+        # refreshes its last_seen, so bound last_seen by the newest such signal.
+        reachable_ts = inc_ts.copy()
+        np.maximum.at(reachable_ts, inc_idx, sig_ts[sig_idx])
+        keep = reachable_ts[inc_idx] >= cutoff_ts[sig_idx]
+        for s_i, i_i in zip(sig_idx[keep].tolist(), inc_idx[keep].tolist()):
+            existing_pairs[s_i].append(i_i)
+
+    earlier_pairs: list[list[int]] = [[] for _ in range(signal_count)]
+    later_idx, earlier_idx = _pairs_within(sig_lat, sig_lon, sig_lat, sig_lon, max_central_angle, chunk_elements)
+    keep = earlier_idx < later_idx
+    for s_j, s_i in zip(later_idx[keep].tolist(), earlier_idx[keep].tolist()):
+        earlier_pairs[s_j].append(s_i)
+
+    last_seen = [incident.last_seen for incident in incidents]
+    seed_of_signal: dict[int, int] = {}
+    seed_locations: list[tuple[float, float]] = []
+    assignments: list[int] = []
+    for j in range(signal_count):
+        latitude = signal_latitudes[j]
+        longitude = signal_longitudes[j]
+        observed_at = observed_ats[j]
+        time_cutoff = window_cutoff(observed_at, window_hours)
+
+        chosen = -1
+        closest_distance = float("inf")
+        options = sorted(existing_pairs[j])
+        options.extend(sorted(incident_count + seed_of_signal[i] for i in earlier_pairs[j] if i in seed_of_signal))
+        for option in options:
+            if last_seen[option] < time_cutoff:
+                continue
+            if option < incident_count:
+                target = incidents[option]
+                distance = haversine_meters(latitude, longitude, target.latitude, target.longitude)
+            else:
+                seed_lat, seed_lon = seed_locations[option - incident_count]
+                distance = haversine_meters(latitude, longitude, seed_lat, seed_lon)
+            if distance <= distance_threshold_m and distance < closest_distance:
+                closest_distance = distance
+                chosen = option
+
+        if chosen < 0:
+            seed_of_signal[j] = len(seed_locations)
+            seed_locations.append((latitude, longitude))
+            chosen = len(last_seen)
+            last_seen.append(observed_at)
+        else:
+            last_seen[chosen] = max(last_seen[chosen], observed_at)
+        assignments.append(chosen)
+
+    return assignments
+
+
+def _pairs_within(
+    row_lat: np.ndarray,
+    row_lon: np.ndarray,
+    col_lat: np.ndarray,
+    col_lon: np.ndarray,
+    max_central_angle: float,
+    chunk_elements: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Rows and columns are visited in latitude order so each block of rows is only
+    # compared against the band of columns whose latitude is within reach.
+    row_order = np.argsort(row_lat, kind="stable")
+    col_order = np.argsort(col_lat, kind="stable")
+    sorted_row_lat = row_lat[row_order]
+    sorted_row_lon = row_lon[row_order]
+    sorted_col_lat = col_lat[col_order]
+    sorted_col_lon = col_lon[col_order]
+    sorted_col_cos = np.cos(sorted_col_lat)
+    # Compare haversine terms directly instead of taking arcsin of every cell.
+    max_a = sin(min(max_central_angle, np.pi) / 2) ** 2
+    rows_per_chunk = max(1, min(BATCH_BLOCK_ROWS, chunk_elements // max(len(col_lat), 1)))
+
+    row_hits: list[np.ndarray] = [np.empty(0, dtype=np.intp)]
+    col_hits: list[np.ndarray] = [np.empty(0, dtype=np.intp)]
+    for start in range(0, len(sorted_row_lat), rows_per_chunk):
+        stop = min(start + rows_per_chunk, len(sorted_row_lat))
+        band_start = int(np.searchsorted(sorted_col_lat, sorted_row_lat[start] - max_central_angle, side="left"))
+        band_stop = int(np.searchsorted(sorted_col_lat, sorted_row_lat[stop - 1] + max_central_angle, side="right"))
+        if band_start >= band_stop:
+            continue
+
+        lat = sorted_row_lat[start:stop, None]
+        lon = sorted_row_lon[start:stop, None]
+        band = slice(band_start, band_stop)
+        a = np.sin((sorted_col_lat[band] - lat) / 2) ** 2
+        a += np.cos(lat) * sorted_col_cos[band] * np.sin((sorted_col_lon[band] - lon) / 2) ** 2
+        rows, cols = np.nonzero(a <= max_a)
+        row_hits.append(row_order[rows + start])
+        col_hits.append(col_order[cols + band_start])
+
+    return np.concatenate(row_hits), np.concatenate(col_hits)
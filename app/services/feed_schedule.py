@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from app.core.config import Settings
+
+
+@dataclass
+class PollPolicy:
+    min_seconds: float
+    max_seconds: float
+    initial_seconds: float
+    error_max_seconds: float
+    burst_seconds: float
+    burst_duration_seconds: float
+    burst_min_confidence: float
+    speedup: float = 0.5
+    slowdown: float = 1.5
+    smoothing: float = 0.3
+    busy_items: float = 1.0
+
+
+@dataclass
+class PollState:
+    interval_seconds: float
+    avg_new_items: float = 0.0
+    error_streak: int = 0
+    burst_until: datetime | None = None
+    next_poll_at: datetime | None = None
+
+
+@dataclass
+class PollOutcome:
+    ok: bool
+    new_items: int = 0
+    high_confidence: bool = False
+
+
+def poll_policy(settings: Settings) -> PollPolicy:
+    return PollPolicy(
+        min_seconds=settings.rss_poll_min_seconds,
+        max_seconds=settings.rss_poll_max_seconds,
+        initial_seconds=settings.rss_poll_initial_seconds,
+        error_max_seconds=settings.rss_poll_error_max_seconds,
+        burst_seconds=settings.rss_poll_burst_seconds,
+        burst_duration_seconds=settings.rss_poll_burst_duration_seconds,
+        burst_min_confidence=settings.rss_poll_burst_min_confidence,
+    )
+
+
+# Multiplicative increase/decrease of each feed's polling interval, driven by the smoothed
+# count of new items per poll: a poll with new items halves it once that average reaches
+# busy_items, an empty poll stretches it by half while the average is below it, and
+# anything else keeps it, always within [min, max]. One stray item on a quiet feed or one
+# empty poll on a busy feed therefore does not move the interval. Failures
+# back off exponentially from the healthy interval without changing it, so a feed that
+# recovers resumes its old cadence. New items that land in a high-confidence incident put
+# the feed in burst mode, polled at burst_seconds until the burst expires.
+def compute_next_poll(previous: PollState | None, outcome: PollOutcome, now: datetime, policy: PollPolicy) -> PollState:
+    previous = previous or PollState(interval_seconds=policy.initial_seconds)
+    interval = previous.interval_seconds
+
+    if not outcome.ok:
+        streak = previous.error_streak + 1
+        delay = min(policy.error_max_seconds, interval * 2**streak)
+        return PollState(
+            interval_seconds=interval,
+            avg_new_items=previous.avg_new_items,
+            error_streak=streak,
+            burst_until=previous.burst_until,
+            next_poll_at=now + timedelta(seconds=delay),
+        )
+
+    avg_new_items = policy.smoothing * outcome.new_items + (1 - policy.smoothing) * previous.avg_new_items
+    if outcome.new_items > 0 and avg_new_items >= policy.busy_items:
+        interval *= policy.speedup
+    elif outcome.new_items == 0 and avg_new_items < policy.busy_items:
+        interval *= policy.slowdown
+    interval = min(policy.max_seconds, max(policy.min_seconds, interval))
+    burst_until = previous.burst_until
+    if outcome.high_confidence:
+        burst_until = now + timedelta(seconds=policy.burst_duration_seconds)
+    if burst_until is not None and burst_until <= now:
+        burst_until = None
+
+    delay = min(interval, policy.burst_seconds) if burst_until is not None else interval
+    return PollState(
+        interval_seconds=interval,
+        avg_new_items=avg_new_items,
+        error_streak=0,
+        burst_until=burst_until,
+        next_poll_at=now + timedelta(seconds=delay),
+    )
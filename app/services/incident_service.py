@@ -1,22 +1,42 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from math import cos, radians
 
 from geoalchemy2.elements import WKTElement
-from geoalchemy2.shape import to_shape
-from sqlalchemy import select
+from sqlalchemy import DateTime, Float, Integer, Select, Update, bindparam, column, func, insert, select, text, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
+from app.core.metrics import stage_timer
 from app.models import Incident, IncidentSignal, Signal
-from app.services.clustering import IncidentCandidate, pick_incident_for_signal
-from app.services.scoring import compute_confidence
+from app.repositories.incidents import IncidentRepository
+from app.services.active_incidents import ActiveIncidentSet
+from app.services.clustering import (
+    IncidentCandidate,
+    IncidentExtent,
+    cell_locks,
+    pick_incidents_for_signals,
+    window_cutoff,
+)
+from app.services.response_cache import ResponseCache
+from app.services.scoring import confidence_keyword_hits, empty_score_state, fold_score_state, score_from_state
 
 logger = logging.getLogger(__name__)
 
 
+# Signals without a geocoded position (RSS items, for now) are stored at this point until
+# enrichment places them.
+UNLOCATED = (0.0, 0.0)
+
+
 @dataclass
 class SignalPayload:
     source_type: str
@@ -27,12 +47,129 @@ class SignalPayload:
     observed_at: datetime
     latitude: float
     longitude: float
+    extracted_text: str = ""
+    extracted_location_text: str | None = None
+    features: dict = field(default_factory=dict)
+    fetched_at: datetime | None = None
+    created_at: datetime | None = None
+
+    @property
+    def located(self) -> bool:
+        return (self.latitude, self.longitude) != UNLOCATED
+
+
+# Locks are taken in key order within one statement; count() forces every row to run.
+LOCK_CELLS_SQL = text(
+    "SELECT count(pg_advisory_xact_lock(k)) FROM (SELECT unnest(CAST(:keys AS bigint[])) AS k ORDER BY k) AS ordered"
+)
+LOCK_CELLS_SHARED_SQL = text(
+    "SELECT count(pg_advisory_xact_lock_shared(k)) "
+    "FROM (SELECT unnest(CAST(:keys AS bigint[])) AS k ORDER BY k) AS ordered"
+)
+
+
+def _point(latitude: float, longitude: float) -> WKTElement:
+    return WKTElement(f"POINT({longitude} {latitude})", srid=4326)
+
+
+# Folds batch aggregates into existing incidents in one UPDATE ... FROM (VALUES ...). SET
+# expressions see the old row, so the new centroid is computed from the updated sums, and
+# RETURNING hands back the moved centroid for the active-incident cache.
+def _extent_update(rows: list[tuple[uuid.UUID, datetime, IncidentExtent]]) -> Update:
+    incidents = Incident.__table__
+    batch = values(
+        column("id", UUID(as_uuid=True)),
+        column("last_seen", DateTime(timezone=True)),
+        column("signal_count", Integer),
+        column("latitude_sum", Float),
+        column("longitude_sum", Float),
+        column("min_latitude", Float),
+        column("min_longitude", Float),
+        column("max_latitude", Float),
+        column("max_longitude", Float),
+        name="batch",
+    ).data(
+        [
+            (
+                incident_id,
+                last_seen,
+                extent.signal_count,
+                extent.latitude_sum,
+                extent.longitude_sum,
+                extent.min_latitude,
+                extent.min_longitude,
+                extent.max_latitude,
+                extent.max_longitude,
+            )
+            for incident_id, last_seen, extent in rows
+        ]
+    )
+    signal_count = incidents.c.signal_count + batch.c.signal_count
+    latitude_sum = incidents.c.latitude_sum + batch.c.latitude_sum
+    longitude_sum = incidents.c.longitude_sum + batch.c.longitude_sum
+    return (
+        update(incidents)
+        .where(incidents.c.id == batch.c.id)
+        .values(
+            last_seen=func.greatest(incidents.c.last_seen, batch.c.last_seen),
+            signal_count=signal_count,
+            latitude_sum=latitude_sum,
+            longitude_sum=longitude_sum,
+            min_latitude=func.least(incidents.c.min_latitude, batch.c.min_latitude),
+            min_longitude=func.least(incidents.c.min_longitude, batch.c.min_longitude),
+            max_latitude=func.greatest(incidents.c.max_latitude, batch.c.max_latitude),
+            max_longitude=func.greatest(incidents.c.max_longitude, batch.c.max_longitude),
+            centroid=func.ST_SetSRID(func.ST_MakePoint(longitude_sum / signal_count, latitude_sum / signal_count), 4326),
+        )
+        .returning(
+            incidents.c.id,
+            func.ST_Y(incidents.c.centroid).label("latitude"),
+            func.ST_X(incidents.c.centroid).label("longitude"),
+            incidents.c.last_seen,
+        )
+    )
+
+
+def _signal_keyword_hits(title: str, content: str, features: dict | None) -> dict[str, list[str]]:
+    precomputed = (features or {}).get("confidence_keyword_hits")
+    if precomputed is not None:
+        return precomputed
+    return confidence_keyword_hits(f"{title} {content}")
+
+
+def _fold_signals(state: dict, signal_hits: list[tuple[dict, str]]) -> dict:
+    for keyword_hits, source_type in signal_hits:
+        state = fold_score_state(state, keyword_hits, source_type)
+    return state
+
+
+def _score_columns(state: dict) -> dict:
+    score, breakdown = score_from_state(state)
+    return {"confidence_score": score, "score_breakdown": breakdown, "score_state": state}
+
+
+@lru_cache
+def get_active_incident_set() -> ActiveIncidentSet:
+    settings = get_settings()
+    return ActiveIncidentSet(
+        distance_m=settings.clustering_distance_meters,
+        horizon_hours=settings.active_incident_horizon_hours,
+        refresh_seconds=settings.active_incident_refresh_seconds,
+    )
 
 
 class IncidentService:
-    def __init__(self, db: Session, settings: Settings) -> None:
+    def __init__(
+        self,
+        db: Session,
+        settings: Settings,
+        active_incidents: ActiveIncidentSet | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
         self.db = db
         self.settings = settings
+        self.active_incidents = active_incidents
+        self.response_cache = response_cache
 
     def ingest_signal(self, payload: SignalPayload) -> Signal:
         signal = Signal(
@@ -44,69 +181,443 @@ class IncidentService:
             observed_at=payload.observed_at,
             latitude=payload.latitude,
             longitude=payload.longitude,
-            geom=WKTElement(f"POINT({payload.longitude} {payload.latitude})", srid=4326),
+            geom=_point(payload.latitude, payload.longitude),
+            extracted_text=payload.extracted_text,
+            extracted_location_text=payload.extracted_location_text,
+            features=payload.features,
         )
+        if payload.fetched_at is not None:
+            signal.fetched_at = payload.fetched_at
+        if payload.created_at is not None:
+            signal.created_at = payload.created_at
         self.db.add(signal)
         self.db.flush()
 
-        candidate = self._find_matching_incident(payload)
+        locked = self._lock_cells([payload])
+        candidate = self._find_matching_incident(payload, locked=locked)
+        extent = IncidentExtent()
+        extent.add(payload.latitude, payload.longitude)
         if candidate:
-            incident = self.db.get(Incident, candidate.id)
+            moved = self.db.execute(_extent_update([(candidate.id, payload.observed_at, extent)])).one()
+            # Locked like _fold_existing_scores: score_state is read, folded and written back.
+            incident = self.db.get(Incident, candidate.id, populate_existing=True, with_for_update=True)
             assert incident is not None
-            incident.last_seen = max(incident.last_seen, payload.observed_at)
+            latitude, longitude = moved.latitude, moved.longitude
             logger.info("Attached signal %s to existing incident %s", signal.id, incident.id)
         else:
+            latitude, longitude = payload.latitude, payload.longitude
             incident = Incident(
                 first_seen=payload.observed_at,
                 last_seen=payload.observed_at,
-                centroid=WKTElement(f"POINT({payload.longitude} {payload.latitude})", srid=4326),
+                centroid=_point(payload.latitude, payload.longitude),
                 confidence_score=0.0,
                 score_breakdown={},
+                score_state={},
+                **extent.columns(),
             )
             self.db.add(incident)
             self.db.flush()
             logger.info("Created new incident %s for signal %s", incident.id, signal.id)
 
         self.db.add(IncidentSignal(incident_id=incident.id, signal_id=signal.id))
-        self._update_incident_score(incident)
+        if incident.score_state or not candidate:
+            state = fold_score_state(
+                incident.score_state or empty_score_state(),
+                _signal_keyword_hits(payload.title, payload.content, payload.features),
+                payload.source_type,
+            )
+        else:
+            # Incidents scored before running state existed are rebuilt once in full.
+            state = self._full_score_states([incident.id])[incident.id]
+        for column, value in _score_columns(state).items():
+            setattr(incident, column, value)
         self.db.commit()
+        self._data_changed()
+        if self.active_incidents is not None:
+            self.active_incidents.upsert(
+                IncidentCandidate(id=incident.id, latitude=latitude, longitude=longitude, last_seen=incident.last_seen)
+            )
         self.db.refresh(signal)
         return signal
 
-    def _find_matching_incident(self, payload: SignalPayload) -> IncidentCandidate | None:
-        recent_incidents = list(
-            self.db.scalars(select(Incident).where(Incident.last_seen <= payload.observed_at)).all()
-        )
-        candidates = []
-        for incident in recent_incidents:
-            centroid = to_shape(incident.centroid)
-            candidates.append(
-                IncidentCandidate(
-                    id=incident.id,
-                    latitude=centroid.y,
-                    longitude=centroid.x,
-                    last_seen=incident.last_seen,
+    def ingest_many(self, payloads: list[SignalPayload]) -> list[uuid.UUID]:
+        if not payloads:
+            return []
+
+        with stage_timer("insert"):
+            accepted = self._insert_signals(payloads)
+        if not accepted:
+            self.db.commit()
+            return []
+
+        with stage_timer("lock"):
+            locked = self._lock_cells([payload for _, payload in accepted])
+        with stage_timer("cluster"):
+            candidates = self._batch_candidates([payload for _, payload in accepted], locked=locked)
+            assignments = pick_incidents_for_signals(
+                candidates,
+                [payload.latitude for _, payload in accepted],
+                [payload.longitude for _, payload in accepted],
+                [payload.observed_at for _, payload in accepted],
+                self.settings.clustering_distance_meters,
+                self.settings.clustering_time_window_hours,
+            )
+
+            touched: dict[int, IncidentCandidate] = {}
+            first_seen: dict[int, datetime] = {}
+            extents: dict[int, IncidentExtent] = {}
+            signal_hits: dict[int, list[tuple[dict, str]]] = {}
+            for (_, payload), index in zip(accepted, assignments):
+                extents.setdefault(index, IncidentExtent()).add(payload.latitude, payload.longitude)
+                signal_hits.setdefault(index, []).append(
+                    (_signal_keyword_hits(payload.title, payload.content, payload.features), payload.source_type)
                 )
+                current = touched.get(index)
+                if current is None:
+                    if index < len(candidates):
+                        existing = candidates[index]
+                        current = IncidentCandidate(existing.id, existing.latitude, existing.longitude, existing.last_seen)
+                    else:
+                        current = IncidentCandidate(uuid.uuid4(), payload.latitude, payload.longitude, payload.observed_at)
+                        first_seen[index] = payload.observed_at
+                    touched[index] = current
+                current.last_seen = max(current.last_seen, payload.observed_at)
+                if index in first_seen:
+                    first_seen[index] = min(first_seen[index], payload.observed_at)
+
+        with stage_timer("write"):
+            # New incidents are centred on the mean of their signals, not the first one.
+            for index in first_seen:
+                touched[index].latitude, touched[index].longitude = extents[index].centroid
+            new_incidents = [
+                {
+                    "id": touched[index].id,
+                    "first_seen": first_seen[index],
+                    "last_seen": touched[index].last_seen,
+                    "centroid": _point(touched[index].latitude, touched[index].longitude),
+                    **extents[index].columns(),
+                    **_score_columns(_fold_signals(empty_score_state(), signal_hits[index])),
+                }
+                for index in first_seen
+            ]
+            if new_incidents:
+                self.db.execute(insert(Incident), new_incidents)
+
+            existing = {touched[index].id: index for index in touched if index not in first_seen}
+            if existing:
+                rows = [(incident_id, touched[index].last_seen, extents[index]) for incident_id, index in existing.items()]
+                moved = self.db.execute(_extent_update(rows))
+                for row in moved:
+                    current = touched[existing[row.id]]
+                    current.latitude, current.longitude, current.last_seen = row.latitude, row.longitude, row.last_seen
+
+            self.db.execute(
+                insert(IncidentSignal),
+                [
+                    {"incident_id": touched[index].id, "signal_id": signal_id}
+                    for (signal_id, _), index in zip(accepted, assignments)
+                ],
+            )
+        with stage_timer("score"):
+            self._fold_existing_scores(
+                {touched[index].id: hits for index, hits in signal_hits.items() if index not in first_seen}
             )
-        return pick_incident_for_signal(
-            candidates,
-            payload.latitude,
-            payload.longitude,
-            payload.observed_at,
+        with stage_timer("commit"):
+            self.db.commit()
+        self._data_changed()
+
+        if self.active_incidents is not None:
+            for candidate in touched.values():
+                self.active_incidents.upsert(candidate)
+        logger.info(
+            "Ingested %s signals into %s incidents (%s new)",
+            len(accepted),
+            len(touched),
+            len(new_incidents),
+        )
+        return [signal_id for signal_id, _ in accepted]
+
+    def _insert_signals(self, payloads: list[SignalPayload]) -> list[tuple[uuid.UUID, SignalPayload]]:
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "source_type": payload.source_type,
+                "source_id": payload.source_id,
+                "title": payload.title,
+                "content": payload.content,
+                "url": payload.url,
+                "observed_at": payload.observed_at,
+                "latitude": payload.latitude,
+                "longitude": payload.longitude,
+                "geom": _point(payload.latitude, payload.longitude),
+                "extracted_text": payload.extracted_text,
+                "extracted_location_text": payload.extracted_location_text,
+                "features": payload.features,
+                "fetched_at": payload.fetched_at or now,
+                "created_at": payload.created_at or now,
+            }
+            for payload in payloads
+        ]
+
+        # Rows another worker inserted first are skipped by the unique source key rather
+        # than failing the batch; RETURNING tells us which of our ids actually landed.
+        statement = (
+            pg_insert(Signal)
+            .on_conflict_do_nothing(index_elements=[Signal.source_type, Signal.source_id])
+            .returning(Signal.id)
+        )
+        try:
+            with self.db.begin_nested():
+                inserted_ids = set(self.db.scalars(statement, rows))
+            return [(row["id"], payload) for row, payload in zip(rows, payloads) if row["id"] in inserted_ids]
+        except SQLAlchemyError as exc:
+            logger.warning("Bulk signal insert failed, retrying row by row: %s", exc)
+
+        accepted: list[tuple[uuid.UUID, SignalPayload]] = []
+        for row, payload in zip(rows, payloads):
+            try:
+                with self.db.begin_nested():
+                    inserted_id = self.db.scalar(statement, row)
+            except SQLAlchemyError as exc:
+                logger.warning("Skipping signal source_id=%s url=%s: %s", payload.source_id, payload.url, exc)
+                continue
+            if inserted_id is not None:
+                accepted.append((row["id"], payload))
+        return accepted
+
+    def _lock_cells(self, payloads: list[SignalPayload]) -> bool:
+        # Held until commit, so another worker clustering nearby signals waits and then
+        # sees the incidents this transaction creates instead of creating its own.
+        # Unlocated signals are not locked: they would all share the cells around
+        # UNLOCATED and serialize every feed's ingest on one key.
+        located = [payload for payload in payloads if payload.located]
+        if not self.settings.clustering_cell_locks_enabled or not located:
+            return False
+        locks = cell_locks(
+            [payload.latitude for payload in located],
+            [payload.longitude for payload in located],
             self.settings.clustering_distance_meters,
-            self.settings.clustering_time_window_hours,
+            self.settings.clustering_cell_lock_max_keys,
+        )
+        if locks.shared:
+            self.db.execute(LOCK_CELLS_SHARED_SQL, {"keys": locks.shared})
+        self.db.execute(LOCK_CELLS_SQL, {"keys": locks.exclusive})
+        return True
+
+    def _batch_candidates(self, payloads: list[SignalPayload], locked: bool = False) -> list[IncidentCandidate]:
+        window_hours = self.settings.clustering_time_window_hours
+        oldest = min(payload.observed_at for payload in payloads)
+
+        cache = self.active_incidents
+        if cache is not None:
+            self._prepare_cache(cache, payloads, oldest, locked)
+            cached = cache.lookup_batch(oldest, window_hours, len(payloads))
+            if cached is not None:
+                return cached
+
+        # Only incidents inside the batch's time window and near its bounding box can match.
+        query = self._neighbourhood_query(payloads).where(Incident.last_seen >= window_cutoff(oldest, window_hours))
+        return [
+            IncidentCandidate(id=row.id, latitude=row.latitude, longitude=row.longitude, last_seen=row.last_seen)
+            for row in self.db.execute(query)
+        ]
+
+    def _find_matching_incident(self, payload: SignalPayload, locked: bool = False) -> IncidentCandidate | None:
+        cache = self.active_incidents
+        if cache is not None:
+            self._prepare_cache(cache, [payload], payload.observed_at, locked)
+            hit, candidate = cache.lookup(
+                payload.latitude,
+                payload.longitude,
+                payload.observed_at,
+                self.settings.clustering_time_window_hours,
+            )
+            if hit:
+                return candidate
+        return self._query_matching_incident(payload)
+
+    def _prepare_cache(
+        self,
+        cache: ActiveIncidentSet,
+        payloads: list[SignalPayload],
+        oldest: datetime,
+        locked: bool,
+    ) -> None:
+        # The whole set is refreshed (and expired entries evicted) every refresh_seconds.
+        # Another process may have committed incidents since then, so with cell locks
+        # held the batch's neighbourhood is re-read into the set first; nobody else can
+        # change it until we commit, so lookups in the locked cells are current.
+        window_hours = self.settings.clustering_time_window_hours
+        now = datetime.now(timezone.utc)
+        if cache.needs_refresh(now):
+            self._refresh_active_incidents(cache, now)
+        if locked and cache.covers(oldest, window_hours):
+            query = self._neighbourhood_query(payloads).where(Incident.last_seen >= window_cutoff(oldest, window_hours))
+            for row in self.db.execute(query):
+                cache.upsert(
+                    IncidentCandidate(id=row.id, latitude=row.latitude, longitude=row.longitude, last_seen=row.last_seen)
+                )
+
+    def _neighbourhood_query(self, payloads: list[SignalPayload]) -> Select:
+        margin_deg = self.settings.clustering_distance_meters / 111_000.0
+        max_abs_lat = max(abs(payload.latitude) for payload in payloads)
+        lon_margin_deg = margin_deg / max(cos(radians(min(max_abs_lat + margin_deg, 89.0))), 0.01)
+        envelope = func.ST_MakeEnvelope(
+            min(payload.longitude for payload in payloads) - lon_margin_deg,
+            min(payload.latitude for payload in payloads) - margin_deg,
+            max(payload.longitude for payload in payloads) + lon_margin_deg,
+            max(payload.latitude for payload in payloads) + margin_deg,
+            4326,
+        )
+        return select(
+            Incident.id,
+            func.ST_Y(Incident.centroid).label("latitude"),
+            func.ST_X(Incident.centroid).label("longitude"),
+            Incident.last_seen,
+        ).where(func.ST_Intersects(Incident.centroid, envelope))
+
+    def _refresh_active_incidents(self, cache: ActiveIncidentSet, now: datetime) -> None:
+        query = select(
+            Incident.id,
+            func.ST_Y(Incident.centroid).label("latitude"),
+            func.ST_X(Incident.centroid).label("longitude"),
+            Incident.last_seen,
+            Incident.updated_at,
+        ).where(Incident.last_seen >= cache.next_horizon(now))
+        if cache.watermark is not None:
+            # updated_at is stamped at transaction start, so re-read a little history to
+            # pick up rows from transactions that committed after our last refresh.
+            overlap = timedelta(seconds=self.settings.active_incident_refresh_overlap_seconds)
+            query = query.where(Incident.updated_at > cache.watermark - overlap)
+
+        rows = self.db.execute(query).all()
+        cache.apply_refresh(
+            [
+                IncidentCandidate(id=row.id, latitude=row.latitude, longitude=row.longitude, last_seen=row.last_seen)
+                for row in rows
+            ],
+            refreshed_at=now,
+            watermark=max((row.updated_at for row in rows), default=None),
         )
+        logger.debug(
+            "Refreshed active incidents: changed=%s active=%s coverage=%.3f",
+            len(rows),
+            len(cache),
+            cache.stats.coverage,
+        )
+
+    def _query_matching_incident(self, payload: SignalPayload) -> IncidentCandidate | None:
+        # Bounded space-time lookup mirroring pick_incident_for_signal: only incidents seen
+        # inside the clustering window and within the clustering distance, nearest first.
+        signal_geog = func.geography(
+            func.ST_SetSRID(func.ST_MakePoint(payload.longitude, payload.latitude), 4326)
+        )
+        centroid_geog = func.geography(Incident.centroid)
+        query = (
+            select(
+                Incident.id,
+                func.ST_Y(Incident.centroid).label("latitude"),
+                func.ST_X(Incident.centroid).label("longitude"),
+                Incident.last_seen,
+            )
+            .where(
+                Incident.last_seen
+                >= window_cutoff(payload.observed_at, self.settings.clustering_time_window_hours)
+            )
+            .where(
+                func.ST_DWithin(centroid_geog, signal_geog, self.settings.clustering_distance_meters, False)
+            )
+            .order_by(func.ST_Distance(centroid_geog, signal_geog, False))
+            .limit(1)
+        )
+        row = self.db.execute(query).one_or_none()
+        if row is None:
+            return None
+        return IncidentCandidate(
+            id=row.id,
+            latitude=row.latitude,
+            longitude=row.longitude,
+            last_seen=row.last_seen,
+        )
+
+    def recompute_scores(self, incident_ids: list[uuid.UUID] | None = None, batch_size: int = 500) -> int:
+        # Repair path: rebuild running score state from every linked signal.
+        if incident_ids is None:
+            incident_ids = list(self.db.scalars(select(Incident.id)))
+        for start in range(0, len(incident_ids), batch_size):
+            self._write_scores(self._full_score_states(incident_ids[start : start + batch_size]))
+            self.db.commit()
+            self._data_changed()
+        return len(incident_ids)
+
+    def repair_extents(self, incident_ids: list[uuid.UUID] | None = None, batch_size: int = 500) -> int:
+        # Repair path: rebuild signal counts, sums, extents and centroids set-wise in SQL.
+        # Each batch locks its rows first, so the UPDATE (a new snapshot under READ
+        # COMMITTED) sees every link committed by ingests that held them. Incidents being
+        # ingested into right now are skipped and left for the next run.
+        repository = IncidentRepository(self.db)
+        if incident_ids is None:
+            incident_ids = list(self.db.scalars(select(Incident.id)))
+        repaired = 0
+        for start in range(0, len(incident_ids), batch_size):
+            locked = repository.lock_for_repair(incident_ids[start : start + batch_size])
+            if locked:
+                repaired += repository.repair_extents(locked)
+            self.db.commit()
+        self._data_changed()
+        if self.active_incidents is not None:
+            self.active_incidents.invalidate()
+        return repaired
+
+    def _data_changed(self) -> None:
+        # Called after commit only, so readers never cache a version that could roll back.
+        if self.response_cache is not None:
+            self.response_cache.bump_version()
+
+    def _fold_existing_scores(self, signal_hits: dict[uuid.UUID, list[tuple[dict, str]]]) -> None:
+        if not signal_hits:
+            return
+        rows = self.db.execute(
+            select(Incident.id, Incident.score_state).where(Incident.id.in_(list(signal_hits))).with_for_update()
+        ).all()
+        states = {row.id: _fold_signals(row.score_state, signal_hits[row.id]) for row in rows if row.score_state}
+        legacy = [row.id for row in rows if not row.score_state]
+        if legacy:
+            # Incidents scored before running state existed are rebuilt once in full.
+            states.update(self._full_score_states(legacy))
+        self._write_scores(states)
+
+    def _full_score_states(self, incident_ids: list[uuid.UUID]) -> dict[uuid.UUID, dict]:
+        self.db.flush()
+        states = {incident_id: empty_score_state() for incident_id in incident_ids}
+        rows = self.db.execute(
+            select(IncidentSignal.incident_id, Signal.source_type, Signal.title, Signal.content, Signal.features)
+            .join(Signal, Signal.id == IncidentSignal.signal_id)
+            .where(IncidentSignal.incident_id.in_(incident_ids))
+        )
+        for row in rows:
+            states[row.incident_id] = fold_score_state(
+                states[row.incident_id],
+                _signal_keyword_hits(row.title, row.content, row.features),
+                row.source_type,
+            )
+        return states
 
-    def _update_incident_score(self, incident: Incident) -> None:
-        signals = list(
-            self.db.scalars(
-                select(Signal)
-                .join(IncidentSignal, IncidentSignal.signal_id == Signal.id)
-                .where(IncidentSignal.incident_id == incident.id)
-            ).all()
+    def _write_scores(self, states: dict[uuid.UUID, dict]) -> None:
+        if not states:
+            return
+        incidents = Incident.__table__
+        self.db.execute(
+            update(incidents)
+            .where(incidents.c.id == bindparam("b_id"))
+            .values(
+                confidence_score=bindparam("b_confidence_score"),
+                score_breakdown=bindparam("b_score_breakdown"),
+                score_state=bindparam("b_score_state"),
+            ),
+            [
+                {f"b_{column}": value for column, value in _score_columns(state).items()} | {"b_id": incident_id}
+                for incident_id, state in states.items()
+            ],
         )
-        signal_text = [f"{sig.title} {sig.content}" for sig in signals]
-        source_types = [sig.source_type for sig in signals]
-        score, breakdown = compute_confidence(signal_text, source_types)
-        incident.confidence_score = score
-        incident.score_breakdown = breakdown
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+# Keyword tiers shared by confidence scoring and feed enrichment. A trailing "*" marks a
+# stem that also matches longer word forms ("flood*" hits "flooding"); every other term
+# must match whole words.
+KEYWORD_TIERS: dict[str, tuple[str, ...]] = {
+    "high": ("water main break*", "flood*", "burst pipe*", "road closed", "crews on scene"),
+    "medium": ("water leak*", "no water", "water outage*", "sinkhole*", "low pressure"),
+    "feed": ("watermain*", "water main*", "break*", "burst*", "leak*", "flood*", "road closure*"),
+}
+
+
+def keyword_label(term: str) -> str:
+    return term.rstrip("*").lower()
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: dict) -> str:
+    branches = [re.escape(char) + _node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+# Compiled single-pass matcher. Terms are folded into a character trie and emitted as one
+# nested regex, so the work done at each word start depends on the length of the text
+# that matches rather than on how many terms are registered. The lookaheads report the
+# longest whole-word and longest stem match at a position; shorter terms that are
+# prefixes of those matches are implied.
+class KeywordMatcher:
+    def __init__(self, terms: Iterable[str]) -> None:
+        stems: set[str] = set()
+        exact: set[str] = set()
+        for term in terms:
+            (stems if term.endswith("*") else exact).add(keyword_label(term))
+        exact -= stems
+        self.labels = frozenset(stems | exact)
+
+        exact_pattern = _trie_pattern(exact) if exact else "(?!)"
+        stem_pattern = _trie_pattern(stems) if stems else "(?!)"
+        self._pattern = re.compile(
+            rf"(?<!\w)(?:(?=({exact_pattern})(?!\w))(?=({stem_pattern}))?|(?=({stem_pattern})))"
+        )
+        self._implied = {
+            label: frozenset(
+                other
+                for other in self.labels
+                if other != label
+                and label.startswith(other)
+                and (other in stems or not (label[len(other)].isalnum() or label[len(other)] == "_"))
+            )
+            for label in self.labels
+        }
+
+    def find(self, text: str) -> set[str]:
+        found: set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            for label in match.groups():
+                if label and label not in found:
+                    found.add(label)
+                    found.update(self._implied[label])
+        return found
+
+
+class KeywordRegistry:
+    def __init__(self, tiers: Mapping[str, Iterable[str]]) -> None:
+        self.tiers = {name: tuple(dict.fromkeys(keyword_label(term) for term in terms)) for name, terms in tiers.items()}
+        self.matcher = KeywordMatcher(term for terms in tiers.values() for term in terms)
+
+    def hits(self, text: str) -> dict[str, list[str]]:
+        found = self.matcher.find(text)
+        return {name: [label for label in labels if label in found] for name, labels in self.tiers.items()}
+
+
+KEYWORD_REGISTRY = KeywordRegistry(KEYWORD_TIERS)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import redis
+import redis.asyncio
+
+from app.core.cache import LRUCache, etag_for
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+VERSION_KEY = "wbw:data-version"
+ENTRY_PREFIX = "wbw:response"
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+# Two-level cache for read endpoints: an in-process LRU in front of Redis. Entries are
+# keyed by the data version, a Redis counter bumped after every committed write, so a
+# bump makes all earlier entries unreachable and they age out by TTL. Redis failures
+# degrade to uncached reads rather than failing the request. The sync and async caches
+# share everything but the Redis round trips, which live in the subclasses.
+class _ResponseCacheBase:
+    def __init__(self, client, *, ttl_seconds: int, local_entries: int, max_entry_bytes: int) -> None:
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.max_entry_bytes = max_entry_bytes
+        self.local = LRUCache(local_entries, ttl_seconds)
+
+    def etag(self, version: int, key: str) -> str:
+        return etag_for(version, key)
+
+    def _stored(self, version: int, key: str, stored: dict) -> CachedResponse | None:
+        if not stored:
+            return None
+        cached = _decode(stored)
+        self.local.set((version, key), cached)
+        return cached
+
+    def _queue_set(self, pipe, version: int, key: str, cached: CachedResponse) -> bool:
+        if len(cached.body) > self.max_entry_bytes:
+            return False
+        self.local.set((version, key), cached)
+        redis_key = _redis_key(version, key)
+        pipe.hset(redis_key, mapping=_encode(cached))
+        pipe.expire(redis_key, self.ttl_seconds)
+        return True
+
+
+class ResponseCache(_ResponseCacheBase):
+    client: redis.Redis
+
+    def data_version(self) -> int | None:
+        try:
+            return int(self.client.get(VERSION_KEY) or 0)
+        except redis.RedisError as exc:
+            logger.warning("Response cache unavailable: %s", exc)
+            return None
+
+    def bump_version(self) -> None:
+        try:
+            self.client.incr(VERSION_KEY)
+        except redis.RedisError as exc:
+            logger.warning("Failed to bump response cache version: %s", exc)
+
+    def get(self, version: int, key: str) -> CachedResponse | None:
+        cached = self.local.get((version, key))
+        if cached is not None:
+            return cached
+        try:
+            return self._stored(version, key, self.client.hgetall(_redis_key(version, key)))
+        except redis.RedisError as exc:
+            logger.warning("Response cache read failed: %s", exc)
+            return None
+
+    def set(self, version: int, key: str, cached: CachedResponse) -> None:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            if self._queue_set(pipe, version, key, cached):
+                pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning("Response cache write failed: %s", exc)
+
+
+# Same cache for coroutine routes, on redis.asyncio so lookups never block the event loop.
+# Entries are shared with the sync cache; only the local LRU is per instance.
+class AsyncResponseCache(_ResponseCacheBase):
+    client: redis.asyncio.Redis
+
+    async def data_version(self) -> int | None:
+        try:
+            return int(await self.client.get(VERSION_KEY) or 0)
+        except redis.RedisError as exc:
+            logger.warning("Response cache unavailable: %s", exc)
+            return None
+
+    async def get(self, version: int, key: str) -> CachedResponse | None:
+        cached = self.local.get((version, key))
+        if cached is not None:
+            return cached
+        try:
+            return self._stored(version, key, await self.client.hgetall(_redis_key(version, key)))
+        except redis.RedisError as exc:
+            logger.warning("Response cache read failed: %s", exc)
+            return None
+
+    async def set(self, version: int, key: str, cached: CachedResponse) -> None:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            if self._queue_set(pipe, version, key, cached):
+                await pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning("Response cache write failed: %s", exc)
+
+
+def _redis_key(version: int, key: str) -> str:
+    return f"{ENTRY_PREFIX}:{version}:{key}"
+
+
+def _encode(cached: CachedResponse) -> dict:
+    return {"body": cached.body, "etag": cached.etag, "headers": json.dumps(cached.headers)}
+
+
+def _decode(stored: dict) -> CachedResponse:
+    return CachedResponse(
+        body=stored[b"body"],
+        etag=stored[b"etag"].decode("ascii"),
+        headers=json.loads(stored[b"headers"]),
+    )
+
+
+def _client_options(settings: Settings) -> dict:
+    return {
+        "socket_timeout": settings.response_cache_socket_timeout_seconds,
+        "socket_connect_timeout": settings.response_cache_socket_timeout_seconds,
+    }
+
+
+def _cache_options(settings: Settings) -> dict:
+    return {
+        "ttl_seconds": settings.response_cache_ttl_seconds,
+        "local_entries": settings.response_cache_local_entries,
+        "max_entry_bytes": settings.response_cache_max_entry_bytes,
+    }
+
+
+def build_response_cache(settings: Settings) -> ResponseCache:
+    client = redis.Redis.from_url(settings.redis_url, **_client_options(settings))
+    return ResponseCache(client, **_cache_options(settings))
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache | None:
+    settings = get_settings()
+    if not settings.response_cache_enabled:
+        return None
+    return build_response_cache(settings)
+
+
+@lru_cache
+def get_async_response_cache() -> AsyncResponseCache | None:
+    settings = get_settings()
+    if not settings.response_cache_enabled:
+        return None
+    client = redis.asyncio.Redis.from_url(settings.redis_url, **_client_options(settings))
+    return AsyncResponseCache(client, **_cache_options(settings))
@@ -1,22 +1,57 @@
-from collections import Counter
+from collections.abc import Iterable
 
-HIGH_CONFIDENCE_KEYWORDS = {"water main break", "flood", "burst pipe", "road closed", "crews on scene"}
-MEDIUM_CONFIDENCE_KEYWORDS = {"water leak", "no water", "water outage", "sinkhole", "low pressure"}
+from app.services.keywords import KEYWORD_REGISTRY
 
+HIGH_CONFIDENCE_KEYWORDS = set(KEYWORD_REGISTRY.tiers["high"])
+MEDIUM_CONFIDENCE_KEYWORDS = set(KEYWORD_REGISTRY.tiers["medium"])
+SCORE_FORMULA = "min(100, high*25 + medium*10 + unique_sources*15)"
+
+
+def confidence_keyword_hits(text: str, tier_hits: dict[str, list[str]] | None = None) -> dict[str, list[str]]:
+    if tier_hits is None:
+        tier_hits = KEYWORD_REGISTRY.hits(text)
+    return {"high": sorted(tier_hits["high"]), "medium": sorted(tier_hits["medium"])}
 
-def compute_confidence(signals_text: list[str], source_types: list[str]) -> tuple[float, dict]:
-    normalized = " ".join(signals_text).lower()
 
-    high_hits = sum(1 for keyword in HIGH_CONFIDENCE_KEYWORDS if keyword in normalized)
-    medium_hits = sum(1 for keyword in MEDIUM_CONFIDENCE_KEYWORDS if keyword in normalized)
-    unique_sources = len(set(source_types))
+# Running per-incident scoring state: the keyword sets hit so far and signal counts per
+# source type. Folding signals one at a time yields the same state as folding them all
+# at once, which is what lets ingest update scores without re-reading old signals.
+def empty_score_state() -> dict:
+    return {"high": [], "medium": [], "sources": {}}
+
+
+def fold_score_state(state: dict, keyword_hits: dict[str, Iterable[str]], source_type: str | None = None) -> dict:
+    sources = dict(state.get("sources", {}))
+    if source_type is not None:
+        sources[source_type] = sources.get(source_type, 0) + 1
+    return {
+        "high": sorted(set(state.get("high", ())) | set(keyword_hits.get("high", ()))),
+        "medium": sorted(set(state.get("medium", ())) | set(keyword_hits.get("medium", ()))),
+        "sources": sources,
+    }
+
+
+def score_from_state(state: dict) -> tuple[float, dict]:
+    high_hits = len(state.get("high", ()))
+    medium_hits = len(state.get("medium", ()))
+    source_distribution = dict(sorted(state.get("sources", {}).items()))
+    unique_sources = len(source_distribution)
 
     score = min(100.0, (high_hits * 25.0) + (medium_hits * 10.0) + (unique_sources * 15.0))
     breakdown = {
         "high_keyword_hits": high_hits,
         "medium_keyword_hits": medium_hits,
         "source_diversity": unique_sources,
-        "source_distribution": dict(Counter(source_types)),
-        "formula": "min(100, high*25 + medium*10 + unique_sources*15)",
+        "source_distribution": source_distribution,
+        "formula": SCORE_FORMULA,
     }
     return score, breakdown
+
+
+def compute_confidence(signals_text: list[str], source_types: list[str]) -> tuple[float, dict]:
+    state = empty_score_state()
+    for text in signals_text:
+        state = fold_score_state(state, confidence_keyword_hits(text))
+    for source_type in source_types:
+        state = fold_score_state(state, {}, source_type)
+    return score_from_state(state)
@@ -0,0 +1,52 @@
+import argparse
+import random
+import time
+import tracemalloc
+
+import feedparser
+
+from app.jobs.rss_utils import entries_since, iter_feed_entries, parse_feed
+from benchmarks.data import rss_document
+
+DEFAULT_ITEMS = (500, 5_000, 20_000)
+
+
+def _measure(fn, repeat: int) -> tuple[float, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Feed parsing cost: feedparser vs streaming parser")
+    parser.add_argument("--items", type=int, nargs="*", default=list(DEFAULT_ITEMS))
+    parser.add_argument("--new", type=int, default=20, help="new entries above the high-water mark")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'items':>7} {'MiB':>6} {'parser':>12} {'ms':>9} {'peak MiB':>9}")
+    for items in args.items:
+        body = rss_document(rng, items)
+        high_water_mark = f"guid-{items - args.new}"
+        cases = {
+            "feedparser": lambda: feedparser.parse(body).entries,
+            "parse_feed": lambda: parse_feed(body.decode("utf-8")).entries,
+            "stream": lambda: list(iter_feed_entries(body)),
+            "stream+hwm": lambda: list(entries_since(iter_feed_entries(body), high_water_mark)),
+        }
+        for name, fn in cases.items():
+            elapsed, peak = _measure(fn, args.repeat)
+            print(f"{items:>7} {len(body) / (1024 * 1024):>6.1f} {name:>12} {elapsed * 1000:>9.1f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
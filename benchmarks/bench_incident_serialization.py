@@ -0,0 +1,116 @@
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from geoalchemy2.shape import from_shape, to_shape
+from shapely.geometry import Point
+
+from app.models import Incident
+from app.repositories.incidents import SUMMARY_COLUMNS
+from app.schemas.incidents import IncidentSummary
+
+SUMMARY_FIELDS = tuple(column.key for column in SUMMARY_COLUMNS)
+
+
+def _incidents(rng: random.Random, count: int) -> list[Incident]:
+    now = datetime.now(timezone.utc)
+    incidents = []
+    for _ in range(count):
+        seen = now - timedelta(minutes=rng.randint(0, 10_000))
+        latitude, longitude = rng.uniform(43.6, 43.9), rng.uniform(-79.6, -79.1)
+        incidents.append(
+            Incident(
+                id=uuid.uuid4(),
+                first_seen=seen,
+                last_seen=seen,
+                confidence_score=rng.uniform(0, 100),
+                score_breakdown={"high_keyword_hits": 1, "medium_keyword_hits": 0, "source_diversity": 1},
+                centroid=from_shape(Point(longitude, latitude), srid=4326),
+                signal_count=3,
+                min_latitude=latitude - 0.001,
+                min_longitude=longitude - 0.001,
+                max_latitude=latitude + 0.001,
+                max_longitude=longitude + 0.001,
+            )
+        )
+    return incidents
+
+
+def _values(incidents: list[Incident]) -> list[tuple]:
+    # What the projected query returns: the same values, with coordinates already floats.
+    values = []
+    for incident in incidents:
+        point = to_shape(incident.centroid)
+        values.append(
+            (
+                incident.id,
+                incident.first_seen,
+                incident.last_seen,
+                incident.confidence_score,
+                incident.score_breakdown,
+                point.y,
+                point.x,
+                incident.signal_count,
+                incident.min_latitude,
+                incident.min_longitude,
+                incident.max_latitude,
+                incident.max_longitude,
+            )
+        )
+    return values
+
+
+def _orm_path(incidents: list[Incident]) -> list[IncidentSummary]:
+    return [
+        IncidentSummary(
+            id=incident.id,
+            first_seen=incident.first_seen,
+            last_seen=incident.last_seen,
+            confidence_score=incident.confidence_score,
+            score_breakdown=incident.score_breakdown,
+            latitude=to_shape(incident.centroid).y,
+            longitude=to_shape(incident.centroid).x,
+            signal_count=incident.signal_count,
+            min_latitude=incident.min_latitude,
+            min_longitude=incident.min_longitude,
+            max_latitude=incident.max_latitude,
+            max_longitude=incident.max_longitude,
+        )
+        for incident in incidents
+    ]
+
+
+def _row_path(rows: list[dict]) -> list[IncidentSummary]:
+    return [IncidentSummary(**row) for row in rows]
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-row cost of building IncidentSummary responses")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    incidents = _incidents(random.Random(args.seed), args.rows)
+    rows = [dict(zip(SUMMARY_FIELDS, values)) for values in _values(incidents)]
+    orm_s = _time(lambda: _orm_path(incidents), args.repeat)
+    row_s = _time(lambda: _row_path(rows), args.repeat)
+    print(f"rows: {args.rows} (Python-side cost only; ORM hydration in the driver is not included)")
+    print(f"{'path':>22} {'total ms':>9} {'us/row':>7}")
+    print(f"{'ORM + to_shape x2':>22} {orm_s * 1000:>9.1f} {orm_s / args.rows * 1e6:>7.2f}")
+    print(f"{'projected row':>22} {row_s * 1000:>9.1f} {row_s / args.rows * 1e6:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import random
+import string
+import time
+
+from app.services.keywords import KEYWORD_TIERS, KeywordMatcher
+
+DEFAULT_SIZES = (10, 50, 100, 200, 400, 800)
+
+
+def _random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+
+def _terms(rng: random.Random, count: int) -> list[str]:
+    base = [term for terms in KEYWORD_TIERS.values() for term in terms]
+    extra = [" ".join(_random_word(rng) for _ in range(rng.randint(1, 3))) for _ in range(max(count - len(base), 0))]
+    return (base + extra)[:count]
+
+
+def _document(rng: random.Random, words: int) -> str:
+    vocabulary = [_random_word(rng) for _ in range(2_000)] + ["water", "main", "break", "flooding", "crews", "scene"]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _substring_scan(terms: list[str], text: str) -> set[str]:
+    lowered = text.lower()
+    return {term for term in terms if term.rstrip("*") in lowered}
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Keyword scan cost as the keyword list grows")
+    parser.add_argument("--words", type=int, default=20_000, help="words per scanned document")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    text = _document(rng, args.words)
+    print(f"document: {len(text) / 1024:.0f} KiB")
+    print(f"{'terms':>6} {'matcher ms':>11} {'substring ms':>13}")
+    for size in args.sizes:
+        terms = _terms(rng, size)
+        matcher = KeywordMatcher(terms)
+        matcher_s = _time(lambda: matcher.find(text), args.repeat)
+        substring_s = _time(lambda: _substring_scan(terms, text), args.repeat)
+        print(f"{size:>6} {matcher_s * 1000:>11.2f} {substring_s * 1000:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+import httpx
+
+from benchmarks import data
+from benchmarks.load_incidents import percentile
+
+# End-to-end capacity harness against a local PostGIS (docker compose up db redis, then
+# alembic upgrade head). App modules are imported lazily because they read DATABASE_URL,
+# RSS_URLS and RESPONSE_CACHE_ENABLED from the environment when first imported.
+SEED_BATCH_ROWS = 100_000
+
+
+def seeded_id(seed: int, kind: str, n: int) -> uuid.UUID:
+    # Same value as md5('<seed>-<kind>-<n>')::uuid in the seeding SQL, so the harness can
+    # address seeded rows without reading them back.
+    return uuid.UUID(hashlib.md5(f"{seed}-{kind}-{n}".encode()).hexdigest())
+
+
+def _setseed(seed: int, batch: int) -> float:
+    return ((seed * 7919 + batch) % 20_000) / 10_000 - 1.0
+
+
+SEED_INCIDENTS_SQL = """
+INSERT INTO incidents (id, first_seen, last_seen, confidence_score, score_breakdown, score_state, centroid, created_at, updated_at)
+SELECT md5(CAST(:seed AS text) || '-i-' || n)::uuid, seen - interval '90 minutes', seen, round((random() * 100)::numeric, 1),
+       '{}'::jsonb, '{}'::jsonb, ST_SetSRID(ST_MakePoint(lon, lat), 4326), seen, seen
+FROM (
+    SELECT n, :now - random() * (:history_days * interval '1 day') AS seen,
+           CASE WHEN random() < 0.1 THEN :min_lon + random() * (:max_lon - :min_lon)
+                ELSE (:centre_lons)[hotspot] + :spread * sqrt(-2 * ln(1 - random())) * cos(2 * pi() * random()) END AS lon,
+           CASE WHEN random() < 0.1 THEN :min_lat + random() * (:max_lat - :min_lat)
+                ELSE (:centre_lats)[hotspot] + :spread * sqrt(-2 * ln(1 - random())) * sin(2 * pi() * random()) END AS lat
+    FROM (SELECT n, width_bucket(random(), :thresholds) AS hotspot FROM generate_series(:start, :stop - 1) AS n) AS picked
+) AS placed
+"""
+
+# Signals attach to incidents with a squared-uniform pick, so a few incidents carry long
+# signal histories and most carry one or two, as in production.
+SEED_SIGNALS_SQL = """
+WITH placed AS (
+    SELECT n, md5(CAST(:seed AS text) || '-i-' || floor(power(random(), 2) * :incidents)::int)::uuid AS incident_id,
+           random() AS jitter_a, random() AS jitter_b, random() AS age
+    FROM generate_series(:start, :stop - 1) AS n
+), inserted AS (
+    INSERT INTO signals (id, source_type, source_id, title, content, extracted_text, features, url, observed_at,
+                         fetched_at, latitude, longitude, geom, created_at)
+    SELECT md5(CAST(:seed AS text) || '-s-' || p.n)::uuid, 'seed', 'seed-' || p.n, 'Seeded signal ' || p.n,
+           'water main break reported, crews on scene', 'water main break reported, crews on scene',
+           '{}'::jsonb, 'https://seed.invalid/' || p.n, i.last_seen - p.age * interval '90 minutes',
+           i.last_seen, ST_Y(i.centroid) + (p.jitter_a - 0.5) * 0.002, ST_X(i.centroid) + (p.jitter_b - 0.5) * 0.002,
+           ST_SetSRID(ST_MakePoint(ST_X(i.centroid) + (p.jitter_b - 0.5) * 0.002,
+                                   ST_Y(i.centroid) + (p.jitter_a - 0.5) * 0.002), 4326),
+           i.last_seen
+    FROM placed AS p JOIN incidents AS i ON i.id = p.incident_id
+    RETURNING id, created_at
+)
+INSERT INTO incident_signals (incident_id, signal_id, linked_at)
+SELECT p.incident_id, md5(CAST(:seed AS text) || '-s-' || p.n)::uuid, now()
+FROM placed AS p JOIN inserted AS s ON s.id = md5(CAST(:seed AS text) || '-s-' || p.n)::uuid
+"""
+
+
+def seed(args: argparse.Namespace) -> dict:
+    from sqlalchemy import text
+
+    from app.db.session import engine
+    from app.repositories.incidents import repair_extents_statement
+
+    rng = random.Random(args.seed)
+    centres = [data.toronto_point(rng) for _ in range(args.hotspots)]
+    weights = [1.0 / (rank**1.2) for rank in range(1, args.hotspots + 1)]
+    total = sum(weights)
+    thresholds = [sum(weights[:index]) / total for index in range(args.hotspots)]
+    min_lon, min_lat, max_lon, max_lat = data.TORONTO_BBOX
+    common = {
+        "seed": str(args.seed),
+        "now": datetime.now(timezone.utc).replace(microsecond=0),
+        "history_days": args.history_days,
+        "incidents": args.incidents,
+    }
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        if args.reset:
+            conn.execute(text("TRUNCATE incident_feedback, incident_signals, signals, incidents, feed_state"))
+            conn.commit()
+        for batch, start in enumerate(range(0, args.incidents, SEED_BATCH_ROWS)):
+            conn.execute(text("SELECT setseed(:value)"), {"value": _setseed(args.seed, batch)})
+            conn.execute(
+                text(SEED_INCIDENTS_SQL),
+                {
+                    **common,
+                    "start": start,
+                    "stop": min(start + SEED_BATCH_ROWS, args.incidents),
+                    "min_lon": min_lon,
+                    "min_lat": min_lat,
+                    "max_lon": max_lon,
+                    "max_lat": max_lat,
+                    "centre_lons": [lon for _, lon in centres],
+                    "centre_lats": [lat for lat, _ in centres],
+                    "thresholds": thresholds,
+                    "spread": 0.01,
+                },
+            )
+            conn.commit()
+        for batch, start in enumerate(range(0, args.signals, SEED_BATCH_ROWS)):
+            conn.execute(text("SELECT setseed(:value)"), {"value": _setseed(args.seed, 10_000 + batch)})
+            conn.execute(
+                text(SEED_SIGNALS_SQL),
+                {**common, "start": start, "stop": min(start + SEED_BATCH_ROWS, args.signals)},
+            )
+            conn.commit()
+            print(f"  signals {min(start + SEED_BATCH_ROWS, args.signals):>10,}")
+        conn.execute(repair_extents_statement())
+        conn.commit()
+        conn.execute(text("ANALYZE incidents, signals, incident_signals"))
+        conn.commit()
+    elapsed = time.perf_counter() - started
+    print(f"seeded {args.incidents:,} incidents and {args.signals:,} signals in {elapsed:.1f}s")
+    return {"incidents": args.incidents, "signals": args.signals, "seconds": elapsed}
+
+
+# Counts statements per operation on both engines; API and ingest run in this process so
+# every query is seen.
+class QueryCounter:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def install(self) -> None:
+        from sqlalchemy import event
+
+        from app.db.session import async_engine, engine
+
+        for traced in (engine, async_engine.sync_engine):
+            event.listen(traced, "before_cursor_execute", self._seen)
+
+    def _seen(self, *_args) -> None:
+        with self._lock:
+            self.value += 1
+
+
+def _summary(name: str, latencies: list[float], elapsed: float, queries: int, operations: int, **extra) -> dict:
+    row = {
+        "operation": name,
+        "count": operations,
+        "throughput_per_s": operations / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "queries_per_op": queries / operations if operations else 0.0,
+        **extra,
+    }
+    print(
+        f"{name:<18} {operations:>8} {row['throughput_per_s']:>9.1f} {row['p50_ms']:>8.1f} "
+        f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['queries_per_op']:>8.1f}"
+        + "".join(f"  {key}={value}" for key, value in extra.items())
+    )
+    return row
+
+
+def stub_feed(feed: int, poll: int, items: int, new_per_poll: int) -> bytes:
+    # Newest first; each poll publishes ``new_per_poll`` entries above the previous poll's.
+    rng = random.Random(feed * 1_000_003 + poll)
+    newest = poll * new_per_poll + items
+    now = datetime.now(timezone.utc)
+    parts = [f'<?xml version="1.0"?><rss version="2.0"><channel><title>Stub feed {feed}</title>']
+    for index in range(newest, newest - items, -1):
+        parts.append(
+            f"<item><title>{escape(data.signal_text(rng, 9))}</title>"
+            f"<description>{escape(data.signal_text(rng, 60))}</description>"
+            f"<link>http://stub.invalid/{feed}/{index}</link><guid>stub-{feed}-{index}</guid>"
+            f"<pubDate>{format_datetime(now - timedelta(seconds=newest - index), usegmt=True)}</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode("utf-8")
+
+
+class StubFeedServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int, items: int, new_per_poll: int) -> None:
+        super().__init__(("127.0.0.1", port), _StubFeedHandler)
+        self.items = items
+        self.new_per_poll = new_per_poll
+        self.poll = 0
+
+
+class _StubFeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        try:
+            feed = int(self.path.strip("/").removeprefix("feeds/").removesuffix(".xml"))
+        except ValueError:
+            self.send_error(404)
+            return
+        body = stub_feed(feed, self.server.poll, self.server.items, self.server.new_per_poll)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+def ingest(args: argparse.Namespace, counter: QueryCounter) -> dict:
+    from app.jobs.tasks_ingest import ingest_rss
+
+    server = StubFeedServer(args.feed_port, args.feed_items, args.new_per_poll)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    latencies: list[float] = []
+    inserted = 0
+    queries_before = counter.value
+    started = time.perf_counter()
+    try:
+        for poll in range(args.polls):
+            server.poll = poll
+            poll_started = time.perf_counter()
+            result = ingest_rss(fan_out=False)
+            latencies.append(time.perf_counter() - poll_started)
+            inserted += result["inserted"]
+    finally:
+        server.shutdown()
+    elapsed = time.perf_counter() - started
+    return _summary(
+        "ingest_rss",
+        latencies,
+        elapsed,
+        counter.value - queries_before,
+        args.polls,
+        signals_per_min=round(inserted / elapsed * 60, 1) if elapsed else 0.0,
+    )
+
+
+def _tile(latitude: float, longitude: float, zoom: int) -> str:
+    scale = 2**zoom
+    x = int((longitude + 180.0) / 360.0 * scale)
+    y = int((1.0 - math.asinh(math.tan(math.radians(latitude))) / math.pi) / 2.0 * scale)
+    return f"/tiles/{zoom}/{x}/{y}.mvt"
+
+
+def _operations(args: argparse.Namespace) -> dict[str, Callable[[random.Random], tuple[str, dict]]]:
+    def viewport(rng: random.Random) -> str:
+        min_lon, min_lat, max_lon, max_lat = data.TORONTO_BBOX
+        lon = rng.uniform(min_lon, max_lon - args.span)
+        lat = rng.uniform(min_lat, max_lat - args.span)
+        return f"{lon:.5f},{lat:.5f},{lon + args.span:.5f},{lat + args.span:.5f}"
+
+    return {
+        "incidents": lambda rng: ("/incidents", {"limit": args.limit}),
+        "incidents_bbox": lambda rng: ("/incidents", {"limit": args.limit, "bbox": viewport(rng)}),
+        "incident_detail": lambda rng: (f"/incidents/{seeded_id(args.seed, 'i', rng.randrange(args.incidents))}", {}),
+        "tile": lambda rng: (_tile(*data.toronto_point(rng), args.tile_zoom), {}),
+    }
+
+
+async def _drive(base_url: str, build, args: argparse.Namespace) -> tuple[list[float], Counter, float]:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+
+    async def client(http: httpx.AsyncClient, rng: random.Random, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            path, params = build(rng)
+            start = time.perf_counter()
+            try:
+                response = await http.get(path, params=params)
+                statuses[response.status_code] += 1
+            except httpx.HTTPError as exc:
+                statuses[type(exc).__name__] += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as http:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(client(http, random.Random(args.seed + index), deadline) for index in range(args.clients)))
+        return latencies, statuses, time.perf_counter() - started
+
+
+def api(args: argparse.Namespace, counter: QueryCounter) -> list[dict]:
+    import uvicorn
+
+    from app.main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.api_port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    rows = []
+    try:
+        for name, build in _operations(args).items():
+            queries_before = counter.value
+            latencies, statuses, elapsed = asyncio.run(_drive(f"http://127.0.0.1:{args.api_port}", build, args))
+            rows.append(
+                _summary(name, latencies, elapsed, counter.value - queries_before, sum(statuses.values()), statuses=dict(statuses))
+            )
+    finally:
+        server.should_exit = True
+        thread.join()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed PostGIS, then measure ingest and API capacity on this node")
+    parser.add_argument("phases", nargs="*", choices=("seed", "ingest", "api"), default=["seed", "ingest", "api"])
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action=argparse.BooleanOptionalAction, default=True, help="truncate data tables before seeding")
+    parser.add_argument("--incidents", type=int, default=100_000)
+    parser.add_argument("--signals", type=int, default=1_000_000)
+    parser.add_argument("--hotspots", type=int, default=40)
+    parser.add_argument("--history-days", type=int, default=365)
+    parser.add_argument("--feeds", type=int, default=20)
+    parser.add_argument("--feed-items", type=int, default=200, help="entries per stub feed document")
+    parser.add_argument("--new-per-poll", type=int, default=25, help="new entries per feed on each poll")
+    parser.add_argument("--polls", type=int, default=10)
+    parser.add_argument("--feed-port", type=int, default=8765)
+    parser.add_argument("--api-port", type=int, default=8766)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per API operation")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--span", type=float, default=0.05, help="viewport size in degrees")
+    parser.add_argument("--tile-zoom", type=int, default=14)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--response-cache", action=argparse.BooleanOptionalAction, default=False)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    os.environ["RSS_URLS"] = ",".join(f"http://127.0.0.1:{args.feed_port}/feeds/{feed}.xml" for feed in range(args.feeds))
+    os.environ["RESPONSE_CACHE_ENABLED"] = str(args.response_cache).lower()
+
+    report: dict = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "arguments": {key: value for key, value in vars(args).items() if key not in ("database_url", "output")},
+    }
+    if "seed" in args.phases:
+        report["seed"] = seed(args)
+
+    counter = QueryCounter()
+    counter.install()
+    operations = []
+    print(f"{'operation':<18} {'count':>8} {'per s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8}")
+    if "ingest" in args.phases:
+        operations.append(ingest(args, counter))
+    if "api" in args.phases:
+        operations.extend(api(args, counter))
+    report["operations"] = operations
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+from app.services.clustering import IncidentCandidate
+
+# Seeded synthetic inputs shared by the benchmarks. Everything is derived from the
+# caller's random.Random, so a given seed always produces the same data.
+TORONTO_BBOX = (-79.64, 43.58, -79.11, 43.86)
+EPOCH = datetime(2024, 9, 10, 12, 0, tzinfo=timezone.utc)
+STREETS = ("King", "Queen", "Bathurst", "Spadina", "Yonge", "Dundas", "Bloor", "Jane", "Finch", "Eglinton")
+PHRASES = (
+    "water main break",
+    "crews on scene",
+    "road closed",
+    "flooding reported",
+    "no water",
+    "low pressure",
+    "sinkhole",
+    "burst pipe",
+    "traffic delays",
+    "repair underway",
+    "residents advised",
+    "service restored",
+)
+
+
+@dataclass
+class SyntheticSignal:
+    latitude: float
+    longitude: float
+    observed_at: datetime
+    text: str
+    source_type: str
+
+
+def toronto_point(rng: random.Random) -> tuple[float, float]:
+    min_lon, min_lat, max_lon, max_lat = TORONTO_BBOX
+    return rng.uniform(min_lat, max_lat), rng.uniform(min_lon, max_lon)
+
+
+def signal_text(rng: random.Random, words: int = 40) -> str:
+    first, second = rng.sample(STREETS, 2)
+    phrases = " ".join(rng.choice(PHRASES) for _ in range(max(1, words // 3)))
+    return f"Update at {first} & {second}: {phrases}"
+
+
+def random_signals(rng: random.Random, count: int, hours: int = 6) -> list[SyntheticSignal]:
+    signals = []
+    for _ in range(count):
+        latitude, longitude = toronto_point(rng)
+        signals.append(
+            SyntheticSignal(
+                latitude=latitude,
+                longitude=longitude,
+                observed_at=EPOCH + timedelta(seconds=rng.uniform(0, hours * 3600)),
+                text=signal_text(rng),
+                source_type=rng.choice(("rss", "reddit", "311")),
+            )
+        )
+    return signals
+
+
+def incident_set(
+    rng: random.Random,
+    count: int,
+    hotspots: int = 12,
+    skew: float = 1.2,
+    spread_deg: float = 0.01,
+    hours: int = 6,
+) -> list[IncidentCandidate]:
+    # Density is skewed like real breaks: hotspot weights follow a Zipf-like law, so a
+    # few neighbourhoods hold most incidents and the rest of the city is sparse.
+    centres = [toronto_point(rng) for _ in range(hotspots)]
+    weights = [1.0 / (rank**skew) for rank in range(1, hotspots + 1)]
+    incidents = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            latitude, longitude = toronto_point(rng)
+        else:
+            centre_lat, centre_lon = rng.choices(centres, weights=weights)[0]
+            latitude = rng.gauss(centre_lat, spread_deg)
+            longitude = rng.gauss(centre_lon, spread_deg)
+        incidents.append(
+            IncidentCandidate(
+                id=uuid.UUID(int=rng.getrandbits(128)),
+                latitude=latitude,
+                longitude=longitude,
+                last_seen=EPOCH + timedelta(seconds=rng.uniform(0, hours * 3600)),
+            )
+        )
+    return incidents
+
+
+# Items are listed newest first, like real feeds, with one-minute spacing.
+def rss_document(rng: random.Random, items: int, words: int = 60) -> bytes:
+    parts = ['<?xml version="1.0"?><rss version="2.0"><channel><title>Synthetic</title>']
+    for index in range(items, 0, -1):
+        published = format_datetime(EPOCH - timedelta(minutes=items - index), usegmt=True)
+        parts.append(
+            f"<item><title>Item {index}: {escape(signal_text(rng, 9))}</title>"
+            f"<description>{escape(signal_text(rng, words))}</description>"
+            f"<link>https://example.com/{index}</link><guid>guid-{index}</guid>"
+            f"<pubDate>{published}</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode("utf-8")
+
+
+def atom_document(rng: random.Random, items: int, words: int = 60) -> bytes:
+    parts = ['<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Synthetic</title>']
+    for index in range(items, 0, -1):
+        updated = (EPOCH - timedelta(minutes=items - index)).isoformat()
+        parts.append(
+            f"<entry><title>Item {index}: {escape(signal_text(rng, 9))}</title>"
+            f"<summary>{escape(signal_text(rng, words))}</summary>"
+            f'<link href="https://example.com/atom/{index}"/><id>urn:synthetic:{index}</id>'
+            f"<updated>{updated}</updated></entry>"
+        )
+    parts.append("</feed>")
+    return "".join(parts).encode("utf-8")
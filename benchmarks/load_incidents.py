@@ -0,0 +1,127 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import httpx
+
+from app.core.config import get_settings
+
+TORONTO_BBOX = (-79.64, 43.58, -79.11, 43.86)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _viewport(rng: random.Random, span: float) -> str:
+    min_lon, min_lat, max_lon, max_lat = TORONTO_BBOX
+    lon = rng.uniform(min_lon, max_lon - span)
+    lat = rng.uniform(min_lat, max_lat - span)
+    return f"{lon:.5f},{lat:.5f},{lon + span:.5f},{lat + span:.5f}"
+
+
+async def _client(
+    http: httpx.AsyncClient,
+    rng: random.Random,
+    deadline: float,
+    args: argparse.Namespace,
+    latencies: list[float],
+    statuses: Counter,
+) -> None:
+    while time.perf_counter() < deadline:
+        params = {"limit": args.limit}
+        if args.pan:
+            # Random viewports defeat the response cache, so every request reaches the database.
+            params["bbox"] = _viewport(rng, args.span)
+        start = time.perf_counter()
+        try:
+            response = await http.get("/incidents", params=params)
+            statuses[response.status_code] += 1
+        except httpx.HTTPError as exc:
+            statuses[type(exc).__name__] += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+async def _run(base_url: str, args: argparse.Namespace) -> dict:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as http:
+        deadline = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(
+                _client(http, random.Random(args.seed + index), deadline, args, latencies, statuses)
+                for index in range(args.clients)
+            )
+        )
+
+    total = sum(statuses.values())
+    result = {
+        "target": base_url,
+        "clients": args.clients,
+        "requests_per_s": total / args.duration,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "statuses": {str(status): count for status, count in statuses.items()},
+    }
+    print(
+        f"{base_url:<28} {result['requests_per_s']:>8.1f} {result['mean_ms']:>8.1f} "
+        f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f}  {dict(statuses)}"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Concurrent GET /incidents load test; pass several --base-url values to compare deployments"
+    )
+    parser.add_argument("--base-url", action="append", required=True)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per target")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--pan", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--span", type=float, default=0.05, help="viewport size in degrees")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the per-target results as JSON")
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients, {args.duration:.0f}s per target")
+    print(f"{'target':<28} {'req/s':>8} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses")
+    results = [asyncio.run(_run(base_url, args)) for base_url in args.base_url]
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(_report(args, results), handle, indent=2)
+
+
+def _report(args: argparse.Namespace, results: list[dict]) -> dict:
+    # Pool sizes come from this shell's environment, so run the servers from the same one.
+    settings = get_settings()
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "arguments": {key: value for key, value in vars(args).items() if key != "output"},
+        # The sync engine keeps SQLAlchemy's QueuePool defaults.
+        "sync_db_pool": {"size": 5, "max_overflow": 10},
+        "async_db_pool": {"size": settings.async_db_pool_size, "max_overflow": settings.async_db_max_overflow},
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    main()
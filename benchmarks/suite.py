@@ -0,0 +1,179 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from app.jobs.rss_utils import entry_datetime, parse_feed
+from app.services.clustering import haversine_meters, pick_incident_for_signal, pick_incidents_for_signals
+from app.services.scoring import compute_confidence
+from benchmarks import data
+
+DISTANCE_M = 250.0
+WINDOW_HOURS = 6
+
+
+@dataclass
+class Case:
+    name: str
+    scale: int
+    unit: str
+    setup: Callable[[random.Random, int], Callable[[], object]]
+
+
+def _haversine(rng: random.Random, scale: int):
+    pairs = [(*data.toronto_point(rng), *data.toronto_point(rng)) for _ in range(scale)]
+    return lambda: [haversine_meters(*pair) for pair in pairs]
+
+
+def _pick_one(rng: random.Random, scale: int):
+    incidents = data.incident_set(rng, scale)
+    signals = data.random_signals(rng, 50)
+    return lambda: [
+        pick_incident_for_signal(incidents, s.latitude, s.longitude, s.observed_at, DISTANCE_M, WINDOW_HOURS)
+        for s in signals
+    ]
+
+
+def _pick_batch(rng: random.Random, scale: int):
+    incidents = data.incident_set(rng, 2_000)
+    signals = data.random_signals(rng, scale)
+    lats = [s.latitude for s in signals]
+    lons = [s.longitude for s in signals]
+    observed = [s.observed_at for s in signals]
+    return lambda: pick_incidents_for_signals(incidents, lats, lons, observed, DISTANCE_M, WINDOW_HOURS)
+
+
+def _confidence(rng: random.Random, scale: int):
+    signals = data.random_signals(rng, scale)
+    texts = [s.text for s in signals]
+    sources = [s.source_type for s in signals]
+    return lambda: compute_confidence(texts, sources)
+
+
+def _parse(document: Callable[[random.Random, int], bytes]):
+    def setup(rng: random.Random, scale: int):
+        body = document(rng, scale).decode("utf-8")
+        return lambda: parse_feed(body).entries
+
+    return setup
+
+
+def _entry_datetime(rng: random.Random, scale: int):
+    half = scale // 2
+    entries = parse_feed(data.rss_document(rng, half).decode()).entries
+    entries += parse_feed(data.atom_document(rng, scale - half).decode()).entries
+    fallback = datetime.now(timezone.utc)
+    return lambda: [entry_datetime(entry, fallback) for entry in entries]
+
+
+def _cases(quick: bool) -> list[Case]:
+    def scaled(name: str, unit: str, setup, full: tuple[int, ...], small: tuple[int, ...]) -> list[Case]:
+        return [Case(name, scale, unit, setup) for scale in (small if quick else full)]
+
+    return [
+        *scaled("haversine_meters", "pairs", _haversine, (1_000, 10_000, 100_000), (1_000, 10_000)),
+        *scaled("pick_incident_for_signal", "incidents", _pick_one, (100, 1_000, 10_000), (100, 1_000)),
+        *scaled("pick_incidents_for_signals", "signals", _pick_batch, (100, 1_000, 5_000), (100, 1_000)),
+        *scaled("compute_confidence", "signals", _confidence, (10, 100, 1_000), (10, 100)),
+        *scaled("parse_feed.rss", "items", _parse(data.rss_document), (50, 500, 5_000), (50, 500)),
+        *scaled("parse_feed.atom", "items", _parse(data.atom_document), (50, 500, 5_000), (50, 500)),
+        *scaled("entry_datetime", "entries", _entry_datetime, (100, 1_000, 10_000), (100, 1_000)),
+    ]
+
+
+def _time(fn, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(cases: list[Case], repeat: int, seed: int) -> list[dict]:
+    results = []
+    for case in cases:
+        fn = case.setup(random.Random(seed), case.scale)
+        fn()
+        samples = _time(fn, repeat)
+        results.append(
+            {
+                "name": case.name,
+                "scale": case.scale,
+                "unit": case.unit,
+                "min_s": min(samples),
+                "median_s": statistics.median(samples),
+            }
+        )
+        print(f"{case.name:<28} {case.scale:>8} {case.unit:<10} {min(samples) * 1000:>10.3f} {statistics.median(samples) * 1000:>10.3f}")
+    return results
+
+
+# Compares best-of timings, which are the least noisy. A case regresses when it is slower
+# than the baseline by more than ``threshold`` (0.2 = 20%); cases missing on either side
+# are reported but never fail the run.
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    previous = {(row["name"], row["scale"]): row for row in baseline}
+    regressions = []
+    print(f"\n{'case':<28} {'scale':>8} {'base ms':>10} {'now ms':>10} {'change':>8}")
+    for row in results:
+        old = previous.get((row["name"], row["scale"]))
+        if old is None:
+            print(f"{row['name']:<28} {row['scale']:>8} {'-':>10} {row['min_s'] * 1000:>10.3f}      new")
+            continue
+        change = row["min_s"] / old["min_s"] - 1.0 if old["min_s"] else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(f"{row['name']}@{row['scale']}")
+        print(
+            f"{row['name']:<28} {row['scale']:>8} {old['min_s'] * 1000:>10.3f} "
+            f"{row['min_s'] * 1000:>10.3f} {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline micro-benchmarks for clustering, scoring and feed parsing")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="smaller scales, for CI smoke runs")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--compare", help="baseline JSON written by an earlier --output run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before a case fails")
+    args = parser.parse_args()
+
+    cases = [case for case in _cases(args.quick) if args.filter in case.name]
+    print(f"{'case':<28} {'scale':>8} {'unit':<10} {'min ms':>10} {'median ms':>10}")
+    results = run(cases, args.repeat, args.seed)
+
+    if args.output:
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, parse_bbox
+from app.api.routes import DEFAULT_PAGE_SIZE, INCIDENT_SUMMARIES, MAX_PAGE_SIZE
+from app.db.session import get_db
+from app.repositories.incidents import IncidentRepository
+from app.schemas.incidents import IncidentSummary
+
+# Baseline for benchmarks.load_incidents: GET /incidents as a plain ``def`` route on the sync
+# engine (FastAPI runs it in its threadpool), the way it was served before the async
+# conversion. Same query and serialization, no response cache.
+app = FastAPI(title="incidents sync baseline")
+
+
+@app.get("/incidents")
+def list_incidents(
+    since: datetime | None = Query(default=None),
+    min_confidence: float = Query(default=0.0, ge=0.0, le=100.0),
+    bbox: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+) -> Response:
+    try:
+        parsed_bbox = parse_bbox(bbox) if bbox else None
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    incidents = IncidentRepository(db).list_incidents(
+        since=since,
+        min_confidence=min_confidence,
+        bbox=parsed_bbox,
+        limit=limit + 1,
+        after=after,
+    )
+    headers = {}
+    if len(incidents) > limit:
+        incidents = incidents[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(incidents[-1].last_seen, incidents[-1].id)
+    summaries = [IncidentSummary(**incident._mapping) for incident in incidents]
+    return Response(INCIDENT_SUMMARIES.dump_json(summaries), media_type="application/json", headers=headers)
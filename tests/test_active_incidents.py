@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.services.active_incidents import ActiveIncidentSet
+from app.services.clustering import IncidentCandidate, pick_incident_for_signal
+
+
+def _warm_set(now: datetime, candidates: list[IncidentCandidate]) -> ActiveIncidentSet:
+    active = ActiveIncidentSet(distance_m=300, horizon_hours=4, refresh_seconds=30)
+    active.apply_refresh(candidates, refreshed_at=now, watermark=now)
+    return active
+
+
+def test_lookup_matches_reference_picker() -> None:
+    now = datetime.now(timezone.utc)
+    candidates = [
+        IncidentCandidate(
+            id=uuid4(),
+            latitude=43.6532 + i * 0.001,
+            longitude=-79.3832 - i * 0.0015,
+            last_seen=now - timedelta(minutes=10 * i),
+        )
+        for i in range(20)
+    ]
+    active = _warm_set(now, candidates)
+
+    for i in range(20):
+        lat, lon = 43.6534 + i * 0.0011, -79.3830 - i * 0.0014
+        hit, selected = active.lookup(lat, lon, now, window_hours=2)
+        expected = pick_incident_for_signal(candidates, lat, lon, now, 300, 2)
+        assert hit is True
+        assert (selected.id if selected else None) == (expected.id if expected else None)
+
+    assert active.stats.coverage == 1.0
+
+
+def test_cold_cache_and_old_signals_fall_back() -> None:
+    now = datetime.now(timezone.utc)
+    cold = ActiveIncidentSet(distance_m=300, horizon_hours=4, refresh_seconds=30)
+    assert cold.needs_refresh(now) is True
+    assert cold.lookup(43.65, -79.38, now, window_hours=2) == (False, None)
+
+    active = _warm_set(now, [])
+    hit, _ = active.lookup(43.65, -79.38, now - timedelta(hours=3), window_hours=2)
+    assert hit is False
+    assert active.stats.fallbacks == 1
+
+
+def test_refresh_evicts_aged_out_incidents_and_upserts_move_cells() -> None:
+    now = datetime.now(timezone.utc)
+    stale = IncidentCandidate(id=uuid4(), latitude=43.65, longitude=-79.38, last_seen=now - timedelta(hours=5))
+    moving = IncidentCandidate(id=uuid4(), latitude=43.70, longitude=-79.40, last_seen=now)
+    active = _warm_set(now, [stale, moving])
+
+    assert len(active) == 1
+    active.upsert(IncidentCandidate(id=moving.id, latitude=43.60, longitude=-79.50, last_seen=now))
+    assert active.nearest(43.70, -79.40, now, window_hours=2) is None
+    selected = active.nearest(43.6001, -79.5001, now, window_hours=2)
+    assert selected is not None and selected.id == moving.id
@@ -0,0 +1,74 @@
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point, Polygon
+
+from app.repositories import incidents
+from app.repositories.incidents import IncidentRepository
+from app.services.boundaries import BoundaryCache
+
+SQUARE = Polygon([(-79.6, 43.6), (-79.2, 43.6), (-79.2, 43.9), (-79.6, 43.9)])
+SMALL_SQUARE = Polygon([(-79.5, 43.6), (-79.4, 43.6), (-79.4, 43.7), (-79.5, 43.7)])
+
+
+class FakeBoundaryRepository:
+    def __init__(self, polygon: Polygon) -> None:
+        self.polygon = polygon
+        self.fingerprints = 0
+        self.geometry_loads = 0
+        self.sql_checks = 0
+
+    def __call__(self, db):
+        return self
+
+    def fingerprint(self, name: str):
+        self.fingerprints += 1
+        return (self.polygon.wkt, len(self.polygon.exterior.coords)) if name == "toronto" else None
+
+    def geometry(self, name: str):
+        self.geometry_loads += 1
+        return from_shape(self.polygon, srid=4326)
+
+    def contains_many(self, name, latitudes, longitudes):
+        self.sql_checks += 1
+        return [self.polygon.contains(Point(lon, lat)) for lat, lon in zip(latitudes, longitudes)]
+
+
+def test_contains_many_checks_points_in_memory_and_reloads_changed_boundary() -> None:
+    now = [0.0]
+    repo = FakeBoundaryRepository(SQUARE)
+    cache = BoundaryCache(ttl_seconds=60, max_vertices=1_000, repository=repo, clock=lambda: now[0])
+
+    inside = cache.contains_many(None, "toronto", [43.7, 43.7, 0.0], [-79.4, -79.1, 0.0])
+    assert inside.tolist() == [True, False, False]
+    assert cache.contains(None, "toronto", 43.8, -79.3)
+    assert repo.geometry_loads == 1
+
+    now[0] = 61.0
+    assert cache.contains(None, "toronto", 43.8, -79.3)
+    assert repo.geometry_loads == 1
+
+    repo.polygon = SMALL_SQUARE
+    now[0] = 122.0
+    assert not cache.contains(None, "toronto", 43.8, -79.3)
+    assert repo.geometry_loads == 2
+
+
+def test_unknown_and_oversized_boundaries() -> None:
+    repo = FakeBoundaryRepository(SQUARE)
+    cache = BoundaryCache(ttl_seconds=60, max_vertices=3, repository=repo)
+
+    assert cache.contains_many(None, "missing", [43.7], [-79.4]).tolist() == [False]
+    assert cache.contains_many(None, "toronto", [43.7, 0.0], [-79.4, 0.0]).tolist() == [True, False]
+    assert repo.geometry_loads == 0
+    assert repo.sql_checks == 1
+
+
+def test_incident_repository_checks_the_city_boundary_through_the_cache(monkeypatch) -> None:
+    repo = FakeBoundaryRepository(SQUARE)
+    cache = BoundaryCache(ttl_seconds=60, max_vertices=1_000, repository=repo)
+    monkeypatch.setattr(incidents, "get_boundary_cache", lambda: cache)
+    incident_repo = IncidentRepository(db=None)
+
+    checks = [incident_repo.toronto_contains_signal(43.7, -79.4 + i * 0.3, "toronto") for i in range(3)]
+
+    assert checks == [True, False, False]
+    assert (repo.fingerprints, repo.geometry_loads, repo.sql_checks) == (1, 1, 0)
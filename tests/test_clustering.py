@@ -1,7 +1,18 @@
+import random
 from datetime import datetime, timedelta, timezone
+from math import cos, radians
 from uuid import uuid4
 
-from app.services.clustering import IncidentCandidate, pick_incident_for_signal
+from app.services.clustering import (
+    IncidentCandidate,
+    IncidentExtent,
+    cell_lock_keys,
+    cell_locks,
+    haversine_meters,
+    pick_incident_for_signal,
+    pick_incidents_for_signals,
+    window_cutoff,
+)
 
 
 def test_pick_existing_incident_when_within_distance_and_time() -> None:
@@ -39,3 +50,172 @@ def test_create_new_incident_when_existing_is_stale() -> None:
     )
 
     assert selected is None
+
+
+def test_pick_nearest_incident_inside_window() -> None:
+    now = datetime.now(timezone.utc)
+    far = IncidentCandidate(id=uuid4(), latitude=43.6550, longitude=-79.3832, last_seen=now - timedelta(minutes=5))
+    near = IncidentCandidate(id=uuid4(), latitude=43.6533, longitude=-79.3832, last_seen=now - timedelta(minutes=90))
+    stale = IncidentCandidate(id=uuid4(), latitude=43.6532, longitude=-79.3832, last_seen=now - timedelta(hours=2, seconds=1))
+
+    selected = pick_incident_for_signal(
+        incidents=[far, stale, near],
+        signal_latitude=43.6532,
+        signal_longitude=-79.3832,
+        observed_at=now,
+        distance_threshold_m=300,
+        window_hours=2,
+    )
+
+    assert selected is near
+    assert window_cutoff(now, 2) == now - timedelta(hours=2)
+
+
+def _cluster_sequentially(incidents, signals, distance_threshold_m, window_hours):
+    candidates = [IncidentCandidate(i.id, i.latitude, i.longitude, i.last_seen) for i in incidents]
+    assignments = []
+    for latitude, longitude, observed_at in signals:
+        selected = pick_incident_for_signal(candidates, latitude, longitude, observed_at, distance_threshold_m, window_hours)
+        if selected is None:
+            selected = IncidentCandidate(id=uuid4(), latitude=latitude, longitude=longitude, last_seen=observed_at)
+            candidates.append(selected)
+        else:
+            selected.last_seen = max(selected.last_seen, observed_at)
+        assignments.append(candidates.index(selected))
+    return assignments
+
+
+def test_batch_picker_matches_sequential_scalar_picker() -> None:
+    rng = random.Random(7)
+    now = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+    incidents = [
+        IncidentCandidate(
+            id=uuid4(),
+            latitude=rng.uniform(43.64, 43.67),
+            longitude=rng.uniform(-79.40, -79.36),
+            last_seen=now - timedelta(minutes=rng.uniform(0, 240)),
+        )
+        for _ in range(150)
+    ]
+    signals = [
+        (rng.uniform(43.64, 43.67), rng.uniform(-79.40, -79.36), now + timedelta(minutes=rng.uniform(-60, 60)))
+        for _ in range(400)
+    ]
+
+    expected = _cluster_sequentially(incidents, signals, 300, 2)
+    actual = pick_incidents_for_signals(
+        incidents,
+        [s[0] for s in signals],
+        [s[1] for s in signals],
+        [s[2] for s in signals],
+        distance_threshold_m=300,
+        window_hours=2,
+        chunk_elements=5_000,
+    )
+
+    assert actual == expected
+    assert any(index >= len(incidents) for index in actual)
+
+
+def test_batch_picker_clusters_signals_within_the_same_batch() -> None:
+    now = datetime.now(timezone.utc)
+
+    assignments = pick_incidents_for_signals(
+        [],
+        [43.6532, 43.6533, 43.7000],
+        [-79.3832, -79.3833, -79.4000],
+        [now, now + timedelta(minutes=5), now],
+        distance_threshold_m=300,
+        window_hours=2,
+    )
+
+    assert assignments == [0, 0, 1]
+
+
+def test_batch_picker_keeps_centroids_fixed_where_sequential_ingest_lets_them_drift() -> None:
+    now = datetime.now(timezone.utc)
+    incident = IncidentCandidate(id=uuid4(), latitude=43.6500, longitude=-79.3800, last_seen=now)
+    # 250 m and 400 m north of the incident's only signal.
+    signals = [(43.6500 + 250 / 111_195, -79.3800), (43.6500 + 400 / 111_195, -79.3800)]
+
+    assignments = pick_incidents_for_signals(
+        [incident],
+        [s[0] for s in signals],
+        [s[1] for s in signals],
+        [now, now],
+        distance_threshold_m=300,
+        window_hours=2,
+    )
+
+    # One at a time, the first signal pulls the centroid to the midpoint, within
+    # range of the second; the batch still measures from the original centroid.
+    extent = IncidentExtent()
+    extent.add(incident.latitude, incident.longitude)
+    extent.add(*signals[0])
+    drifted = IncidentCandidate(id=incident.id, latitude=extent.centroid[0], longitude=extent.centroid[1], last_seen=now)
+    assert pick_incident_for_signal([drifted], *signals[1], now, 300, 2) is drifted
+    assert assignments == [0, 1]
+
+
+def test_cell_lock_keys_overlap_for_every_pair_that_could_cluster() -> None:
+    rng = random.Random(7)
+    for base_lat in (43.65, -33.9, 69.6):
+        for _ in range(300):
+            lat1, lon1 = base_lat + rng.uniform(-0.05, 0.05), rng.uniform(-180, 180)
+            bearing_lat, bearing_lon = rng.uniform(-1, 1), rng.uniform(-1, 1)
+            lat2 = lat1 + bearing_lat * 0.0027
+            lon2 = lon1 + bearing_lon * 0.0027 / cos(radians(lat1))
+            if haversine_meters(lat1, lon1, lat2, lon2) > 300:
+                continue
+            assert set(cell_lock_keys([lat1], [lon1], 300)) & set(cell_lock_keys([lat2], [lon2], 300))
+
+    keys = cell_lock_keys([43.6532, 43.6533], [-79.3832, -79.3832], 300)
+    assert keys == sorted(set(keys))
+    assert all(0 < key < 2**63 for key in keys)
+    assert not set(keys) & set(cell_lock_keys([43.70], [-79.38], 300))
+
+
+def test_coarse_lock_keys_overlap_for_every_pair_that_could_cluster() -> None:
+    rng = random.Random(11)
+    for base_lat in (43.65, -33.9, 69.6):
+        for _ in range(300):
+            lat1, lon1 = base_lat + rng.uniform(-0.5, 0.5), rng.uniform(-180, 180)
+            lat2 = lat1 + rng.uniform(-1, 1) * 0.0027
+            lon2 = lon1 + rng.uniform(-1, 1) * 0.0027 / cos(radians(lat1))
+            if haversine_meters(lat1, lon1, lat2, lon2) > 300:
+                continue
+            assert set(cell_lock_keys([lat1], [lon1], 300, coarse=True)) & set(
+                cell_lock_keys([lat2], [lon2], 300, coarse=True)
+            )
+
+    fine = cell_lock_keys([43.6532], [-79.3832], 300)
+    assert len(fine) <= 6
+    assert not set(fine) & set(cell_lock_keys([43.6532], [-79.3832], 300, coarse=True))
+
+
+def test_cell_locks_fall_back_to_coarse_keys_for_dispersed_batches() -> None:
+    rng = random.Random(3)
+    nearby = cell_locks([43.6532, 43.6540, 43.6551], [-79.3832, -79.3840, -79.3850], 300, max_keys=128)
+    assert nearby.shared == cell_lock_keys([43.6532, 43.6540, 43.6551], [-79.3832, -79.3840, -79.3850], 300, coarse=True)
+    assert 0 < len(nearby.exclusive) <= 128
+
+    latitudes = [rng.uniform(43.58, 43.85) for _ in range(500)]
+    longitudes = [rng.uniform(-79.64, -79.12) for _ in range(500)]
+    dispersed = cell_locks(latitudes, longitudes, 300, max_keys=128)
+    assert dispersed.shared == []
+    assert dispersed.exclusive == cell_lock_keys(latitudes, longitudes, 300, coarse=True)
+    assert len(dispersed.exclusive) <= 128
+
+
+def test_incident_extent_tracks_mean_centroid_and_bounding_box() -> None:
+    extent = IncidentExtent()
+    for latitude, longitude in [(43.650, -79.390), (43.654, -79.380), (43.652, -79.385)]:
+        extent.add(latitude, longitude)
+
+    latitude, longitude = extent.centroid
+    assert extent.signal_count == 3
+    assert abs(latitude - 43.652) < 1e-9
+    assert abs(longitude + 79.385) < 1e-9
+    assert (extent.min_latitude, extent.min_longitude) == (43.650, -79.390)
+    assert (extent.max_latitude, extent.max_longitude) == (43.654, -79.380)
+    assert extent.columns()["signal_count"] == 3
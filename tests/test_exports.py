@@ -0,0 +1,45 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.services.exports import CHUNK_ROWS, accepts_gzip, encode_rows, gzip_chunks
+
+
+def _rows(count: int) -> list[dict]:
+    observed_at = datetime(2024, 9, 10, 14, 30, tzinfo=timezone.utc)
+    return [{"id": uuid4(), "title": f"Break, #{index}", "observed_at": observed_at, "incident_ids": [uuid4()]} for index in range(count)]
+
+
+def test_ndjson_rows_are_chunked_and_json_encoded() -> None:
+    rows = _rows(CHUNK_ROWS + 3)
+    chunks = list(encode_rows(rows, ("id", "title", "observed_at", "incident_ids"), "ndjson"))
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert len(lines) == len(rows)
+    first = json.loads(lines[0])
+    assert first["id"] == str(rows[0]["id"])
+    assert first["observed_at"] == "2024-09-10T14:30:00+00:00"
+    assert first["incident_ids"] == [str(rows[0]["incident_ids"][0])]
+
+
+def test_csv_export_has_header_and_quotes_values() -> None:
+    rows = _rows(2)
+    body = b"".join(encode_rows(rows, ("id", "title", "incident_ids"), "csv")).decode("utf-8")
+
+    parsed = list(csv.reader(io.StringIO(body)))
+    assert parsed[0] == ["id", "title", "incident_ids"]
+    assert parsed[1][1] == "Break, #0"
+    assert json.loads(parsed[1][2]) == [str(rows[0]["incident_ids"][0])]
+
+
+def test_gzip_stream_round_trips() -> None:
+    chunks = [b"first\n", b"", b"second\n"]
+
+    assert gzip.decompress(b"".join(gzip_chunks(chunks))) == b"first\nsecond\n"
+    assert accepts_gzip("br, gzip;q=0.8")
+    assert not accepts_gzip("gzip;q=0, br")
+    assert not accepts_gzip(None)
@@ -0,0 +1,82 @@
+import threading
+import time
+from collections import Counter
+
+from app.jobs.feed_fetcher import ConcurrentFetcher, HostRateLimiter, RetryableFetchError
+
+
+def test_fetcher_retries_with_backoff_without_blocking_other_feeds() -> None:
+    attempts: Counter[str] = Counter()
+
+    def fetch(url: str) -> str:
+        attempts[url] += 1
+        if url.endswith("/flaky") and attempts[url] < 3:
+            raise RetryableFetchError(TimeoutError("timed out"))
+        if url.endswith("/broken"):
+            raise RetryableFetchError(ValueError("503"))
+        time.sleep(0.01)
+        return url.upper()
+
+    fetcher = ConcurrentFetcher(fetch, max_workers=2, per_host_limit=2, retry_attempts=3, backoff_seconds=0.05)
+    urls = ["https://a.test/flaky", "https://b.test/broken", "https://c.test/1", "https://d.test/2"]
+
+    results = list(fetcher.fetch_all(urls))
+
+    by_url = {result.url: result for result in results}
+    assert [result.url for result in results][-1] in {"https://a.test/flaky", "https://b.test/broken"}
+    assert by_url["https://a.test/flaky"].response == "HTTPS://A.TEST/FLAKY"
+    assert by_url["https://a.test/flaky"].attempts == 3
+    assert isinstance(by_url["https://b.test/broken"].error, ValueError)
+    assert by_url["https://c.test/1"].response == "HTTPS://C.TEST/1"
+
+
+def test_fetcher_caps_concurrency_per_host() -> None:
+    lock = threading.Lock()
+    active: Counter[str] = Counter()
+    peak: Counter[str] = Counter()
+
+    def fetch(url: str) -> str:
+        host = url.split("/")[2]
+        with lock:
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+        time.sleep(0.02)
+        with lock:
+            active[host] -= 1
+        return url
+
+    fetcher = ConcurrentFetcher(fetch, max_workers=6, per_host_limit=2, retry_attempts=1, backoff_seconds=0)
+    urls = [f"https://busy.test/{i}" for i in range(6)] + [f"https://quiet.test/{i}" for i in range(2)]
+
+    results = list(fetcher.fetch_all(urls))
+
+    assert len(results) == 8
+    assert peak["busy.test"] == 2
+    assert peak["quiet.test"] <= 2
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self.expiries: dict[str, int] = {}
+
+    def incr(self, key: str) -> int:
+        self.counts[key] += 1
+        return self.counts[key]
+
+    def expire(self, key: str, seconds: int) -> None:
+        self.expiries[key] = seconds
+
+
+def test_host_rate_limiter_defers_fetches_to_the_next_window() -> None:
+    now = [120.0]
+    limiter = HostRateLimiter(FakeRedis(), per_minute=2, clock=lambda: now[0])
+
+    assert limiter.acquire("a.test") == 0.0
+    assert limiter.acquire("a.test") == 0.0
+    now[0] = 135.0
+    assert limiter.acquire("a.test") == 45.0
+    assert limiter.acquire("b.test") == 0.0
+    now[0] = 180.0
+    assert limiter.acquire("a.test") == 0.0
+    assert HostRateLimiter(FakeRedis(), per_minute=0).acquire("a.test") == 0.0
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+from app.services.feed_schedule import PollOutcome, PollPolicy, PollState, compute_next_poll
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+POLICY = PollPolicy(
+    min_seconds=60,
+    max_seconds=3600,
+    initial_seconds=300,
+    error_max_seconds=7200,
+    burst_seconds=30,
+    burst_duration_seconds=1800,
+    burst_min_confidence=70,
+)
+
+
+def test_interval_shrinks_on_new_items_and_grows_when_quiet_within_bounds() -> None:
+    busy = compute_next_poll(None, PollOutcome(ok=True, new_items=4), NOW, POLICY)
+    assert busy.interval_seconds == 150
+    assert busy.next_poll_at == NOW + timedelta(seconds=150)
+    assert busy.avg_new_items == 0.3 * 4
+
+    state = busy
+    for _ in range(5):
+        state = compute_next_poll(state, PollOutcome(ok=True, new_items=3), NOW, POLICY)
+    assert state.interval_seconds == POLICY.min_seconds
+
+    for _ in range(20):
+        state = compute_next_poll(state, PollOutcome(ok=True), NOW, POLICY)
+    assert state.interval_seconds == POLICY.max_seconds
+    assert state.avg_new_items < 0.01
+
+
+def test_interval_follows_the_smoothed_item_rate_not_single_polls() -> None:
+    quiet = PollState(interval_seconds=1200)
+    stray = compute_next_poll(quiet, PollOutcome(ok=True, new_items=1), NOW, POLICY)
+    assert stray.interval_seconds == 1200
+    assert stray.avg_new_items == 0.3
+
+    busy = PollState(interval_seconds=120, avg_new_items=3.0)
+    lull = compute_next_poll(busy, PollOutcome(ok=True), NOW, POLICY)
+    assert lull.interval_seconds == 120
+
+    state = quiet
+    for _ in range(3):
+        state = compute_next_poll(state, PollOutcome(ok=True, new_items=2), NOW, POLICY)
+    assert state.avg_new_items >= POLICY.busy_items
+    assert state.interval_seconds == 300
+
+
+def test_failures_back_off_exponentially_and_recovery_keeps_the_healthy_interval() -> None:
+    state = PollState(interval_seconds=600)
+    delays = []
+    for _ in range(5):
+        state = compute_next_poll(state, PollOutcome(ok=False), NOW, POLICY)
+        delays.append((state.next_poll_at - NOW).total_seconds())
+
+    assert delays == [1200, 2400, 4800, 7200, 7200]
+    assert state.error_streak == 5
+    assert state.interval_seconds == 600
+
+    recovered = compute_next_poll(state, PollOutcome(ok=True, new_items=4), NOW, POLICY)
+    assert recovered.error_streak == 0
+    assert recovered.interval_seconds == 300
+
+
+def test_high_confidence_items_poll_in_burst_mode_until_it_expires() -> None:
+    state = compute_next_poll(
+        PollState(interval_seconds=1200), PollOutcome(ok=True, new_items=2, high_confidence=True), NOW, POLICY
+    )
+    assert state.burst_until == NOW + timedelta(seconds=1800)
+    assert state.next_poll_at == NOW + timedelta(seconds=30)
+
+    later = NOW + timedelta(seconds=600)
+    quiet = compute_next_poll(state, PollOutcome(ok=True), later, POLICY)
+    assert quiet.burst_until == state.burst_until
+    assert quiet.next_poll_at == later + timedelta(seconds=30)
+
+    expired = compute_next_poll(quiet, PollOutcome(ok=True), NOW + timedelta(seconds=1800), POLICY)
+    assert expired.burst_until is None
+    assert expired.next_poll_at == NOW + timedelta(seconds=1800 + expired.interval_seconds)
@@ -0,0 +1,357 @@
+import importlib.util
+import re
+import uuid
+from contextlib import nullcontext
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.elements import TextClause
+
+from app.core.config import Settings
+from app.repositories.incidents import repair_extents_statement
+from app.services.active_incidents import ActiveIncidentSet
+from app.services.clustering import IncidentCandidate, IncidentExtent, cell_lock_keys
+from app.services.incident_service import UNLOCATED, IncidentService, SignalPayload, _extent_update
+from app.services.scoring import empty_score_state
+
+NOW = datetime(2024, 9, 10, 14, 30, tzinfo=timezone.utc)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.psycopg.dialect()))
+
+
+def _locks_rows(statement) -> bool:
+    return getattr(statement, "is_select", False) and "FOR UPDATE" in _sql(statement)
+
+
+def _returns_rows(statement) -> bool:
+    return getattr(statement, "is_update", False) and " RETURNING " in _sql(statement)
+
+
+class Rows(list):
+    rowcount = 0
+
+    def all(self) -> list:
+        return list(self)
+
+    def one(self):
+        (row,) = self
+        return row
+
+    def one_or_none(self):
+        return self[0] if self else None
+
+
+# Stands in for the ORM session: records every statement ingest_many sends and answers
+# with scripted rows, so the batch path can be checked without a PostGIS database.
+class RecordingSession:
+    def __init__(
+        self,
+        accept: set[str] | None = None,
+        candidates: list[IncidentCandidate] = (),
+        fail_bulk_insert: bool = False,
+        fail_rows: set[str] = frozenset(),
+        busy: set[uuid.UUID] = frozenset(),
+    ) -> None:
+        self.accept = accept
+        self.busy = busy
+        self.candidates = list(candidates)
+        self.fail_bulk_insert = fail_bulk_insert
+        self.fail_rows = fail_rows
+        self.statements: list[tuple[object, object]] = []
+        self.gets: list[dict] = []
+        self.added: list[object] = []
+        self.commits = 0
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def flush(self) -> None:
+        pass
+
+    def add(self, instance) -> None:
+        self.added.append(instance)
+
+    def refresh(self, instance) -> None:
+        pass
+
+    def get(self, entity, ident, **options):
+        self.gets.append(options)
+        return SimpleNamespace(id=ident, score_state=empty_score_state(), last_seen=NOW)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def scalars(self, statement, rows=None):
+        self.statements.append((statement, rows))
+        if statement.is_select:
+            ids = [c.id for c in self.candidates]
+            if _locks_rows(statement):
+                requested = set(statement.compile(dialect=postgresql.psycopg.dialect()).params["id_1"])
+                return sorted(i for i in ids if i in requested and i not in self.busy)
+            return ids
+        if self.fail_bulk_insert:
+            raise SQLAlchemyError("bulk insert failed")
+        return [row["id"] for row in rows if self._accepted(row)]
+
+    def scalar(self, statement, row):
+        self.statements.append((statement, row))
+        if row["source_id"] in self.fail_rows:
+            raise SQLAlchemyError("bad row")
+        return row["id"] if self._accepted(row) else None
+
+    def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        if isinstance(statement, TextClause):
+            return Rows()
+        if _locks_rows(statement):
+            return Rows(SimpleNamespace(id=candidate.id, score_state=empty_score_state()) for candidate in self.candidates)
+        if statement.is_select:
+            return Rows(SimpleNamespace(**vars(candidate), updated_at=candidate.last_seen) for candidate in self.candidates)
+        if statement.is_update and params is None and not _returns_rows(statement):
+            rows = Rows()
+            rows.rowcount = len(statement.compile(dialect=postgresql.psycopg.dialect()).params["incident_id_1"])
+            return rows
+        if _returns_rows(statement):
+            compiled = statement.compile(dialect=postgresql.psycopg.dialect()).params
+            return Rows(
+                SimpleNamespace(id=c.id, latitude=c.latitude, longitude=c.longitude, last_seen=NOW)
+                for c in self.candidates
+                if c.id in compiled.values()
+            )
+        return Rows()
+
+    def executed(self, table: str, kind: str = "insert") -> list:
+        return [
+            params
+            for statement, params in self.statements
+            if getattr(statement, f"is_{kind}", False) and getattr(getattr(statement, "table", None), "name", None) == table
+        ]
+
+    def _accepted(self, row: dict) -> bool:
+        return self.accept is None or row["source_id"] in self.accept
+
+
+def _payload(source_id: str, latitude: float, longitude: float, minutes: int = 0) -> SignalPayload:
+    return SignalPayload(
+        source_type="rss",
+        source_id=source_id,
+        title="Water main break",
+        content="Crews on scene",
+        url=f"https://example.com/{source_id}",
+        observed_at=NOW + timedelta(minutes=minutes),
+        latitude=latitude,
+        longitude=longitude,
+    )
+
+
+def _service(db: RecordingSession) -> IncidentService:
+    return IncidentService(db=db, settings=Settings(clustering_distance_meters=300.0, clustering_time_window_hours=2))
+
+
+def test_ingest_many_skips_conflicting_rows_and_clusters_within_the_batch() -> None:
+    db = RecordingSession(accept={"a", "b"})
+    payloads = [_payload("a", 43.6500, -79.3800), _payload("b", 43.6510, -79.3810, 5), _payload("dup", 43.6505, -79.3805)]
+
+    accepted = _service(db).ingest_many(payloads)
+
+    insert_sql = str(db.statements[0][0].compile(dialect=postgresql.psycopg.dialect()))
+    assert "ON CONFLICT (source_type, source_id) DO NOTHING RETURNING signals.id" in insert_sql
+    assert len(accepted) == 2
+
+    (incidents,) = db.executed("incidents")
+    assert len(incidents) == 1
+    incident = incidents[0]
+    assert incident["signal_count"] == 2
+    assert incident["first_seen"] == NOW and incident["last_seen"] == NOW + timedelta(minutes=5)
+    assert abs(incident["latitude_sum"] / 2 - 43.6505) < 1e-9
+    assert incident["centroid"].data == f"POINT({(-79.38 + -79.381) / 2} {(43.65 + 43.651) / 2})"
+
+    (links,) = db.executed("incident_signals")
+    assert {link["signal_id"] for link in links} == set(accepted)
+    assert {link["incident_id"] for link in links} == {incident["id"]}
+    assert db.executed("incidents", kind="update") == []
+    assert db.commits == 1
+
+
+def test_ingest_many_falls_back_to_row_savepoints_when_the_bulk_insert_fails() -> None:
+    db = RecordingSession(accept={"ok"}, fail_bulk_insert=True, fail_rows={"bad"})
+    payloads = [_payload("ok", 43.65, -79.38), _payload("bad", 43.65, -79.38), _payload("taken", 43.65, -79.38)]
+
+    accepted = _service(db).ingest_many(payloads)
+
+    row_inserts = [params for statement, params in db.statements if isinstance(params, dict) and "source_id" in params]
+    assert [row["source_id"] for row in row_inserts] == ["ok", "bad", "taken"]
+    assert accepted == [row_inserts[0]["id"]]
+    (links,) = db.executed("incident_signals")
+    assert [link["signal_id"] for link in links] == accepted
+
+
+def test_ingest_many_updates_existing_incidents_and_creates_new_ones_in_one_batch() -> None:
+    existing = IncidentCandidate(id=uuid.uuid4(), latitude=43.6500, longitude=-79.3800, last_seen=NOW)
+    db = RecordingSession(candidates=[existing])
+    payloads = [_payload("near", 43.6502, -79.3802, 10), _payload("far", 43.7500, -79.5000, 10)]
+
+    accepted = _service(db).ingest_many(payloads)
+
+    (new_incidents,) = db.executed("incidents")
+    assert [row["signal_count"] for row in new_incidents] == [1]
+    assert new_incidents[0]["id"] != existing.id
+
+    extent_updates = [
+        statement for statement, _ in db.statements if _returns_rows(statement)
+    ]
+    assert len(extent_updates) == 1
+    compiled = extent_updates[0].compile(dialect=postgresql.psycopg.dialect())
+    assert "FROM (VALUES" in str(compiled)
+    assert existing.id in compiled.params.values()
+
+    (links,) = db.executed("incident_signals")
+    assert {link["signal_id"]: link["incident_id"] for link in links} == {
+        accepted[0]: existing.id,
+        accepted[1]: new_incidents[0]["id"],
+    }
+    (scores,) = [params for statement, params in db.statements if getattr(statement, "is_update", False) and params]
+    assert [row["b_id"] for row in scores] == [existing.id]
+    assert any(isinstance(statement, TextClause) and "pg_advisory_xact_lock" in statement.text for statement, _ in db.statements)
+
+
+def test_locked_batches_catch_up_their_neighbourhood_and_match_from_the_cache() -> None:
+    now = datetime.now(timezone.utc)
+    existing = IncidentCandidate(id=uuid.uuid4(), latitude=43.6500, longitude=-79.3800, last_seen=now)
+    expired = IncidentCandidate(id=uuid.uuid4(), latitude=43.7000, longitude=-79.4000, last_seen=now - timedelta(hours=6))
+    db = RecordingSession(candidates=[existing])
+    cache = ActiveIncidentSet(distance_m=300.0, horizon_hours=4, refresh_seconds=30)
+    cache.upsert(expired)
+    service = IncidentService(
+        db=db,
+        settings=Settings(clustering_distance_meters=300.0, clustering_time_window_hours=2),
+        active_incidents=cache,
+    )
+
+    service.ingest_many([replace(_payload("near", 43.6502, -79.3802, 0), observed_at=now)])
+
+    # One refresh of the whole set on the interval, evicting what aged out, then a
+    # catch-up read of the locked neighbourhood; the match itself comes from the cache.
+    selects = [
+        _sql(statement)
+        for statement, _ in db.statements
+        if getattr(statement, "is_select", False) and not _locks_rows(statement)
+    ]
+    assert len(selects) == 2
+    assert "ST_Intersects" not in selects[0]
+    assert "ST_Intersects" in selects[1] and "ST_MakeEnvelope" in selects[1]
+    assert cache.stats.refreshes == 1 and cache.stats.covered == 1 and cache.stats.fallbacks == 0
+    assert {candidate.id for candidate in cache.snapshot()} == {existing.id}
+    assert db.added == []
+    locks = [statement.text for statement, _ in db.statements if isinstance(statement, TextClause)]
+    assert len(locks) == 2 and "pg_advisory_xact_lock_shared" in locks[0]
+
+    db.statements.clear()
+    service.ingest_many([replace(_payload("again", 43.6501, -79.3801, 0), observed_at=now)])
+
+    selects = [
+        _sql(statement)
+        for statement, _ in db.statements
+        if getattr(statement, "is_select", False) and not _locks_rows(statement)
+    ]
+    assert len(selects) == 1 and "ST_Intersects" in selects[0]
+    assert cache.stats.refreshes == 1 and cache.stats.covered == 2
+
+
+def test_default_settings_serve_matches_from_the_incident_cache() -> None:
+    settings = Settings()
+    assert settings.clustering_cell_locks_enabled and settings.active_incident_cache_enabled
+    now = datetime.now(timezone.utc)
+    existing = IncidentCandidate(id=uuid.uuid4(), latitude=43.6500, longitude=-79.3800, last_seen=now)
+    cache = ActiveIncidentSet(
+        distance_m=settings.clustering_distance_meters,
+        horizon_hours=settings.active_incident_horizon_hours,
+        refresh_seconds=settings.active_incident_refresh_seconds,
+    )
+    service = IncidentService(db=RecordingSession(candidates=[existing]), settings=settings, active_incidents=cache)
+
+    for source_id in ("a", "b"):
+        service.ingest_many([replace(_payload(source_id, 43.6501, -79.3801), observed_at=now)])
+
+    assert cache.stats.covered == 2 and cache.stats.fallbacks == 0
+    assert cache.stats.coverage == 1.0
+
+
+def test_extent_update_adds_batch_sums_and_widens_the_bounding_box() -> None:
+    extent = IncidentExtent()
+    extent.add(43.65, -79.38)
+    sql = str(_extent_update([(uuid.uuid4(), NOW, extent)]).compile(dialect=postgresql.psycopg.dialect()))
+
+    assert "signal_count=(incidents.signal_count + batch.signal_count)" in sql
+    assert "latitude_sum=(incidents.latitude_sum + batch.latitude_sum)" in sql
+    assert "min_latitude=least(incidents.min_latitude, batch.min_latitude)" in sql
+    assert "max_longitude=greatest(incidents.max_longitude, batch.max_longitude)" in sql
+    assert "last_seen=greatest(incidents.last_seen, batch.last_seen)" in sql
+    assert "ST_MakePoint((incidents.longitude_sum + batch.longitude_sum) / " in sql
+    assert sql.endswith("RETURNING incidents.id, ST_Y(incidents.centroid) AS latitude, ST_X(incidents.centroid) AS longitude, incidents.last_seen")
+
+
+def test_repair_statement_rebuilds_the_same_columns_as_the_migration_backfill() -> None:
+    path = next(Path(__file__).parents[1].glob("alembic/versions/*_incident_extent_aggregates.py"))
+    spec = importlib.util.spec_from_file_location("extent_migration", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    backfilled = set(re.findall(r"^\s*(?:SET )?(\w+) = ", migration.BACKFILL, re.MULTILINE))
+    assignments = _sql(repair_extents_statement()).split(" SET ", 1)[1].split(" FROM (SELECT", 1)[0]
+    repaired = set(re.findall(r"(?:^|, )(\w+)=", assignments)) - {"updated_at"}
+    assert backfilled == repaired
+
+    sql = str(repair_extents_statement([uuid.uuid4()]).compile(dialect=postgresql.psycopg.dialect()))
+    for aggregate in ("count(*)", "sum(signals.latitude)", "min(signals.longitude)", "max(signals.latitude)"):
+        assert aggregate in sql and aggregate.replace("signals.", "g.") in migration.BACKFILL
+    assert "WHERE incident_signals.incident_id IN" in sql
+
+
+def test_repair_extents_locks_each_batch_and_skips_incidents_being_ingested() -> None:
+    candidates = [IncidentCandidate(id=uuid.uuid4(), latitude=43.65, longitude=-79.38, last_seen=NOW) for _ in range(5)]
+    busy = candidates[1].id
+    db = RecordingSession(candidates=candidates, busy={busy})
+
+    repaired = _service(db).repair_extents(batch_size=2)
+
+    assert repaired == 4
+    assert db.commits == 3
+    locks = [_sql(statement) for statement, _ in db.statements if _locks_rows(statement)]
+    assert len(locks) == 3 and all(lock.endswith("FOR UPDATE SKIP LOCKED") for lock in locks)
+    repairs = [statement for statement, _ in db.statements if getattr(statement, "is_update", False)]
+    assert [len(statement.compile().params["incident_id_1"]) for statement in repairs] == [1, 2, 1]
+    assert all(busy not in statement.compile().params["incident_id_1"] for statement in repairs)
+
+
+def test_ingest_signal_locks_the_incident_row_before_folding_its_score() -> None:
+    existing = IncidentCandidate(id=uuid.uuid4(), latitude=43.6500, longitude=-79.3800, last_seen=NOW)
+    db = RecordingSession(candidates=[existing])
+
+    _service(db).ingest_signal(_payload("near", 43.6502, -79.3802, 10))
+
+    assert db.gets == [{"populate_existing": True, "with_for_update": True}]
+    (link,) = [instance for instance in db.added if type(instance).__name__ == "IncidentSignal"]
+    assert link.incident_id == existing.id
+    assert db.commits == 1
+
+
+def test_unlocated_feed_batches_take_no_cell_locks() -> None:
+    # Every RSS item sits at UNLOCATED, so locking its cells would queue every feed's
+    # ingest behind one advisory key.
+    feeds = [RecordingSession(), RecordingSession()]
+    for feed, db in enumerate(feeds):
+        _service(db).ingest_many([_payload(f"{feed}-{item}", *UNLOCATED, item) for item in range(3)])
+    assert not any(isinstance(statement, TextClause) for db in feeds for statement, _ in db.statements)
+
+    mixed = RecordingSession()
+    _service(mixed).ingest_many([_payload("rss", *UNLOCATED), _payload("located", 43.65, -79.38)])
+    (_, shared), (_, exclusive) = [(s, p) for s, p in mixed.statements if isinstance(s, TextClause)]
+    assert exclusive["keys"] == cell_lock_keys([43.65], [-79.38], 300.0)
+    assert shared["keys"] == cell_lock_keys([43.65], [-79.38], 300.0, coarse=True)
@@ -0,0 +1,25 @@
+from app.jobs.rss_utils import keyword_hits
+from app.services.keywords import KEYWORD_REGISTRY, KeywordMatcher
+
+
+def test_matcher_respects_word_boundaries_and_stems() -> None:
+    matcher = KeywordMatcher(["leak*", "no water", "water", "main"])
+
+    assert matcher.find("Bleak outlook, mainly sunny") == set()
+    assert matcher.find("Leaking hydrant, no water on Queen St") == {"leak", "no water", "water"}
+
+
+def test_matcher_reports_nested_and_overlapping_terms_in_one_pass() -> None:
+    matcher = KeywordMatcher(["water main break", "water main", "main break", "break*"])
+
+    assert matcher.find("Water main break downtown") == {"water main break", "water main", "main break", "break"}
+    assert matcher.find("water main breaker") == {"water main", "break"}
+
+
+def test_registry_tiers_share_one_scan() -> None:
+    hits = KEYWORD_REGISTRY.hits("Watermain break causes flooding, road closed and no water")
+
+    assert hits["high"] == ["flood", "road closed"]
+    assert hits["medium"] == ["no water"]
+    assert hits["feed"] == ["watermain", "break", "flood"]
+    assert keyword_hits("Burst watermain") == ["watermain", "burst"]
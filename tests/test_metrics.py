@@ -0,0 +1,40 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.api.middleware import MetricsMiddleware
+from app.core.metrics import timed_pool_class
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_middleware_labels_latency_by_route_template() -> None:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/things/{thing_id}")
+    def get_thing(thing_id: int) -> dict[str, int]:
+        return {"id": thing_id}
+
+    labels = {"method": "GET", "route": "/things/{thing_id}", "status": "200"}
+    before = _sample("wbw_http_request_seconds_count", labels)
+    client = TestClient(app)
+    client.get("/things/1")
+    client.get("/things/2")
+
+    assert _sample("wbw_http_request_seconds_count", labels) == before + 2
+
+
+def test_timed_pool_observes_each_checkout() -> None:
+    engine = create_engine("sqlite://", poolclass=timed_pool_class(QueuePool, "test"))
+    before = _sample("wbw_db_pool_checkout_seconds_count", {"engine": "test"})
+
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("select 1"))
+
+    assert _sample("wbw_db_pool_checkout_seconds_count", {"engine": "test"}) == before + 3
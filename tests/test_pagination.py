@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.api.pagination import InvalidCursor, decode_cursor, encode_cursor, parse_bbox
+
+
+def test_cursor_round_trips_keyset_position() -> None:
+    last_seen = datetime(2024, 9, 10, 14, 30, 5, 123456, tzinfo=timezone.utc)
+    incident_id = uuid4()
+
+    cursor = encode_cursor(last_seen, incident_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (last_seen, incident_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(datetime.now(timezone.utc), uuid4())[:-4]])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+def test_parse_bbox_validates_shape_and_order() -> None:
+    assert parse_bbox("-79.5,43.6,-79.3,43.8") == (-79.5, 43.6, -79.3, 43.8)
+    for bad in ("-79.5,43.6,-79.3", "a,b,c,d", "-79.3,43.6,-79.5,43.8"):
+        with pytest.raises(ValueError):
+            parse_bbox(bad)
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+import httpx
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.profiling import (
+    PROFILE_REPORT_HEADER,
+    PROFILE_SKIPPED_HEADER,
+    ProfilingMiddleware,
+    install_slow_query_logging,
+)
+
+
+def test_slow_queries_are_logged_with_parameters_and_plan(caplog) -> None:
+    engine = create_engine("sqlite://")
+    install_slow_query_logging(engine, threshold_ms=0.000001, explain=True)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.profiling"):
+        with engine.begin() as connection:
+            assert connection.execute(text("SELECT :value + 1"), {"value": 41}).scalar() == 42
+
+    slow = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Slow query")]
+    assert slow
+    assert "SELECT ? + 1" in slow[0]
+    assert "41" in slow[0]
+    assert "EXPLAIN failed" not in slow[0]
+
+
+def test_profiling_middleware_only_profiles_flagged_requests(tmp_path) -> None:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, directory=str(tmp_path))
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    client = TestClient(app)
+    assert PROFILE_REPORT_HEADER not in client.get("/ping").headers
+    assert not list(tmp_path.iterdir())
+
+    report = client.get("/ping", headers={"X-Profile": "1"}).headers[PROFILE_REPORT_HEADER]
+    assert (tmp_path / f"{report}.pstats").exists()
+    assert "cumulative" in (tmp_path / f"{report}.txt").read_text()
+
+
+def test_profile_files_keep_the_full_name_for_dotted_paths(tmp_path) -> None:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, directory=str(tmp_path))
+
+    @app.get("/tiles/{name}")
+    async def tile(name: str) -> dict[str, str]:
+        return {"name": name}
+
+    client = TestClient(app)
+    reports = [client.get("/tiles/1495.mvt?profile=1").headers[PROFILE_REPORT_HEADER] for _ in range(2)]
+
+    assert reports[0] != reports[1]
+    assert all(report.startswith("request_tiles_1495_mvt-") for report in reports)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"{report}{suffix}" for report in reports for suffix in (".pstats", ".txt")
+    )
+
+
+def test_overlapping_profiled_requests_profile_only_the_first(tmp_path) -> None:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, directory=str(tmp_path))
+    first_started = asyncio.Event()
+
+    @app.get("/slow")
+    async def slow() -> dict[str, str]:
+        first_started.set()
+        await asyncio.sleep(0.05)
+        return {"status": "ok"}
+
+    async def overlapping() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+            async def second() -> httpx.Response:
+                await first_started.wait()
+                return await client.get("/slow", headers={"X-Profile": "1"})
+
+            return await asyncio.gather(client.get("/slow", headers={"X-Profile": "1"}), second())
+
+    first, second = asyncio.run(overlapping())
+
+    assert first.status_code == second.status_code == 200
+    assert PROFILE_REPORT_HEADER in first.headers and PROFILE_SKIPPED_HEADER not in first.headers
+    assert PROFILE_SKIPPED_HEADER in second.headers and PROFILE_REPORT_HEADER not in second.headers
+    assert (tmp_path / f"{first.headers[PROFILE_REPORT_HEADER]}.pstats").exists()
@@ -0,0 +1,135 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from app.api.routes import narrow_incidents
+from app.core.cache import (
+    LRUCache,
+    cache_key,
+    etag_for,
+    etag_matches,
+    normalize_bbox,
+    normalize_confidence,
+    normalize_since,
+)
+from app.services.response_cache import AsyncResponseCache, CachedResponse, ResponseCache
+
+
+def test_lru_evicts_least_recently_used_and_expired_entries() -> None:
+    now = [0.0]
+    cache = LRUCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 11.0
+    assert cache.get("c") is None
+    assert len(cache) == 1
+
+
+def test_normalization_widens_filters_onto_shared_keys() -> None:
+    assert normalize_bbox((-79.40012, 43.65049, -79.35001, 43.70001)) == (-79.401, 43.65, -79.35, 43.701)
+    assert normalize_since(datetime(2024, 9, 10, 14, 30, 59, tzinfo=timezone.utc)) == datetime(
+        2024, 9, 10, 14, 30, tzinfo=timezone.utc
+    )
+    assert normalize_confidence(42.79) == 42.7
+
+    first = cache_key("incidents", {"bbox": normalize_bbox((-79.40012, 43.6, -79.3, 43.8)), "cursor": None})
+    second = cache_key("incidents", {"cursor": None, "bbox": normalize_bbox((-79.40049, 43.6, -79.3, 43.8))})
+    assert first == second
+
+
+def test_widened_pages_are_narrowed_back_to_the_exact_filters() -> None:
+    rows = [
+        {"id": "a", "last_seen": "2024-09-10T14:30:40Z", "confidence_score": 42.75, "latitude": 43.6505, "longitude": -79.4001},
+        {"id": "b", "last_seen": "2024-09-10T14:30:10Z", "confidence_score": 50.0, "latitude": 43.66, "longitude": -79.38},
+        {"id": "c", "last_seen": "2024-09-10T14:31:00Z", "confidence_score": 42.71, "latitude": 43.66, "longitude": -79.38},
+        {"id": "d", "last_seen": "2024-09-10T14:31:00Z", "confidence_score": 60.0, "latitude": 43.66, "longitude": -79.4005},
+    ]
+    body = json.dumps(rows, separators=(",", ":")).encode("utf-8")
+    since = datetime(2024, 9, 10, 14, 30, 30, tzinfo=timezone.utc)
+    bbox = (-79.40012, 43.65049, -79.35001, 43.70001)
+
+    narrowed = json.loads(narrow_incidents(body, since, 42.75, bbox))
+
+    assert [row["id"] for row in narrowed] == ["a"]
+    assert narrow_incidents(body, None, 0.0, None) is body
+
+
+def test_etag_changes_with_data_version_and_matches_if_none_match_lists() -> None:
+    etag = etag_for(3, "incidents&limit=500")
+
+    assert etag != etag_for(4, "incidents&limit=500")
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+class FakeRedis:
+    def __init__(self, store: dict) -> None:
+        self.store = store
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def incr(self, key):
+        self.store[key] = int(self.store.get(key) or 0) + 1
+
+    def hgetall(self, key):
+        return {field.encode(): value for field, value in self.store.get(key, {}).items()}
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self.store)
+
+
+class FakePipeline:
+    def __init__(self, store: dict) -> None:
+        self.store = store
+        self.ops = []
+
+    def hset(self, key, mapping):
+        self.ops.append((key, {field: value.encode() if isinstance(value, str) else value for field, value in mapping.items()}))
+
+    def expire(self, key, seconds):
+        pass
+
+    def execute(self):
+        for key, mapping in self.ops:
+            self.store[key] = mapping
+
+
+class FakeAsyncRedis(FakeRedis):
+    async def get(self, key):
+        return super().get(key)
+
+    async def hgetall(self, key):
+        return super().hgetall(key)
+
+    def pipeline(self, transaction: bool = True):
+        return FakeAsyncPipeline(self.store)
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self):
+        super().execute()
+
+
+def test_sync_and_async_caches_share_versions_and_entries() -> None:
+    store: dict = {}
+    options = {"ttl_seconds": 60, "local_entries": 8, "max_entry_bytes": 16}
+    sync_cache = ResponseCache(FakeRedis(store), **options)
+    async_cache = AsyncResponseCache(FakeAsyncRedis(store), **options)
+
+    sync_cache.bump_version()
+    assert sync_cache.data_version() == asyncio.run(async_cache.data_version()) == 1
+
+    sync_cache.set(1, "k", CachedResponse(body=b"[]", etag=sync_cache.etag(1, "k"), headers={"X-Next-Cursor": "c"}))
+    shared = asyncio.run(async_cache.get(1, "k"))
+    assert shared == CachedResponse(body=b"[]", etag=async_cache.etag(1, "k"), headers={"X-Next-Cursor": "c"})
+
+    asyncio.run(async_cache.set(1, "big", CachedResponse(body=b"x" * 17, etag="e")))
+    assert sync_cache.get(1, "big") is None and asyncio.run(async_cache.get(1, "big")) is None
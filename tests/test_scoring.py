@@ -1,4 +1,10 @@
-from app.services.scoring import compute_confidence
+from app.services.scoring import (
+    compute_confidence,
+    confidence_keyword_hits,
+    empty_score_state,
+    fold_score_state,
+    score_from_state,
+)
 
 
 def test_confidence_reflects_keyword_hits_and_source_diversity() -> None:
@@ -24,3 +30,18 @@ def test_confidence_is_capped_at_100() -> None:
     )
 
     assert score == 100.0
+
+
+def test_incremental_state_matches_full_recompute() -> None:
+    signals = [
+        ("Water main break at King & Bathurst", "rss"),
+        ("Low pressure and no water reported", "reddit"),
+        ("Crews on scene, road closed", "rss"),
+    ]
+
+    state = empty_score_state()
+    for text, source_type in signals:
+        state = fold_score_state(state, confidence_keyword_hits(text), source_type)
+
+    assert score_from_state(state) == compute_confidence([t for t, _ in signals], [s for _, s in signals])
+    assert state["sources"] == {"reddit": 1, "rss": 2}
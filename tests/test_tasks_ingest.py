@@ -1,6 +1,24 @@
+import json
+import logging
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
-from app.jobs.rss_utils import build_source_id, entry_datetime, is_duplicate, parse_feed
+from sqlalchemy.exc import OperationalError
+
+from app.jobs.rss_utils import (
+    build_source_id,
+    conditional_headers,
+    content_hash,
+    entries_since,
+    entry_datetime,
+    entry_key,
+    is_duplicate,
+    iter_feed_entries,
+    parse_feed,
+)
+from app.jobs import tasks_ingest
+from app.core.config import Settings
+from app.jobs.tasks_ingest import _parse_feed_response, fetch_feed, ingest_feed, merge_ingest_counts
 
 
 def test_parse_sample_rss_xml_string() -> None:
@@ -54,3 +72,159 @@ def test_dedupe_prefers_url_or_source_pair() -> None:
     assert is_duplicate(url_match=True, source_match=False) is True
     assert is_duplicate(url_match=False, source_match=True) is True
     assert is_duplicate(url_match=False, source_match=False) is False
+
+
+def test_conditional_headers_and_content_hash() -> None:
+    assert conditional_headers(None, None) == {}
+    assert conditional_headers('"v1"', "Tue, 10 Sep 2024 14:30:00 GMT") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 10 Sep 2024 14:30:00 GMT",
+    }
+    assert content_hash(b"<rss/>") == content_hash(b"<rss/>")
+    assert content_hash(b"<rss/>") != content_hash(b"<rss />")
+
+
+def _rss(*items: tuple[str, str]) -> bytes:
+    body = "".join(
+        f"<item><title>{guid}</title><link>https://example.com/{guid}</link><guid>{guid}</guid>"
+        f"<pubDate>{published}</pubDate></item>"
+        for guid, published in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Test Feed</title>{body}</channel></rss>'.encode()
+
+
+def test_iter_feed_entries_streams_rss_and_atom() -> None:
+    rss_xml = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>Test Feed</title>
+      <item><title>Newest</title><link>https://example.com/3</link><guid>c</guid></item>
+      <item><title>Middle</title><link>https://example.com/2</link><guid>b</guid></item>
+      <item><title>Oldest</title><link>https://example.com/1</link><guid>a</guid></item>
+    </channel></rss>
+    """
+    atom_xml = b"""<?xml version="1.0"?>
+    <feed xmlns="http://www.w3.org/2005/Atom"><title>Test Feed</title>
+      <entry><title>Sinkhole</title><id>urn:2</id><link href="https://example.com/a2"/>
+        <updated>2024-09-10T14:30:00Z</updated></entry>
+      <entry><title>Flooding</title><id>urn:1</id><link href="https://example.com/a1"/></entry>
+    </feed>
+    """
+
+    assert [entry.title for entry in iter_feed_entries(rss_xml)] == ["Newest", "Middle", "Oldest"]
+    assert [entry.title for entry in iter_feed_entries(rss_xml)] == [entry.title for entry in parse_feed(rss_xml.decode()).entries]
+
+    atom_entries = list(iter_feed_entries(atom_xml))
+    assert [(entry.id, entry.link) for entry in atom_entries] == [
+        ("urn:2", "https://example.com/a2"),
+        ("urn:1", "https://example.com/a1"),
+    ]
+
+
+def test_entries_since_stops_at_high_water_mark_only_for_newest_first_feeds() -> None:
+    newest_first = _rss(
+        ("c", "Tue, 10 Sep 2024 14:30:00 GMT"),
+        ("b", "Tue, 10 Sep 2024 14:20:00 GMT"),
+        ("a", "Tue, 10 Sep 2024 14:10:00 GMT"),
+    )
+    oldest_first = _rss(
+        ("a", "Tue, 10 Sep 2024 14:10:00 GMT"),
+        ("b", "Tue, 10 Sep 2024 14:20:00 GMT"),
+        ("c", "Tue, 10 Sep 2024 14:30:00 GMT"),
+    )
+    undated = b"""<?xml version="1.0"?><rss version="2.0"><channel>
+      <item><link>https://example.com/c</link><guid>c</guid></item>
+      <item><link>https://example.com/b</link><guid>b</guid></item>
+    </channel></rss>"""
+
+    assert [entry_key(entry) for entry in entries_since(iter_feed_entries(newest_first), "b")] == ["c"]
+    # The mark is the first entry: nothing confirms the order, so the feed is read in full.
+    assert [entry_key(entry) for entry in entries_since(iter_feed_entries(newest_first), "c")] == ["c", "b", "a"]
+    # Items appended after the previous newest entry of an oldest-first feed are still read.
+    assert [entry_key(entry) for entry in entries_since(iter_feed_entries(oldest_first), "b")] == ["a", "b", "c"]
+    assert [entry_key(entry) for entry in entries_since(iter_feed_entries(undated), "b")] == ["c", "b"]
+    assert [entry_key(entry) for entry in entries_since(parse_feed(newest_first.decode()).entries, "a")] == ["c", "b"]
+
+
+def test_ingest_counts_merge_per_feed_results() -> None:
+    results = [
+        {"feeds_ok": 1, "items_seen": 5, "inserted": 3, "duplicates": 2},
+        {"feeds_ok": 1, "feeds_unchanged": 1, "items_seen": 0, "inserted": 0, "duplicates": 0},
+        {"feeds_failed": 1},
+        None,
+    ]
+
+    assert merge_ingest_counts(results) == {
+        "status": "ok",
+        "feeds_ok": 2,
+        "feeds_unchanged": 1,
+        "feeds_failed": 1,
+        "items_seen": 5,
+        "inserted": 3,
+        "duplicates": 2,
+    }
+    assert merge_ingest_counts([])["feeds_ok"] == 0
+
+
+class _OpenLimiter:
+    def acquire(self, host: str) -> float:
+        return 0.0
+
+
+def _database_down():
+    raise OperationalError("SELECT 1", {}, ConnectionRefusedError("connection refused"))
+
+
+def test_feed_stages_count_any_failure_instead_of_failing_the_chord(monkeypatch, caplog) -> None:
+    monkeypatch.setattr(tasks_ingest, "get_host_rate_limiter", lambda: _OpenLimiter())
+    monkeypatch.setattr(tasks_ingest, "SessionLocal", _database_down)
+    feed_url = "https://example.com/feed.xml"
+
+    with caplog.at_level(logging.ERROR, logger="app.jobs.tasks_ingest"):
+        fetched = fetch_feed.run(feed_url)
+    assert fetched == {"feed_url": feed_url, "error": "OperationalError"}
+    assert "Failed to fetch RSS feed" in caplog.text
+
+    monkeypatch.setattr(tasks_ingest, "get_host_rate_limiter", lambda: None)
+    assert fetch_feed.run(feed_url) == {"feed_url": feed_url, "error": "AttributeError"}
+
+    with caplog.at_level(logging.ERROR, logger="app.jobs.tasks_ingest"):
+        assert ingest_feed.run(fetched) == {"feeds_failed": 1}
+        assert ingest_feed.run({"feed_url": feed_url, "changed": False}) == {"feeds_failed": 1}
+    assert "Failed to ingest RSS feed" in caplog.text
+
+
+def test_fetch_stage_hands_on_only_new_entries_as_short_json() -> None:
+    body = _rss(
+        ("c", "Tue, 10 Sep 2024 14:30:00 GMT"),
+        ("b", "Tue, 10 Sep 2024 14:20:00 GMT"),
+        ("a", "Tue, 10 Sep 2024 14:10:00 GMT"),
+    )
+    state = SimpleNamespace(content_hash="old", high_water_mark="b", etag=None, last_modified=None)
+    fetched_at = datetime(2024, 9, 10, 14, 35, tzinfo=timezone.utc)
+
+    parsed = _parse_feed_response(
+        Settings(rss_parser_engine="stream"),
+        "https://example.com/feed.xml",
+        state,
+        fetched_at=fetched_at,
+        status_code=200,
+        content=body,
+        etag='"v2"',
+        last_modified=None,
+    )
+
+    assert json.loads(json.dumps(parsed)) == parsed
+    assert parsed["changed"] and parsed["high_water_mark"] == "c" and parsed["items_seen"] == 1
+    assert [entry[2] for entry in parsed["entries"]] == ["https://example.com/c"]
+    assert parsed["entries"][0][4] == "2024-09-10T14:30:00+00:00"
+
+    unchanged = _parse_feed_response(
+        Settings(),
+        "https://example.com/feed.xml",
+        SimpleNamespace(content_hash=parsed["content_hash"], high_water_mark="c"),
+        fetched_at=fetched_at,
+        status_code=200,
+        content=body,
+        etag=None,
+        last_modified=None,
+    )
+    assert not unchanged["changed"] and unchanged["entries"] == []
@@ -0,0 +1,55 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.tiles import router
+from app.db.session import get_async_db
+from app.repositories.tiles import (
+    THINNING_MAX_ZOOM,
+    thinning_cell_meters,
+    tile_in_range,
+    tile_query,
+    tile_size_meters,
+)
+from app.services.response_cache import get_async_response_cache
+
+
+def test_tile_range_follows_zoom() -> None:
+    assert tile_in_range(0, 0, 0)
+    assert tile_in_range(10, 1023, 1023)
+    assert not tile_in_range(10, 1024, 0)
+    assert not tile_in_range(-1, 0, 0)
+    assert not tile_in_range(23, 0, 0)
+
+
+def test_points_are_thinned_only_at_low_zoom() -> None:
+    assert thinning_cell_meters(THINNING_MAX_ZOOM + 1) is None
+    assert thinning_cell_meters(THINNING_MAX_ZOOM) < thinning_cell_meters(THINNING_MAX_ZOOM - 1)
+    assert thinning_cell_meters(0) == tile_size_meters(0) / 16
+
+
+class FakeAsyncSession:
+    def __init__(self) -> None:
+        self.statements = []
+
+    async def scalar(self, statement):
+        self.statements.append(statement)
+        return memoryview(b"mvt")
+
+
+def test_tile_route_renders_both_layers_in_one_async_query() -> None:
+    db = FakeAsyncSession()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_db] = lambda: db
+    app.dependency_overrides[get_async_response_cache] = lambda: None
+
+    response = TestClient(app).get("/tiles/12/1144/1494.mvt?min_confidence=40")
+
+    assert response.status_code == 200
+    assert response.content == b"mvt"
+    (statement,) = db.statements
+    sql = str(statement.compile(dialect=postgresql.psycopg.dialect()))
+    assert sql == str(tile_query(12, 1144, 1494, 40.0).compile(dialect=postgresql.psycopg.dialect()))
+    assert sql.count("ST_AsMVT(") == 2 and "||" in sql
+    assert TestClient(app).get("/tiles/1/2/0.mvt").status_code == 404